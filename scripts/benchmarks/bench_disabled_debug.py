@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Microbenchmark do custo por chamada de um `logger.debug` desabilitado (antes/depois).
+
+Antes: `SimpleLogger` sobre `structlog.stdlib.BoundLogger`, que monta o event dict,
+roda os processors e só então descobre, no logger stdlib, que DEBUG está filtrado.
+Depois: `SimpleLogger` com gate de nível sobre o filtering bound logger do structlog,
+que retorna antes de qualquer repasse.
+
+Uso (na raiz do repositório):
+    python -m scripts.benchmarks.bench_disabled_debug [--calls 1000000]
+"""
+
+import argparse
+import logging
+import timeit
+from uuid import uuid4
+
+import structlog
+from structlog.stdlib import LoggerFactory
+
+from src.utils.logger import SimpleLogger, _add_correlation_id
+
+
+def _processors() -> list:
+    return [
+        _add_correlation_id,
+        structlog.stdlib.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.JSONRenderer(),
+    ]
+
+
+def _legacy_logger() -> SimpleLogger:
+    """Configuração anterior: sem filtro de nível no structlog nem no wrapper."""
+    logger = structlog.wrap_logger(
+        LoggerFactory()("bench.legacy"),
+        processors=_processors(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        context_class=dict,
+    )
+    return SimpleLogger(logger)
+
+
+def _gated_logger() -> SimpleLogger:
+    """Configuração atual: filtering bound logger + gate de nível no wrapper."""
+    logger = structlog.wrap_logger(
+        LoggerFactory()("bench.gated"),
+        processors=_processors(),
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+        context_class=dict,
+    )
+    return SimpleLogger(logger, logging.INFO)
+
+
+def _ns_per_call(logger: SimpleLogger, calls: int) -> float:
+    product_id = str(uuid4())
+
+    def call() -> None:
+        logger.debug("Fetching product", product_id=product_id)
+
+    call()  # aquecimento
+    return timeit.timeit(call, number=calls) / calls * 1e9
+
+
+def main() -> None:
+    """Executa o microbenchmark e imprime o custo por chamada de cada variante."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    before = _ns_per_call(_legacy_logger(), args.calls)
+    after = _ns_per_call(_gated_logger(), args.calls)
+
+    print(f"debug desabilitado (antes):  {before:8.1f} ns/chamada")
+    print(f"debug desabilitado (depois): {after:8.1f} ns/chamada")
+    print(f"Ganho:                       {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
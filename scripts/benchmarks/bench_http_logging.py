@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark de throughput do middleware de logging HTTP (antes/depois).
+
+Compara a implementação antiga, baseada em `BaseHTTPMiddleware`, com o middleware
+ASGI puro (`src.core.middleware.HttpLoggingMiddleware`). As requisições são
+despachadas direto na aplicação ASGI (sem rede), então a diferença medida é o
+overhead do próprio middleware. A saída de log é desativada para as duas variantes.
+
+Uso (na raiz do repositório):
+    python -m scripts.benchmarks.bench_http_logging [--requests 20000]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Callable
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+from starlette.types import ASGIApp, Message
+
+from src.core.middleware import HttpLoggingMiddleware
+from src.core.middleware.http_logging import CORRELATION_ID_HEADER
+from src.utils.logger import get_logger, set_correlation_id
+
+logger = get_logger(__name__)
+
+
+class LegacyHttpLoggingMiddleware(BaseHTTPMiddleware):
+    """Implementação anterior (BaseHTTPMiddleware), mantida aqui só para comparação."""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """Processa a requisição como o middleware original."""
+        correlation_id = request.headers.get(CORRELATION_ID_HEADER) or str(uuid.uuid4())
+        set_correlation_id(correlation_id)
+        client_host = request.client.host if request.client else "unknown"
+        start_time = time.perf_counter()
+        response = await call_next(request)
+        response.headers[CORRELATION_ID_HEADER] = correlation_id
+        logger.info(
+            "http_request",
+            correlation_id=correlation_id,
+            method=request.method,
+            path=request.url.path,
+            status_code=response.status_code,
+            duration_ms=round((time.perf_counter() - start_time) * 1000, 2),
+            client_ip=client_host,
+        )
+        return response
+
+
+async def _ok(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("ok")
+
+
+def _build_app(middleware_class: type) -> ASGIApp:
+    return Starlette(routes=[Route("/", _ok)], middleware=[Middleware(middleware_class)])
+
+
+async def _run(app: ASGIApp, requests: int) -> float:
+    """Despacha `requests` requisições GET e retorna requisições por segundo."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/",
+        "raw_path": b"/",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        return None
+
+    for _ in range(min(500, requests)):  # aquecimento
+        await app(dict(scope), receive, send)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Executa o benchmark e imprime o throughput de cada variante."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    before = asyncio.run(_run(_build_app(LegacyHttpLoggingMiddleware), args.requests))
+    after = asyncio.run(_run(_build_app(HttpLoggingMiddleware), args.requests))
+
+    print(f"BaseHTTPMiddleware (antes): {before:10.0f} req/s")
+    print(f"ASGI puro (depois):         {after:10.0f} req/s")
+    print(f"Ganho:                      {after / before:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
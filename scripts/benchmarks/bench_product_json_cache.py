@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Benchmark do cache de JSON por produto na montagem das páginas da listagem.
+
+Compara, para páginas de `limit=100` e `limit=1000`, a serialização da lista inteira
+pelo pydantic com a concatenação dos fragmentos do `ProductJsonCache` (cache quente),
+e imprime a memória ocupada pelo cache com o catálogo todo em cache.
+
+Uso (na raiz do repositório):
+    python -m scripts.benchmarks.bench_product_json_cache [--products 10000] [--repeat 200]
+"""
+
+import argparse
+import asyncio
+import timeit
+
+from pydantic import TypeAdapter
+
+from src.models.product import ProductCreate, ProductResponse
+from src.repositories.in_memory import InMemoryProductRepository
+from src.repositories.wrappers import ProductJsonCache
+
+
+async def _catalog(products: int) -> list[ProductResponse]:
+    store = InMemoryProductRepository()
+    await store.create_many(
+        [
+            ProductCreate(name=f"Produto {index}", description=f"Descrição do produto {index}", price=9.9, stock=index)
+            for index in range(products)
+        ]
+    )
+    return await store.get_all(limit=products)
+
+
+def main() -> None:
+    """Executa o benchmark e imprime o tempo por página de cada variante."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    catalog = asyncio.run(_catalog(args.products))
+    adapter = TypeAdapter(list[ProductResponse])
+    cache = ProductJsonCache(max_bytes=1 << 40)
+    cache.dump_list(catalog)
+
+    print(f"Produtos: {args.products}  repetições: {args.repeat}")
+    for limit in (100, 1000):
+        page = catalog[:limit]
+        assert cache.dump_list(page) == adapter.dump_json(page)
+        before = timeit.timeit(lambda page=page: adapter.dump_json(page), number=args.repeat) / args.repeat
+        after = timeit.timeit(lambda page=page: cache.dump_list(page), number=args.repeat) / args.repeat
+        print(
+            f"limit={limit:<5} serialização: {before * 1e6:8.1f} µs  fragmentos em cache: {after * 1e6:8.1f} µs  "
+            f"ganho: {before / after:5.2f}x"
+        )
+    print(f"Memória do cache: {cache.nbytes / 1024 / 1024:.1f} MiB ({cache.nbytes / len(cache):.0f} bytes/produto)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark da latência da listagem de produtos (antes/depois do fast path de JSON).
+
+Antes: cópia da rota original, que retorna os modelos e deixa o FastAPI revalidar a
+lista pelo `response_model` antes de serializar.
+Depois: a rota de produtos da aplicação, que serializa a página direto em bytes.
+As duas fazem o mesmo trabalho de ETag/cursor; só a serialização muda.
+
+O ganho depende da versão do FastAPI: até a 0.128 (inclui a 0.124 do uv.lock), o
+`response_model` gera dicts e serializa com `json.dumps`; as versões mais novas já
+serializam com o pydantic, e aí a diferença praticamente some.
+
+As duas variantes rodam em apps sem middlewares, sobre o mesmo repositório, via ASGI
+(sem rede), com `limit=100` e `limit=1000`.
+
+Uso (na raiz do repositório):
+    python -m scripts.benchmarks.bench_product_list_response [--products 5000] [--requests 300]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+import httpx
+from fastapi import Depends, FastAPI, Response
+
+from src.controllers.product_controller import ProductController
+from src.factories import make_product_controller, make_product_store
+from src.models.product import ProductCreate, ProductResponse
+from src.routes.products import router as products_router
+from src.routes.products.get import NEXT_CURSOR_HEADER
+from src.utils.etag import ETAG_HEADER, catalog_etag
+
+
+def _legacy_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/products/", response_model=list[ProductResponse])
+    async def list_products(
+        response: Response, limit: int = 100, controller: ProductController = Depends(make_product_controller)
+    ) -> list[ProductResponse]:
+        response.headers[ETAG_HEADER] = catalog_etag(await controller.get_catalog_version())
+        page = await controller.get_page(limit=limit)
+        if page.next_cursor is not None:
+            response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+        return page.items
+
+    return app
+
+
+def _fast_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(products_router)
+    return app
+
+
+async def _latencies(app: FastAPI, limit: int, requests: int) -> list[float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(10):
+            (await client.get("/api/v1/products/", params={"limit": limit})).raise_for_status()
+        samples = []
+        for _ in range(requests):
+            started_at = time.perf_counter()
+            response = await client.get("/api/v1/products/", params={"limit": limit})
+            samples.append(time.perf_counter() - started_at)
+            assert len(response.json()) == limit
+    return samples
+
+
+async def _run(products: int, requests: int) -> None:
+    await make_product_store().create_many(
+        [
+            ProductCreate(name=f"Produto {index}", description=f"Descrição do produto {index}", price=9.9, stock=index)
+            for index in range(products)
+        ]
+    )
+    legacy, fast = _legacy_app(), _fast_app()
+    print(f"Produtos: {products}  requisições por variante: {requests}")
+    for limit in (100, 1000):
+        before = await _latencies(legacy, limit, requests)
+        after = await _latencies(fast, limit, requests)
+        before_ms, after_ms = statistics.median(before) * 1000, statistics.median(after) * 1000
+        print(
+            f"limit={limit:<5} antes (response_model): {before_ms:7.2f} ms  "
+            f"depois (bytes): {after_ms:7.2f} ms  ganho: {before_ms / after_ms:5.2f}x  (medianas)"
+        )
+
+
+def main() -> None:
+    """Executa o benchmark e imprime a latência mediana de cada variante."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=5_000)
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    asyncio.run(_run(args.products, args.requests))
+
+
+if __name__ == "__main__":
+    main()
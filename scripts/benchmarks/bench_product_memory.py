@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark da memória por produto no repositório em memória, por formato de registro.
+
+Para cada formato (`objects` e `columnar`), cadastra N produtos em lotes e mede, com
+`tracemalloc`, os bytes alocados pelo repositório (registros + índices), divididos por N.
+Também mede o tempo de `get_by_id` e de uma página de 1000 itens, que no formato
+colunar montam os objetos a cada leitura.
+
+Uso (na raiz do repositório):
+    python -m scripts.benchmarks.bench_product_memory [--products 1000000]
+"""
+
+import argparse
+import asyncio
+import gc
+import random
+import time
+import tracemalloc
+
+from src.models.product import ProductCreate
+from src.repositories.in_memory import InMemoryProductRepository
+
+
+async def _measure(products: int, *, columnar: bool) -> tuple[float, float, float]:
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    repo = InMemoryProductRepository(columnar=columnar)
+    for start in range(0, products, 10_000):
+        batch = [
+            ProductCreate(
+                name=f"Produto {index}",
+                description=f"Descrição da categoria {index % 50}",
+                price=round(1 + (index % 10_000) / 100, 2),
+                stock=index % 500,
+            )
+            for index in range(start, min(start + 10_000, products))
+        ]
+        await repo.create_many(batch)
+        del batch
+    gc.collect()
+    bytes_per_product = (tracemalloc.get_traced_memory()[0] - baseline) / products
+    tracemalloc.stop()
+
+    ids = [product.id for product in await repo.get_all(limit=10_000)]
+    sample = random.Random(7).choices(ids, k=50_000)
+    started_at = time.perf_counter()
+    for product_id in sample:
+        await repo.get_by_id(product_id)
+    get_by_id_us = (time.perf_counter() - started_at) / len(sample) * 1e6
+
+    started_at = time.perf_counter()
+    for _ in range(20):
+        await repo.get_page(limit=1000)
+    page_ms = (time.perf_counter() - started_at) / 20 * 1000
+    return bytes_per_product, get_by_id_us, page_ms
+
+
+def main() -> None:
+    """Executa o benchmark e imprime os bytes por produto de cada formato."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"Produtos: {args.products}")
+    print(f"{'formato':10} {'bytes/produto':>14} {'get_by_id (µs)':>15} {'página 1000 (ms)':>17}")
+    for layout in ("objects", "columnar"):
+        bytes_per_product, get_by_id_us, page_ms = asyncio.run(_measure(args.products, columnar=layout == "columnar"))
+        print(f"{layout:10} {bytes_per_product:14.0f} {get_by_id_us:15.2f} {page_ms:17.2f}")
+
+
+if __name__ == "__main__":
+    main()
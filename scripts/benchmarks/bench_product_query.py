@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark das listagens filtradas e ordenadas do repositório em memória (`find_page`/`count`).
+
+Cadastra N produtos e mede a mediana de `find_page` (página de 100) e de `count` para
+consultas típicas da vitrine, comparando com o mesmo filtro/ordenação feito com um laço
+Python sobre os objetos do catálogo (o que um cliente faria depois de baixar tudo).
+
+Ordenações e faixas de preço, estoque e criação usam os índices ordenados (O(log n + k));
+os demais filtros são avaliados sobre as colunas.
+
+Uso (na raiz do repositório):
+    python -m scripts.benchmarks.bench_product_query [--products 1000000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from src.models.product import ProductCreate, ProductQuery, ProductResponse
+from src.repositories.in_memory import InMemoryProductRepository
+
+
+def _queries(catalog: list[ProductResponse]) -> dict[str, ProductQuery]:
+    recent = catalog[-max(1, len(catalog) // 100)].created_at
+    return {
+        "price 10..50": ProductQuery(price_min=10, price_max=50),
+        "in_stock + prefixo": ProductQuery(in_stock=True, name_prefix="produto 99"),
+        "price >= 99.9 (seletivo)": ProductQuery(price_min=99.9),
+        "sort=-price": ProductQuery(sort="-price"),
+        "price 10..50, sort=stock": ProductQuery(price_min=10, price_max=50, sort="stock"),
+        "price 10..11, sort=price": ProductQuery(price_min=10, price_max=11, sort="price"),
+        "criados no último 1%": ProductQuery(created_since=recent),
+        "último 1%, sort=-price": ProductQuery(created_since=recent, sort="-price"),
+    }
+
+
+def _loop(catalog: list[ProductResponse], query: ProductQuery) -> list[ProductResponse]:
+    prefix = (query.name_prefix or "").casefold()
+    matches = [
+        product
+        for product in catalog
+        if (query.price_min is None or product.price >= query.price_min)
+        and (query.price_max is None or product.price <= query.price_max)
+        and (query.in_stock is None or (product.stock > 0) == query.in_stock)
+        and (query.created_since is None or product.created_at >= query.created_since)
+        and product.name.casefold().startswith(prefix)
+    ]
+    if query.sort is None:
+        return matches
+    field = query.sort.removeprefix("-")
+    # Decrescente é o crescente ao contrário, inclusive no desempate pela ordem do catálogo.
+    order = sorted(
+        range(len(matches)), key=lambda index: (getattr(matches[index], field), index), reverse=query.sort[0] == "-"
+    )
+    return [matches[index] for index in order]
+
+
+def _median_ms(samples: list[float]) -> float:
+    return statistics.median(samples) * 1000
+
+
+async def _run(products: int, repeat: int) -> None:
+    repo = InMemoryProductRepository()
+    for start in range(0, products, 10_000):
+        await repo.create_many(
+            [
+                ProductCreate(
+                    name=f"Produto {index}", price=round(1 + (index * 7919 % 10_000) / 100, 2), stock=index % 5
+                )
+                for index in range(start, min(start + 10_000, products))
+            ]
+        )
+    catalog = await repo.get_all(limit=products)
+
+    print(f"Produtos: {products}  página: 100  (medianas de {repeat} execuções)")
+    print(f"{'consulta':<28} {'find_page (ms)':>15} {'count (ms)':>11} {'laço Python (ms)':>17}")
+    for label, query in _queries(catalog).items():
+        pages, counts, loop = [], [], []
+        for _ in range(repeat):
+            started_at = time.perf_counter()
+            page = await repo.find_page(query, limit=100)
+            pages.append(time.perf_counter() - started_at)
+            started_at = time.perf_counter()
+            count = await repo.count(query)
+            counts.append(time.perf_counter() - started_at)
+            started_at = time.perf_counter()
+            expected = _loop(catalog, query)
+            loop.append(time.perf_counter() - started_at)
+            assert page.items == expected[:100]
+            assert count == len(expected)
+        print(f"{label:<28} {_median_ms(pages):15.2f} {_median_ms(counts):11.2f} {_median_ms(loop):17.2f}")
+
+
+def main() -> None:
+    """Executa o benchmark e imprime a latência mediana de cada consulta."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(_run(args.products, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark do warm start do catálogo em memória (antes/depois).
+
+Antes: o catálogo é reconstruído a partir de JSON, com validação do pydantic por
+produto (o equivalente a reenviar o catálogo pela API após o deploy).
+Depois: o snapshot binário é lido via mmap e restaurado com `model_construct`.
+
+Uso (na raiz do repositório):
+    python -m scripts.benchmarks.bench_snapshot_load [--products 200000]
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from src.models.product import ProductCreate, ProductResponse
+from src.repositories.in_memory import InMemoryProductRepository, read_snapshot, write_snapshot
+
+
+async def _build_catalog(products: int) -> InMemoryProductRepository:
+    repo = InMemoryProductRepository()
+    await repo.create_many(
+        [
+            ProductCreate(name=f"Produto {index}", description=f"Descrição do produto {index}", price=9.9, stock=index)
+            for index in range(products)
+        ]
+    )
+    return repo
+
+
+def main() -> None:
+    """Executa o benchmark e imprime o tempo de carga de cada variante."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=200_000)
+    args = parser.parse_args()
+
+    repo = asyncio.run(_build_catalog(args.products))
+    products = asyncio.run(repo.get_all(limit=args.products))
+    json_lines = [product.model_dump_json() for product in products]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "products.snap"
+        started_at = time.perf_counter()
+        size = write_snapshot(path, repo.capture_snapshot())
+        write_seconds = time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        validated = [ProductResponse.model_validate(json.loads(line)) for line in json_lines]
+        before = time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        snapshot = read_snapshot(path)
+        assert snapshot is not None
+        InMemoryProductRepository().restore_snapshot(snapshot)
+        after = time.perf_counter() - started_at
+
+    assert len(validated) == len(snapshot.entries)
+    print(f"Produtos: {args.products}  snapshot: {size / 1e6:.1f} MB (gravado em {write_seconds:.2f}s)")
+    print(f"carga (antes, JSON + validação): {before:8.3f} s")
+    print(f"carga (depois, snapshot mmap):   {after:8.3f} s")
+    print(f"Ganho:                           {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark do repositório SQLite comparado ao repositório em memória.
+
+Para cada engine: carga do catálogo em lotes (`create_many`), leituras concorrentes por
+ID (`get_by_id`), varredura completa por cursor (`get_page`) e criações concorrentes
+(`create`, uma transação por produto no SQLite).
+
+Uso (na raiz do repositório):
+    python -m scripts.benchmarks.bench_sqlite_repository [--products 50000] [--reads 20000] [--concurrency 32]
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from uuid import UUID
+
+from src.models.product import ProductCreate
+from src.repositories.in_memory import InMemoryProductRepository
+from src.repositories.interfaces.product_repository import IProductRepository
+from src.repositories.sqlite import SqliteConnectionPool, SqliteProductRepository
+
+
+async def _concurrently(count: int, concurrency: int, call: Callable[[int], Awaitable[object]]) -> float:
+    queue = iter(range(count))
+
+    async def worker() -> None:
+        for index in queue:
+            await call(index)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started_at
+
+
+async def _measure(repo: IProductRepository, products: int, reads: int, concurrency: int) -> dict[str, float]:
+    timings: dict[str, float] = {}
+    started_at = time.perf_counter()
+    ids: list[UUID] = []
+    for start in range(0, products, 1000):
+        batch = [
+            ProductCreate(name=f"Produto {index}", description=f"Descrição {index}", price=9.9, stock=index)
+            for index in range(start, min(start + 1000, products))
+        ]
+        ids.extend(result.id for result in await repo.create_many(batch) if not isinstance(result, Exception))
+    timings["carga (create_many)"] = products / (time.perf_counter() - started_at)
+
+    sample = random.Random(42).choices(ids, k=reads)
+    timings["get_by_id concorrente"] = reads / await _concurrently(
+        reads, concurrency, lambda index: repo.get_by_id(sample[index])
+    )
+
+    started_at = time.perf_counter()
+    seen = 0
+    async for _ in repo.iter_all(batch_size=500):
+        seen += 1
+    timings["varredura (get_page)"] = seen / (time.perf_counter() - started_at)
+
+    writes = max(reads // 10, 1)
+    timings["create concorrente"] = writes / await _concurrently(
+        writes, concurrency, lambda index: repo.create(ProductCreate(name=f"Novo {index}", price=1.0))
+    )
+    return timings
+
+
+def main() -> None:
+    """Executa o benchmark e imprime as operações por segundo de cada engine."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=50_000)
+    parser.add_argument("--reads", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    memory = asyncio.run(_measure(InMemoryProductRepository(), args.products, args.reads, args.concurrency))
+    with tempfile.TemporaryDirectory() as directory:
+        sqlite_repo = SqliteProductRepository(SqliteConnectionPool(Path(directory) / "products.db"))
+        try:
+            sqlite = asyncio.run(_measure(sqlite_repo, args.products, args.reads, args.concurrency))
+        finally:
+            sqlite_repo.close()
+
+    print(f"Produtos: {args.products}  leituras: {args.reads}  concorrência: {args.concurrency}")
+    print(f"{'operação':24} {'memória (op/s)':>16} {'sqlite (op/s)':>16}")
+    for operation, memory_rate in memory.items():
+        print(f"{operation:24} {memory_rate:16.0f} {sqlite[operation]:16.0f}")
+
+
+if __name__ == "__main__":
+    main()
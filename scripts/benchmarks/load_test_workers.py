@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Teste de carga do modo multi-processo: vazão (rps) por quantidade de workers.
+
+Para cada quantidade de workers, sobe `python -m src.server` sobre um mesmo arquivo
+SQLite, cadastra produtos e dispara GETs por ID a partir de vários processos clientes
+(conexões HTTP keep-alive, só biblioteca padrão), durante um tempo fixo. Ao final,
+confere que todos os workers enxergam o mesmo catálogo e imprime o rps e a eficiência
+do escalonamento em relação a 1 worker.
+
+Os clientes competem pelos mesmos cores que o servidor: para medir o escalonamento,
+rode em uma máquina com pelo menos o dobro de cores do maior número de workers.
+
+Uso (na raiz do repositório):
+    python -m scripts.benchmarks.load_test_workers [--workers 1 2 4] [--clients 8] [--seconds 10]
+"""
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from multiprocessing.sharedctypes import Synchronized
+from pathlib import Path
+
+_PRODUCTS_PATH = "/api/v1/products/"
+
+
+def _request(connection: http.client.HTTPConnection, method: str, path: str, body: dict | None = None) -> bytes:
+    payload = None if body is None else json.dumps(body)
+    headers = {} if body is None else {"Content-Type": "application/json"}
+    connection.request(method, path, body=payload, headers=headers)
+    response = connection.getresponse()
+    data = response.read()
+    if response.status >= 400:
+        raise RuntimeError(f"{method} {path} returned {response.status}: {data[:200]!r}")
+    return data
+
+
+def _wait_until_ready(port: int, timeout_seconds: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout_seconds
+    while time.monotonic() < deadline:
+        try:
+            _request(http.client.HTTPConnection("127.0.0.1", port, timeout=1), "GET", "/api/v1/health")
+            return
+        except (OSError, RuntimeError):
+            time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not become ready")
+
+
+def _client(port: int, ids: list[str], seconds: float, counter: Synchronized) -> None:
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    deadline = time.monotonic() + seconds
+    done = 0
+    while time.monotonic() < deadline:
+        _request(connection, "GET", f"{_PRODUCTS_PATH}{ids[done % len(ids)]}")
+        done += 1
+    with counter.get_lock():
+        counter.value += done
+
+
+def _run(workers: int, clients: int, seconds: float, port: int, database: Path) -> float:
+    env = {
+        **os.environ,
+        "HOST": "127.0.0.1",
+        "PORT": str(port),
+        "WORKERS": str(workers),
+        "PRODUCT_REPOSITORY_BACKEND": "sqlite",
+        "PRODUCT_SQLITE_PATH": str(database),
+        "PRODUCT_CACHE_ENABLED": "false",
+        "HTTP_LOG_SAMPLE_RATE": "0",
+        "HTTP_LOG_SLOW_REQUEST_MS": "60000",
+    }
+    server = subprocess.Popen(  # noqa: S603 - comando fixo, sem entrada do usuário
+        [sys.executable, "-m", "src.server"], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        _wait_until_ready(port)
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        listed = json.loads(_request(connection, "GET", f"{_PRODUCTS_PATH}?limit=1000"))
+        ids = [product["id"] for product in listed]
+        # Cada nova conexão cai em um worker qualquer: todos precisam ver o mesmo catálogo.
+        for _ in range(workers * 4):
+            other = json.loads(_request(http.client.HTTPConnection("127.0.0.1", port), "GET", _PRODUCTS_PATH))
+            assert [product["id"] for product in other] == ids[: len(other)], "workers disagree on the catalog"
+
+        counter = multiprocessing.Value("q", 0)
+        processes = [
+            multiprocessing.Process(target=_client, args=(port, ids, seconds, counter)) for _ in range(clients)
+        ]
+        started_at = time.perf_counter()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        return counter.value / (time.perf_counter() - started_at)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def _seed(port: int, database: Path, products: int) -> None:
+    env = {
+        **os.environ,
+        "HOST": "127.0.0.1",
+        "PORT": str(port),
+        "PRODUCT_REPOSITORY_BACKEND": "sqlite",
+        "PRODUCT_SQLITE_PATH": str(database),
+        "HTTP_LOG_SAMPLE_RATE": "0",
+    }
+    server = subprocess.Popen(  # noqa: S603 - comando fixo, sem entrada do usuário
+        [sys.executable, "-m", "src.server"], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        _wait_until_ready(port)
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        for start in range(0, products, 100):
+            batch = [{"name": f"Produto {index}", "price": 9.9, "stock": index} for index in range(start, start + 100)]
+            _request(connection, "POST", f"{_PRODUCTS_PATH}batch", batch)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main() -> None:
+    """Executa o teste de carga e imprime o rps por quantidade de workers."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory) / "products.db"
+        _seed(args.port, database, args.products)
+        results = {workers: _run(workers, args.clients, args.seconds, args.port, database) for workers in args.workers}
+
+    baseline = results[args.workers[0]] / args.workers[0]
+    print(f"Cores: {os.cpu_count()}  clientes: {args.clients}  duração: {args.seconds}s  (GET por ID, SQLite)")
+    print(f"{'workers':>8} {'rps':>10} {'eficiência':>11}")
+    for workers, rps in results.items():
+        print(f"{workers:8d} {rps:10.0f} {rps / (baseline * workers):10.0%}")
+
+
+if __name__ == "__main__":
+    main()
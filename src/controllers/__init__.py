@@ -1,4 +1,5 @@
 from src.controllers.health_controller import HealthController
+from src.controllers.metrics_controller import MetricsController
 from src.controllers.product_controller import ProductController
 
-__all__ = ["HealthController", "ProductController"]
+__all__ = ["HealthController", "MetricsController", "ProductController"]
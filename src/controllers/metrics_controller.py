@@ -0,0 +1,25 @@
+from src.core.metrics import REGISTRY
+from src.core.metrics.registry import MetricsRegistry
+
+
+class MetricsController:
+    """Controller para exposição das métricas da aplicação.
+
+    Coordena a renderização do registro de métricas no formato texto do Prometheus.
+    """
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY) -> None:
+        """Inicializa o controller.
+
+        Args:
+            registry: Registro de métricas a expor (padrão: registro do processo).
+        """
+        self.registry = registry
+
+    async def render(self) -> str:
+        """Renderiza as métricas.
+
+        Returns:
+            str: Métricas no formato texto do Prometheus.
+        """
+        return self.registry.render()
@@ -1,17 +1,30 @@
+from collections.abc import AsyncIterator
 from uuid import UUID
 
-from src.models.product import ProductCreate, ProductResponse, ProductUpdate
+from src.models.product import (
+    BulkItemResult,
+    ProductBulkUpdate,
+    ProductCount,
+    ProductCreate,
+    ProductPage,
+    ProductQuery,
+    ProductResponse,
+    ProductUpdate,
+)
+from src.repositories.wrappers import ProductJsonCache
 from src.services.product_service import ProductService
 
 
 class ProductController:
-    def __init__(self, product_service: ProductService) -> None:
+    def __init__(self, product_service: ProductService, json_cache: ProductJsonCache | None = None) -> None:
         """Inicializa o controller de produtos.
 
         Args:
             product_service: Serviço de produtos a ser utilizado.
+            json_cache: Cache do JSON de cada produto (None serializa sempre).
         """
         self.product_service = product_service
+        self.json_cache = json_cache if json_cache is not None else ProductJsonCache(max_bytes=0)
 
     async def create(self, product_data: ProductCreate) -> ProductResponse:
         """Cria um novo produto.
@@ -35,6 +48,14 @@ class ProductController:
         """
         return await self.product_service.get_product_by_id(product_id)
 
+    async def get_catalog_version(self) -> str:
+        """Retorna a versão atual do catálogo.
+
+        Returns:
+            str: Token opaco que muda a cada alteração do catálogo.
+        """
+        return await self.product_service.get_catalog_version()
+
     async def get_by_name(self, name: str) -> ProductResponse:
         """Busca um produto por nome.
 
@@ -58,17 +79,89 @@ class ProductController:
         """
         return await self.product_service.get_all_products(skip=skip, limit=limit)
 
-    async def update(self, product_id: UUID, product_data: ProductUpdate) -> ProductResponse:
+    async def get_page(
+        self, after: str | None = None, limit: int = 100, skip: int = 0, query: ProductQuery | None = None
+    ) -> ProductPage:
+        """Busca uma página de produtos (por cursor ou, com `skip`, por deslocamento).
+
+        Args:
+            after: Cursor opaco retornado pela página anterior (None para a primeira).
+            limit: Número máximo de produtos a retornar.
+            skip: Número de produtos a pular (paginação por deslocamento).
+            query: Filtros e ordenação (None para a listagem padrão).
+
+        Returns:
+            ProductPage: Produtos da página e o cursor da próxima.
+        """
+        return await self.product_service.get_products_page(after=after, limit=limit, skip=skip, query=query)
+
+    async def count(self, query: ProductQuery) -> ProductCount:
+        """Conta os produtos que passam nos filtros.
+
+        Args:
+            query: Filtros da contagem.
+
+        Returns:
+            ProductCount: Quantidade de produtos.
+        """
+        return ProductCount(count=await self.product_service.count_products(query))
+
+    def to_json(self, product: ProductResponse) -> bytes:
+        """Serializa um produto para o corpo da resposta.
+
+        Args:
+            product: Produto retornado pelo serviço.
+
+        Returns:
+            bytes: Objeto JSON do produto.
+        """
+        return self.json_cache.dump(product)
+
+    def to_json_list(self, products: list[ProductResponse]) -> bytes:
+        """Serializa uma lista de produtos para o corpo da resposta.
+
+        Args:
+            products: Produtos retornados pelo serviço.
+
+        Returns:
+            bytes: Array JSON dos produtos.
+        """
+        return self.json_cache.dump_list(products)
+
+    def export(self) -> AsyncIterator[bytes]:
+        """Exporta todos os produtos como NDJSON.
+
+        Returns:
+            AsyncIterator[bytes]: Blocos de linhas NDJSON.
+        """
+        return self.product_service.export_products()
+
+    def import_ndjson(self, chunks: AsyncIterator[bytes], chunk_size: int = 1000) -> AsyncIterator[bytes]:
+        """Importa produtos de um fluxo NDJSON.
+
+        Args:
+            chunks: Fluxo de bytes do corpo da requisição.
+            chunk_size: Quantidade de linhas válidas por lote gravado.
+
+        Returns:
+            AsyncIterator[bytes]: Eventos de progresso e erros em NDJSON.
+        """
+        return self.product_service.import_products(chunks, chunk_size=chunk_size)
+
+    async def update(
+        self, product_id: UUID, product_data: ProductUpdate, if_match: str | None = None
+    ) -> ProductResponse:
         """Atualiza um produto existente.
 
         Args:
             product_id: ID do produto a ser atualizado.
             product_data: Dados atualizados do produto.
+            if_match: Valor do header If-Match, para atualização condicional.
 
         Returns:
             ProductResponse: Produto atualizado.
         """
-        return await self.product_service.update_product(product_id, product_data)
+        return await self.product_service.update_product(product_id, product_data, if_match)
 
     async def delete(self, product_id: UUID) -> None:
         """Deleta um produto.
@@ -77,3 +170,36 @@ class ProductController:
             product_id: ID do produto a ser deletado.
         """
         await self.product_service.delete_product(product_id)
+
+    async def create_many(self, products_data: list[ProductCreate]) -> list[BulkItemResult]:
+        """Cria vários produtos em lote.
+
+        Args:
+            products_data: Dados dos produtos a serem criados.
+
+        Returns:
+            list[BulkItemResult]: Resultado de cada item.
+        """
+        return await self.product_service.create_products(products_data)
+
+    async def update_many(self, products_data: list[ProductBulkUpdate]) -> list[BulkItemResult]:
+        """Atualiza vários produtos em lote.
+
+        Args:
+            products_data: Atualizações, cada uma com o ID do produto alvo.
+
+        Returns:
+            list[BulkItemResult]: Resultado de cada item.
+        """
+        return await self.product_service.update_products(products_data)
+
+    async def delete_many(self, product_ids: list[UUID]) -> list[BulkItemResult]:
+        """Deleta vários produtos em lote.
+
+        Args:
+            product_ids: IDs dos produtos a serem deletados.
+
+        Returns:
+            list[BulkItemResult]: Resultado de cada item.
+        """
+        return await self.product_service.delete_products(product_ids)
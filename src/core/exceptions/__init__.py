@@ -8,6 +8,7 @@ from src.core.exceptions.application_errors import (
     HTTP_404_NOT_FOUND,
     HTTP_405_METHOD_NOT_ALLOWED,
     HTTP_409_CONFLICT,
+    HTTP_412_PRECONDITION_FAILED,
     HTTP_422_UNPROCESSABLE_ENTITY,
     HTTP_429_TOO_MANY_REQUESTS,
     HTTP_500_INTERNAL_SERVER_ERROR,
@@ -19,10 +20,24 @@ from src.core.exceptions.error_decorators import (
     handle_service_errors_async,
     handle_service_errors_sync,
 )
+from src.core.exceptions.repository_errors import (
+    DuplicateValueError,
+    EntityNotFoundError,
+    InvalidCursorError,
+    InvalidEntityError,
+    RepositoryError,
+    VersionConflictError,
+)
 
 __all__ = [
     # Exceções
     "ApplicationServiceError",
+    "DuplicateValueError",
+    "EntityNotFoundError",
+    "InvalidCursorError",
+    "InvalidEntityError",
+    "RepositoryError",
+    "VersionConflictError",
     # Decorators
     "handle_service_errors_async",
     "handle_service_errors_sync",
@@ -36,6 +51,7 @@ __all__ = [
     "HTTP_404_NOT_FOUND",
     "HTTP_405_METHOD_NOT_ALLOWED",
     "HTTP_409_CONFLICT",
+    "HTTP_412_PRECONDITION_FAILED",
     "HTTP_422_UNPROCESSABLE_ENTITY",
     "HTTP_429_TOO_MANY_REQUESTS",
     "HTTP_500_INTERNAL_SERVER_ERROR",
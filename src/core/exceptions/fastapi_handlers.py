@@ -7,6 +7,7 @@ from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from src.core.exceptions.application_errors import ApplicationServiceError
+from src.core.metrics import APPLICATION_ERRORS_TOTAL
 
 
 async def application_error_handler(request: Request, exc: Exception) -> JSONResponse:
@@ -20,6 +21,7 @@ async def application_error_handler(request: Request, exc: Exception) -> JSONRes
         JSONResponse com o erro formatado incluindo timestamp e path.
     """
     app_error = cast(ApplicationServiceError, exc)
+    APPLICATION_ERRORS_TOTAL.labels(app_error.error_code).inc()
     error_dict = app_error.to_dict()
     error_dict.update(
         {
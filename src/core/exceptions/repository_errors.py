@@ -0,0 +1,68 @@
+class RepositoryError(Exception):
+    """Exceção base para erros levantados pela camada de repositório.
+
+    Repositórios não conhecem detalhes de HTTP; os serviços capturam estas exceções
+    e as convertem em ApplicationServiceError com o status adequado.
+    """
+
+
+class DuplicateValueError(RepositoryError):
+    """Violação de unicidade (ex.: nome de produto já cadastrado)."""
+
+    def __init__(self, field: str, value: object) -> None:
+        """Inicializa a exceção.
+
+        Args:
+            field: Nome do campo único violado.
+            value: Valor que já existe no repositório.
+        """
+        self.field = field
+        self.value = value
+        super().__init__(f"Duplicate value for '{field}': {value!r}")
+
+
+class InvalidCursorError(RepositoryError):
+    """Cursor de paginação malformado ou de outra versão."""
+
+    def __init__(self, cursor: str) -> None:
+        """Inicializa a exceção.
+
+        Args:
+            cursor: Cursor recebido.
+        """
+        self.cursor = cursor
+        super().__init__(f"Invalid pagination cursor: {cursor!r}")
+
+
+class EntityNotFoundError(RepositoryError):
+    """Entidade não encontrada (usado nos resultados de operações em lote)."""
+
+    def __init__(self, entity_id: object) -> None:
+        """Inicializa a exceção.
+
+        Args:
+            entity_id: ID procurado.
+        """
+        self.entity_id = entity_id
+        super().__init__(f"Entity {entity_id} not found")
+
+
+class VersionConflictError(RepositoryError):
+    """A versão atual do registro difere da versão esperada (compare-and-swap falhou)."""
+
+    def __init__(self, entity_id: object, expected_version: int, current_version: int) -> None:
+        """Inicializa a exceção.
+
+        Args:
+            entity_id: ID do registro.
+            expected_version: Versão informada pelo chamador.
+            current_version: Versão atual no repositório.
+        """
+        self.entity_id = entity_id
+        self.expected_version = expected_version
+        self.current_version = current_version
+        super().__init__(f"Entity {entity_id} is at version {current_version}, expected version {expected_version}")
+
+
+class InvalidEntityError(RepositoryError):
+    """Dados resultantes de uma operação não passaram na validação do modelo."""
@@ -0,0 +1,32 @@
+"""Métricas em processo (formato texto do Prometheus)."""
+
+from src.core.metrics.app_metrics import (
+    APPLICATION_ERRORS_TOTAL,
+    HTTP_REQUEST_DURATION_SECONDS,
+    HTTP_REQUESTS_TOTAL,
+    PRODUCT_CACHE_EVICTIONS_TOTAL,
+    PRODUCT_CACHE_REQUESTS_TOTAL,
+    PRODUCT_JSON_CACHE_BYTES,
+    REGISTRY,
+    REPOSITORY_COALESCED_CALLS_TOTAL,
+    REPOSITORY_OPERATION_DURATION_SECONDS,
+    REPOSITORY_OPERATION_ERRORS_TOTAL,
+)
+from src.core.metrics.registry import Counter, Gauge, Histogram, MetricsRegistry
+
+__all__ = [
+    "APPLICATION_ERRORS_TOTAL",
+    "HTTP_REQUESTS_TOTAL",
+    "HTTP_REQUEST_DURATION_SECONDS",
+    "PRODUCT_CACHE_EVICTIONS_TOTAL",
+    "PRODUCT_CACHE_REQUESTS_TOTAL",
+    "PRODUCT_JSON_CACHE_BYTES",
+    "REGISTRY",
+    "REPOSITORY_COALESCED_CALLS_TOTAL",
+    "REPOSITORY_OPERATION_DURATION_SECONDS",
+    "REPOSITORY_OPERATION_ERRORS_TOTAL",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+]
@@ -0,0 +1,58 @@
+"""Métricas da aplicação, registradas no registro padrão do processo."""
+
+from src.core.metrics.registry import MetricsRegistry
+
+# Registro padrão do processo (exposto em /api/v1/metrics)
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS_TOTAL = REGISTRY.counter(
+    "http_requests_total",
+    "Total de requisições HTTP por método, rota (template do path) e status.",
+    ("method", "route", "status"),
+)
+
+HTTP_REQUEST_DURATION_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Latência das requisições HTTP, em segundos, por método e rota.",
+    ("method", "route"),
+)
+
+REPOSITORY_OPERATION_DURATION_SECONDS = REGISTRY.histogram(
+    "repository_operation_duration_seconds",
+    "Latência das operações de repositório, em segundos, por repositório e operação.",
+    ("repository", "operation"),
+)
+
+REPOSITORY_OPERATION_ERRORS_TOTAL = REGISTRY.counter(
+    "repository_operation_errors_total",
+    "Operações de repositório que lançaram exceção, por repositório e operação.",
+    ("repository", "operation"),
+)
+
+APPLICATION_ERRORS_TOTAL = REGISTRY.counter(
+    "application_errors_total",
+    "Respostas de erro geradas por ApplicationServiceError, por error_code.",
+    ("error_code",),
+)
+
+PRODUCT_CACHE_REQUESTS_TOTAL = REGISTRY.counter(
+    "product_cache_requests_total",
+    "Leituras do cache de produtos, por resultado (hit ou miss).",
+    ("result",),
+)
+
+PRODUCT_CACHE_EVICTIONS_TOTAL = REGISTRY.counter(
+    "product_cache_evictions_total",
+    "Entradas removidas do cache de produtos por LRU.",
+)
+
+REPOSITORY_COALESCED_CALLS_TOTAL = REGISTRY.counter(
+    "repository_coalesced_calls_total",
+    "Leituras atendidas por uma busca idêntica já em andamento (single-flight), por operação.",
+    ("operation",),
+)
+
+PRODUCT_JSON_CACHE_BYTES = REGISTRY.gauge(
+    "product_json_cache_bytes",
+    "Memória ocupada pelo JSON serializado dos produtos em cache, em bytes.",
+)
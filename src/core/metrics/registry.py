@@ -0,0 +1,308 @@
+"""Registro de métricas em processo, exposto no formato texto do Prometheus.
+
+O caminho quente (`inc` / `observe`) não usa locks nem aloca estruturas: cada
+combinação de labels tem um filho pré-criado com contadores em listas de tamanho fixo,
+e a atualização é um incremento de inteiro sob o GIL. O lock do registro só é usado
+na criação de um filho novo (primeira ocorrência de uma combinação de labels).
+"""
+
+import math
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+
+# Buckets padrão de latência, em segundos (mesmos limites do client oficial do Prometheus).
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+
+class CounterChild:
+    """Contador de uma combinação de labels."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Incrementa o contador.
+
+        Args:
+            amount: Valor a somar (não negativo).
+        """
+        self.value += amount
+
+
+class GaugeChild:
+    """Valor instantâneo (que sobe e desce) de uma combinação de labels."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Define o valor atual.
+
+        Args:
+            value: Novo valor (ex.: bytes em uso).
+        """
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Soma ao valor atual (negativo para diminuir).
+
+        Args:
+            amount: Valor a somar.
+        """
+        self.value += amount
+
+
+class HistogramChild:
+    """Histograma de buckets fixos de uma combinação de labels."""
+
+    __slots__ = ("_bounds", "bucket_counts", "count", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds = bounds
+        # Um slot por limite superior + o slot +Inf; contagens não cumulativas.
+        self.bucket_counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Registra uma observação.
+
+        Args:
+            value: Valor observado (ex.: duração em segundos).
+        """
+        self.bucket_counts[bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class _Metric[ChildT: (CounterChild, GaugeChild, HistogramChild)]:
+    """Base das famílias de métricas: nome, ajuda, labels e filhos por valores de label."""
+
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], lock: threading.Lock) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = lock
+        self._children: dict[tuple[str, ...], ChildT] = {}
+
+    def labels(self, *labelvalues: str) -> ChildT:
+        """Retorna o filho da combinação de labels (criado na primeira vez).
+
+        Guarde o retorno quando as labels forem fixas: as chamadas seguintes a
+        `inc`/`observe` não fazem nem a busca no dicionário.
+
+        Args:
+            *labelvalues: Valores das labels, na ordem de `labelnames`.
+
+        Returns:
+            ChildT: Contador, gauge ou histograma da combinação.
+
+        Raises:
+            ValueError: Se a quantidade de valores não bater com `labelnames`.
+        """
+        child = self._children.get(labelvalues)
+        if child is None:
+            if len(labelvalues) != len(self.labelnames):
+                raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {labelvalues}")
+            with self._lock:
+                child = self._children.get(labelvalues)
+                if child is None:
+                    child = self._children[labelvalues] = self._new_child()
+        return child
+
+    def _new_child(self) -> ChildT:
+        raise NotImplementedError
+
+    def _label_text(self, labelvalues: tuple[str, ...], extra: tuple[tuple[str, str], ...] = ()) -> str:
+        pairs = [*zip(self.labelnames, labelvalues, strict=True), *extra]
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs) + "}"
+
+    def render(self) -> list[str]:
+        """Monta as linhas da família no formato texto do Prometheus."""
+        raise NotImplementedError
+
+
+class Counter(_Metric[CounterChild]):
+    """Família de contadores monotônicos."""
+
+    metric_type = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def render(self) -> list[str]:
+        """Monta as linhas da família no formato texto do Prometheus."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for labelvalues, child in list(self._children.items()):
+            lines.append(f"{self.name}{self._label_text(labelvalues)} {_format_value(child.value)}")
+        return lines
+
+
+class Gauge(_Metric[GaugeChild]):
+    """Família de gauges (valores instantâneos, como uso de memória)."""
+
+    metric_type = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def render(self) -> list[str]:
+        """Monta as linhas da família no formato texto do Prometheus."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        for labelvalues, child in list(self._children.items()):
+            lines.append(f"{self.name}{self._label_text(labelvalues)} {_format_value(child.value)}")
+        return lines
+
+
+class Histogram(_Metric[HistogramChild]):
+    """Família de histogramas com buckets fixos."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        lock: threading.Lock,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames, lock)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def render(self) -> list[str]:
+        """Monta as linhas da família no formato texto do Prometheus."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labelvalues, child in list(self._children.items()):
+            # Retrato dos contadores antes de acumular, para que _bucket/_count fiquem coerentes.
+            counts = list(child.bucket_counts)
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += bucket_count
+                le = (("le", _format_value(bound)),)
+                lines.append(f"{self.name}_bucket{self._label_text(labelvalues, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{self._label_text(labelvalues)} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{self._label_text(labelvalues)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Coleção de famílias de métricas com renderização no formato texto do Prometheus."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: dict[str, Counter | Gauge | Histogram] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Registra (ou retorna, se já existir) uma família de contadores.
+
+        Args:
+            name: Nome da métrica (ex.: "http_requests_total").
+            documentation: Texto do `# HELP`.
+            labelnames: Nomes das labels.
+
+        Returns:
+            Counter: Família de contadores.
+        """
+        metric = self._register(name, lambda: Counter(name, documentation, labelnames, self._lock))
+        if not isinstance(metric, Counter):
+            raise ValueError(f"Metric {name} is already registered as {metric.metric_type}")
+        return metric
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Registra (ou retorna, se já existir) uma família de gauges.
+
+        Args:
+            name: Nome da métrica (ex.: "product_json_cache_bytes").
+            documentation: Texto do `# HELP`.
+            labelnames: Nomes das labels.
+
+        Returns:
+            Gauge: Família de gauges.
+        """
+        metric = self._register(name, lambda: Gauge(name, documentation, labelnames, self._lock))
+        if not isinstance(metric, Gauge):
+            raise ValueError(f"Metric {name} is already registered as {metric.metric_type}")
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Registra (ou retorna, se já existir) uma família de histogramas.
+
+        Args:
+            name: Nome da métrica (ex.: "http_request_duration_seconds").
+            documentation: Texto do `# HELP`.
+            labelnames: Nomes das labels.
+            buckets: Limites superiores dos buckets.
+
+        Returns:
+            Histogram: Família de histogramas.
+        """
+        metric = self._register(name, lambda: Histogram(name, documentation, labelnames, self._lock, buckets))
+        if not isinstance(metric, Histogram):
+            raise ValueError(f"Metric {name} is already registered as {metric.metric_type}")
+        return metric
+
+    def render(self) -> str:
+        """Renderiza todas as métricas no formato texto do Prometheus (versão 0.0.4).
+
+        Returns:
+            str: Corpo da resposta de `/metrics`.
+        """
+        lines: list[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, name: str, factory: Callable[[], Counter | Gauge | Histogram]) -> Counter | Gauge | Histogram:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+            return metric
+
+
+def _format_value(value: float) -> str:
+    """Formata um valor numérico como o Prometheus espera (+Inf, inteiros sem ponto)."""
+    if value == math.inf:
+        return "+Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _escape_label_value(value: str) -> str:
+    """Escapa barra invertida, aspas e quebras de linha em valores de label."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
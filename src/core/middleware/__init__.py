@@ -1,5 +1,7 @@
 """Middleware da aplicação."""
 
 from src.core.middleware.http_logging import HttpLoggingMiddleware
+from src.core.middleware.http_sampling import HttpLogSampler, HttpLogSamplingConfig
+from src.core.middleware.metrics import MetricsMiddleware
 
-__all__ = ["HttpLoggingMiddleware"]
+__all__ = ["HttpLogSampler", "HttpLogSamplingConfig", "HttpLoggingMiddleware", "MetricsMiddleware"]
@@ -2,88 +2,136 @@
 
 import time
 import uuid
-from collections.abc import Callable
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from src.core.middleware.http_sampling import HttpLogSampler
+from src.core.middleware.route_template import route_template
+from src.core.settings import get_settings
 from src.utils.logger import get_logger, set_correlation_id
 
 logger = get_logger(__name__)
 
 # Nome do header para correlation ID
 CORRELATION_ID_HEADER = "X-Correlation-ID"
+_CORRELATION_ID_HEADER_KEY = CORRELATION_ID_HEADER.lower().encode("latin-1")
 
 
-class HttpLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware que loga todas as requisições HTTP com detalhes contextuais.
+class HttpLoggingMiddleware:
+    """Middleware ASGI puro que loga todas as requisições HTTP com detalhes contextuais.
+
+    Diferente de `BaseHTTPMiddleware`, não cria tarefas nem reempacota o corpo da
+    resposta: apenas intercepta a mensagem `http.response.start` para capturar o status
+    e injetar o header de correlation ID. Respostas em streaming passam intactas.
 
     Captura:
     - Método HTTP e caminho
     - Status code da resposta
-    - Tempo de processamento
+    - Tempo de processamento (até o fim do envio da resposta)
     - IP do cliente
-    - User-Agent
-    - Tamanho da resposta
     - Correlation ID para rastreamento distribuído
+
+    Nem toda requisição gera uma linha `http_request`: o `HttpLogSampler` decide por
+    rota (erros e requisições lentas sempre passam) e emite periodicamente um resumo
+    `http_summary` com contagens e percentis de latência de todas as requisições.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp, sampler: HttpLogSampler | None = None) -> None:
+        """Inicializa o middleware.
+
+        Args:
+            app: Aplicação ASGI seguinte na cadeia.
+            sampler: Política de amostragem. Se None, é criada a partir das configurações.
+        """
+        self.app = app
+        self.sampler = sampler or HttpLogSampler.from_settings(get_settings())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Processa a requisição e a resposta, registrando o resultado final."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Gera ou obtém Correlation ID (para rastreamento distribuído)
-        correlation_id = request.headers.get(CORRELATION_ID_HEADER)
-        if not correlation_id:
-            correlation_id = str(uuid.uuid4())
+        correlation_id = _header_value(scope, _CORRELATION_ID_HEADER_KEY) or str(uuid.uuid4())
 
         # Armazena correlation ID no contexto para acesso em toda a request
         set_correlation_id(correlation_id)
 
         # Informações da requisição
-        method = request.method
-        path = request.url.path
-        client_host = request.client.host if request.client else "unknown"
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        client_host = client[0] if client else "unknown"
+
+        status_code = 500
+
+        async def send_with_correlation_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Adiciona correlation ID no header da resposta
+                MutableHeaders(scope=message).append(CORRELATION_ID_HEADER, correlation_id)
+            await send(message)
 
         # Tempo de início
         start_time = time.perf_counter()
 
         try:
-            # Processa a requisição
-            response = await call_next(request)
-
-            # Tempo total de processamento
-            process_time = time.perf_counter() - start_time
-
-            # Adiciona correlation ID no header da resposta
-            response.headers[CORRELATION_ID_HEADER] = correlation_id
-
-            # Log de requisição processada
-            logger.info(
-                "http_request",
+            await self.app(scope, receive, send_with_correlation_id)
+        except Exception as exc:
+            duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+            # Erros são sempre logados; a chamada ao sampler só os contabiliza no resumo
+            self.sampler.observe(route_template(scope), 500, duration_ms)
+            # Log de erro
+            logger.error(
+                "request_failed",
                 correlation_id=correlation_id,
                 method=method,
                 path=path,
-                status_code=response.status_code,
-                duration_ms=round(process_time * 1000, 2),
+                error=str(exc),
+                duration_ms=duration_ms,
                 client_ip=client_host,
             )
+            raise
 
-            return response
-
-        except Exception as exc:
-            # Tempo até o erro
-            process_time = time.perf_counter() - start_time
+        duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+        route_path = route_template(scope)
 
-            # Log de erro
-            logger.error(
-                "request_failed",
+        # Log de requisição processada (se amostrada)
+        reason = self.sampler.observe(route_path, status_code, duration_ms)
+        if reason is not None:
+            logger.info(
+                "http_request",
                 correlation_id=correlation_id,
                 method=method,
                 path=path,
-                error=str(exc),
-                duration_ms=round(process_time * 1000, 2),
+                route=route_path,
+                status_code=status_code,
+                duration_ms=duration_ms,
                 client_ip=client_host,
-                exc_info=True,
+                log_reason=reason,
             )
 
-            raise
+        # Resumo agregado por rota, quando o intervalo vence
+        summary = self.sampler.collect_summary()
+        if summary:
+            for summary_route, fields in summary.items():
+                logger.info("http_summary", route=summary_route, **fields)
+
+
+def _header_value(scope: Scope, key: bytes) -> str | None:
+    """Retorna o valor de um header da requisição (chave em minúsculas) ou None.
+
+    Args:
+        scope: Scope ASGI da requisição.
+        key: Nome do header em bytes, minúsculo.
+
+    Returns:
+        str | None: Valor do header, se presente e não vazio.
+    """
+    for name, value in scope["headers"]:
+        if name == key:
+            return value.decode("latin-1") or None
+    return None
@@ -0,0 +1,250 @@
+"""Amostragem e limitação de taxa dos logs de acesso HTTP.
+
+Decide, por requisição, se a linha `http_request` deve ser escrita e agrega todas as
+requisições (logadas ou não) em um resumo periódico por rota, com contagens e
+percentis de latência.
+"""
+
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from src.core.settings import Settings
+
+# Quantidade máxima de latências guardadas por rota e por intervalo (amostragem de
+# reservatório), limitando a memória do resumo independente do throughput.
+_LATENCY_RESERVOIR_SIZE = 1024
+
+
+class TokenBucket:
+    """Token bucket clássico: `rate` tokens por segundo, acumulando até `capacity`."""
+
+    __slots__ = ("capacity", "rate", "_tokens", "_updated_at")
+
+    def __init__(self, rate: float, capacity: float, now: float) -> None:
+        """Cria um bucket cheio.
+
+        Args:
+            rate: Tokens repostos por segundo.
+            capacity: Máximo de tokens acumulados (rajada permitida).
+            now: Instante atual (relógio monotônico).
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = now
+
+    def try_acquire(self, now: float) -> bool:
+        """Consome um token, se houver.
+
+        Args:
+            now: Instante atual (relógio monotônico).
+
+        Returns:
+            bool: True se um token foi consumido.
+        """
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+
+@dataclass
+class RouteStats:
+    """Agregado das requisições de uma rota dentro de um intervalo de resumo."""
+
+    count: int = 0
+    errors: int = 0
+    logged: int = 0
+    latencies_ms: list[float] = field(default_factory=list)
+
+    def record(self, status_code: int, duration_ms: float, logged: bool, rng: random.Random) -> None:
+        """Contabiliza uma requisição.
+
+        Args:
+            status_code: Status HTTP da resposta.
+            duration_ms: Duração da requisição em milissegundos.
+            logged: Se a requisição gerou uma linha `http_request`.
+            rng: Gerador usado na amostragem de reservatório.
+        """
+        self.count += 1
+        if status_code >= 500:
+            self.errors += 1
+        if logged:
+            self.logged += 1
+        if len(self.latencies_ms) < _LATENCY_RESERVOIR_SIZE:
+            self.latencies_ms.append(duration_ms)
+        else:
+            slot = rng.randrange(self.count)
+            if slot < _LATENCY_RESERVOIR_SIZE:
+                self.latencies_ms[slot] = duration_ms
+
+    def summary(self) -> dict[str, float | int]:
+        """Monta os campos do resumo da rota (contagens e percentis de latência).
+
+        Returns:
+            dict[str, float | int]: Campos prontos para o log `http_summary`.
+        """
+        latencies = sorted(self.latencies_ms)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "logged": self.logged,
+            "p50_ms": _percentile(latencies, 0.50),
+            "p95_ms": _percentile(latencies, 0.95),
+            "p99_ms": _percentile(latencies, 0.99),
+            "max_ms": latencies[-1] if latencies else 0.0,
+        }
+
+
+@dataclass(frozen=True)
+class HttpLogSamplingConfig:
+    """Parâmetros da amostragem dos logs de acesso.
+
+    Attributes:
+        default_sample_rate: Fração (0..1) das requisições logadas em rotas sem taxa própria.
+        route_sample_rates: Taxa por rota (template do path, ex.: "/api/v1/products/{product_id}").
+        slow_request_ms: Latência a partir da qual a requisição é sempre logada.
+        rate_limit_per_second: Linhas por segundo permitidas por rota (0 desativa o limite).
+        rate_limit_burst: Rajada máxima de linhas por rota.
+        summary_interval_seconds: Intervalo do resumo agregado (0 desativa o resumo).
+    """
+
+    default_sample_rate: float = 1.0
+    route_sample_rates: dict[str, float] = field(default_factory=dict)
+    slow_request_ms: float = 1000.0
+    rate_limit_per_second: float = 0.0
+    rate_limit_burst: float = 1.0
+    summary_interval_seconds: float = 60.0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "HttpLogSamplingConfig":
+        """Monta a configuração a partir das configurações da aplicação.
+
+        Args:
+            settings: Configurações da aplicação.
+
+        Returns:
+            HttpLogSamplingConfig: Parâmetros de amostragem.
+        """
+        return cls(
+            default_sample_rate=settings.http_log_sample_rate,
+            route_sample_rates=settings.http_log_route_sample_rates,
+            slow_request_ms=settings.http_log_slow_request_ms,
+            rate_limit_per_second=settings.http_log_rate_limit_per_second,
+            rate_limit_burst=settings.http_log_rate_limit_burst,
+            summary_interval_seconds=settings.http_log_summary_interval_seconds,
+        )
+
+
+class HttpLogSampler:
+    """Política de amostragem dos logs de acesso.
+
+    Regras, em ordem:
+    - Erros (status >= 500) e requisições lentas (>= `slow_request_ms`) são sempre logados.
+    - As demais são amostradas com a taxa da rota (`route_sample_rates`, ou
+      `default_sample_rate`) e, se amostradas, passam por um token bucket por rota.
+
+    Toda requisição entra no resumo periódico, logada ou não. O sampler não faz I/O:
+    `observe` devolve se a linha deve ser escrita e `collect_summary` devolve os
+    agregados quando o intervalo vence.
+    """
+
+    def __init__(
+        self,
+        config: HttpLogSamplingConfig | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Inicializa o sampler.
+
+        Args:
+            config: Parâmetros de amostragem (padrão: loga tudo, resumo a cada 60s).
+            clock: Relógio monotônico (injetável para testes).
+            rng: Gerador aleatório (injetável para testes).
+        """
+        self.config = config or HttpLogSamplingConfig()
+        self._burst = max(self.config.rate_limit_burst, 1.0)
+        self._clock = clock
+        self._rng = rng or random.Random()  # noqa: S311 - amostragem, não criptografia
+        self._buckets: dict[str, TokenBucket] = {}
+        self._stats: dict[str, RouteStats] = {}
+        self._interval_started_at = clock()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "HttpLogSampler":
+        """Cria o sampler a partir das configurações da aplicação.
+
+        Args:
+            settings: Configurações da aplicação.
+
+        Returns:
+            HttpLogSampler: Sampler configurado.
+        """
+        return cls(HttpLogSamplingConfig.from_settings(settings))
+
+    def observe(self, route: str, status_code: int, duration_ms: float) -> str | None:
+        """Registra uma requisição e decide se ela deve ser logada.
+
+        Args:
+            route: Template do path da rota (chave de amostragem e de agregação).
+            status_code: Status HTTP da resposta.
+            duration_ms: Duração da requisição em milissegundos.
+
+        Returns:
+            str | None: Motivo do log ("error", "slow" ou "sampled") ou None para não logar.
+        """
+        reason = self._decide(route, status_code, duration_ms)
+        if self.config.summary_interval_seconds > 0:
+            stats = self._stats.get(route)
+            if stats is None:
+                stats = self._stats[route] = RouteStats()
+            stats.record(status_code, duration_ms, reason is not None, self._rng)
+        return reason
+
+    def collect_summary(self) -> dict[str, dict[str, float | int]] | None:
+        """Fecha o intervalo de resumo, se ele já venceu.
+
+        Returns:
+            dict[str, dict[str, float | int]] | None: Resumo por rota, ou None se o
+            intervalo ainda não venceu (ou o resumo está desativado).
+        """
+        if self.config.summary_interval_seconds <= 0:
+            return None
+        now = self._clock()
+        if now - self._interval_started_at < self.config.summary_interval_seconds:
+            return None
+        self._interval_started_at = now
+        stats, self._stats = self._stats, {}
+        return {route: route_stats.summary() for route, route_stats in stats.items()}
+
+    def _decide(self, route: str, status_code: int, duration_ms: float) -> str | None:
+        if status_code >= 500:
+            return "error"
+        if duration_ms >= self.config.slow_request_ms:
+            return "slow"
+
+        config = self.config
+        rate = config.route_sample_rates.get(route, config.default_sample_rate)
+        if rate <= 0 or (rate < 1 and self._rng.random() >= rate):
+            return None
+
+        if config.rate_limit_per_second > 0:
+            now = self._clock()
+            bucket = self._buckets.get(route)
+            if bucket is None:
+                bucket = self._buckets[route] = TokenBucket(config.rate_limit_per_second, self._burst, now)
+            if not bucket.try_acquire(now):
+                return None
+        return "sampled"
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """Percentil por posição mais próxima (lista já ordenada; 0.0 se vazia)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return round(sorted_values[index], 2)
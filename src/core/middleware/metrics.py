@@ -0,0 +1,51 @@
+"""Middleware que registra contagem e latência das requisições HTTP."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.metrics import HTTP_REQUEST_DURATION_SECONDS, HTTP_REQUESTS_TOTAL
+from src.core.middleware.route_template import route_template
+
+
+class MetricsMiddleware:
+    """Middleware ASGI puro que alimenta as métricas HTTP do registro padrão.
+
+    Registra, por método e rota (template do path), o total de requisições por status
+    e o histograma de latência. Requisições que terminam em exceção contam como 500.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Inicializa o middleware.
+
+        Args:
+            app: Aplicação ASGI seguinte na cadeia.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Processa a requisição e registra suas métricas ao final."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_capturing_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_capturing_status)
+        except Exception:
+            status_code = 500
+            raise
+        finally:
+            duration = time.perf_counter() - start_time
+            route = route_template(scope)
+            method = scope["method"]
+            HTTP_REQUESTS_TOTAL.labels(method, route, str(status_code)).inc()
+            HTTP_REQUEST_DURATION_SECONDS.labels(method, route).observe(duration)
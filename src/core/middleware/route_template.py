@@ -0,0 +1,35 @@
+"""Resolução do template de rota (ex.: "/api/v1/products/{product_id}") de uma requisição."""
+
+from starlette.types import Scope
+
+# Chave usada para requisições que não casaram com nenhuma rota
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope) -> str:
+    """Retorna o template do path da rota que atendeu a requisição.
+
+    Usar o template, e não o path concreto, mantém limitada a cardinalidade de chaves
+    de amostragem e labels de métricas. O router grava a rota em `scope["route"]`, mas
+    o `path_format` dela pode vir sem o prefixo dos routers incluídos; o prefixo é
+    recuperado do path concreto, removendo o trecho que a própria rota casou.
+
+    Args:
+        scope: Scope ASGI da requisição (após passar pelo router).
+
+    Returns:
+        str: Template completo da rota ou UNMATCHED_ROUTE.
+    """
+    route = scope.get("route")
+    path_format = getattr(route, "path_format", None) or getattr(route, "path", None)
+    if not path_format:
+        return UNMATCHED_ROUTE
+
+    path: str = scope["path"]
+    try:
+        matched_suffix = path_format.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return path_format
+    if matched_suffix and path.endswith(matched_suffix):
+        return path[: len(path) - len(matched_suffix)] + path_format
+    return path_format
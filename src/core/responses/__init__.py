@@ -0,0 +1,6 @@
+"""Respostas HTTP customizadas da aplicação."""
+
+from src.core.responses.json_bytes import JSONBytesResponse, dump_model_json
+from src.core.responses.streaming import RequestBodyStreamingResponse
+
+__all__ = ["JSONBytesResponse", "RequestBodyStreamingResponse", "dump_model_json"]
@@ -0,0 +1,29 @@
+"""Respostas JSON serializadas direto em bytes pelo pydantic-core."""
+
+from pydantic import BaseModel
+from starlette.responses import Response
+
+
+class JSONBytesResponse(Response):
+    """Resposta cujo corpo já é JSON serializado.
+
+    Quando uma rota retorna uma `Response`, o FastAPI não revalida o resultado pelo
+    `response_model` (que continua na rota para o OpenAPI) nem passa pelo
+    `jsonable_encoder` + `json.dumps`. Os modelos vêm do repositório já validados, então
+    basta serializá-los uma vez, em Rust, com o serializador do próprio modelo. O corpo
+    é o mesmo JSON compacto que o caminho padrão geraria.
+    """
+
+    media_type = "application/json"
+
+
+def dump_model_json(model: BaseModel) -> bytes:
+    """Serializa um modelo já validado em JSON compacto (sem revalidação).
+
+    Args:
+        model: Modelo a serializar.
+
+    Returns:
+        bytes: Objeto JSON.
+    """
+    return model.__pydantic_serializer__.to_json(model)
@@ -0,0 +1,26 @@
+"""Respostas em streaming que consomem o corpo da requisição enquanto respondem."""
+
+from starlette.requests import ClientDisconnect
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+
+class RequestBodyStreamingResponse(StreamingResponse):
+    """StreamingResponse para geradores que leem o corpo da requisição (ex.: import NDJSON).
+
+    Em servidores ASGI < 2.4, a StreamingResponse padrão roda uma tarefa que escuta
+    `http.disconnect` via `receive()` em paralelo ao gerador. Se o gerador também lê o
+    corpo, as duas tarefas disputam as mensagens de `receive()` e a requisição trava.
+    Aqui o corpo é consumido apenas pelo gerador; uma desconexão do cliente é percebida
+    pelo próprio gerador (via `request.stream()`) ou como falha no `send`.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Envia a resposta sem a tarefa concorrente de escuta de desconexão."""
+        try:
+            await self.stream_response(send)
+        except OSError as err:
+            raise ClientDisconnect() from err
+
+        if self.background is not None:
+            await self.background()
@@ -1,5 +1,7 @@
 from functools import lru_cache
+from typing import Literal, Self
 
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -20,6 +22,9 @@ class Settings(BaseSettings):
     host: str = "127.0.0.1"
     port: int = 8000
     reload: bool = False
+    # Processos do servidor (ver src/server.py). Mais de um exige um armazenamento
+    # compartilhado entre processos (PRODUCT_REPOSITORY_BACKEND=sqlite) e sem cache local.
+    workers: int = Field(default=1, ge=1)
 
     # CORS
     cors_origins: list[str] = ["http://localhost:3000", "http://localhost:8000/"]
@@ -30,6 +35,71 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
     log_format_json: bool = False
+    # "sync" escreve no stderr na própria thread que loga; "queue" enfileira e escreve
+    # em uma thread dedicada (ver utils/log_queue.py).
+    log_sink: Literal["sync", "queue"] = "sync"
+    log_queue_size: int = Field(default=10_000, ge=1)
+    # Com a fila cheia: "drop" descarta (e conta) o registro; "block" espera espaço.
+    log_queue_overflow: Literal["drop", "block"] = "drop"
+
+    # Amostragem dos logs de acesso HTTP (ver core/middleware/http_sampling.py).
+    # Erros (status >= 500) e requisições acima de http_log_slow_request_ms são sempre logados.
+    http_log_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+    # Taxa por rota, pelo template do path: {"/api/v1/products/{product_id}": 0.01}
+    http_log_route_sample_rates: dict[str, float] = {}
+    http_log_slow_request_ms: float = Field(default=1000.0, ge=0.0)
+    # Token bucket por rota: linhas por segundo (0 desativa) e rajada máxima.
+    http_log_rate_limit_per_second: float = Field(default=0.0, ge=0.0)
+    http_log_rate_limit_burst: float = Field(default=10.0, ge=1.0)
+    # Intervalo do resumo agregado "http_summary" por rota (0 desativa).
+    http_log_summary_interval_seconds: float = Field(default=60.0, ge=0.0)
+
+    # Armazenamento dos produtos: "memory" (um processo) ou "sqlite" (arquivo em disco)
+    product_repository_backend: Literal["memory", "sqlite"] = "memory"
+    product_sqlite_path: str = "data/products.db"
+    # Conexões de leitura do pool (as escritas usam uma conexão dedicada)
+    product_sqlite_pool_size: int = Field(default=4, ge=1)
+    # Formato dos registros no backend "memory": um objeto por produto ou colunas (menos memória)
+    product_memory_layout: Literal["objects", "columnar"] = "objects"
+
+    # Coalescência de leituras idênticas concorrentes no repositório (single-flight)
+    product_single_flight_enabled: bool = True
+
+    # Cache read-through de produtos (get_by_id/get_by_name) na frente do repositório
+    product_cache_enabled: bool = False
+    product_cache_max_entries: int = Field(default=10_000, ge=1)
+    product_cache_ttl_seconds: float = Field(default=60.0, gt=0.0)
+    # Validade das entradas "não encontrado" (0 desativa o cache negativo)
+    product_cache_negative_ttl_seconds: float = Field(default=5.0, ge=0.0)
+
+    # Memória máxima do cache do JSON serializado de cada produto (0 desativa)
+    product_json_cache_max_bytes: int = Field(default=32 * 1024 * 1024, ge=0)
+
+    # Snapshot binário do repositório em memória (carregado no boot; vazio desativa)
+    product_snapshot_path: str | None = None
+    product_snapshot_interval_seconds: float = Field(default=60.0, gt=0.0)
+    # Write-ahead log entre snapshots (diretório dos segmentos; vazio desativa, exige o snapshot)
+    product_wal_path: str | None = None
+    # Janela do group commit: escritas concorrentes dentro dela compartilham um fsync
+    product_wal_group_commit_ms: float = Field(default=2.0, ge=0.0)
+    # Tamanho do segmento corrente que antecipa a compactação (snapshot + descarte do log)
+    product_wal_compact_bytes: int = Field(default=64 * 1024 * 1024, ge=1)
+
+    @model_validator(mode="after")
+    def _check_workers(self) -> Self:
+        """Garante que todos os processos vejam o mesmo catálogo quando WORKERS > 1."""
+        if self.workers > 1 and self.product_repository_backend == "memory":
+            raise ValueError("WORKERS > 1 requires a shared store (PRODUCT_REPOSITORY_BACKEND=sqlite)")
+        if self.workers > 1 and self.product_cache_enabled:
+            raise ValueError("WORKERS > 1 requires PRODUCT_CACHE_ENABLED=false (the cache is per process)")
+        return self
+
+    @model_validator(mode="after")
+    def _check_product_wal(self) -> Self:
+        """Exige o snapshot quando o WAL está ativo (a compactação do log depende dele)."""
+        if self.product_wal_path and not self.product_snapshot_path:
+            raise ValueError("PRODUCT_WAL_PATH requires PRODUCT_SNAPSHOT_PATH")
+        return self
 
     model_config = SettingsConfigDict(
         env_file=".env",
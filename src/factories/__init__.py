@@ -1,11 +1,21 @@
 from src.factories.product_factory import (
     make_product_controller,
+    make_product_json_cache,
     make_product_repository,
     make_product_service,
+    make_product_snapshotter,
+    make_product_store,
+    make_product_wal,
+    make_sqlite_product_store,
 )
 
 __all__ = [
     "make_product_controller",
+    "make_product_json_cache",
     "make_product_repository",
     "make_product_service",
+    "make_product_snapshotter",
+    "make_product_store",
+    "make_product_wal",
+    "make_sqlite_product_store",
 ]
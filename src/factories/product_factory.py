@@ -1,18 +1,120 @@
 from functools import lru_cache
+from pathlib import Path
 
 from src.controllers.product_controller import ProductController
-from src.repositories.in_memory import InMemoryProductRepository
+from src.core.settings import get_settings
+from src.repositories.in_memory import InMemoryProductRepository, ProductSnapshotter, WriteAheadLog
 from src.repositories.interfaces.product_repository import IProductRepository
+from src.repositories.sqlite import SqliteConnectionPool, SqliteProductRepository
+from src.repositories.wrappers import (
+    CachedProductRepository,
+    InstrumentedProductRepository,
+    JsonCachedProductRepository,
+    ProductJsonCache,
+    SingleFlightProductRepository,
+)
 from src.services.product_service import ProductService
 
 
+@lru_cache(maxsize=1)
+def make_product_store() -> InMemoryProductRepository:
+    """Cria o armazenamento em memória dos produtos (singleton), no formato PRODUCT_MEMORY_LAYOUT.
+
+    Returns:
+        InMemoryProductRepository: Repositório em memória compartilhado.
+    """
+    settings = get_settings()
+    return InMemoryProductRepository(wal=make_product_wal(), columnar=settings.product_memory_layout == "columnar")
+
+
+@lru_cache(maxsize=1)
+def make_sqlite_product_store() -> SqliteProductRepository:
+    """Cria o repositório SQLite dos produtos (singleton), em PRODUCT_SQLITE_PATH.
+
+    Returns:
+        SqliteProductRepository: Repositório SQLite compartilhado.
+    """
+    settings = get_settings()
+    pool = SqliteConnectionPool(Path(settings.product_sqlite_path), size=settings.product_sqlite_pool_size)
+    return SqliteProductRepository(pool)
+
+
+@lru_cache(maxsize=1)
+def make_product_wal() -> WriteAheadLog | None:
+    """Cria o write-ahead log do armazenamento em memória, se PRODUCT_WAL_PATH estiver definido.
+
+    O WAL é aberto pelo snapshotter no boot, depois de reaplicado sobre o snapshot.
+
+    Returns:
+        WriteAheadLog | None: WAL (singleton) ou None se desativado.
+    """
+    settings = get_settings()
+    if not settings.product_wal_path:
+        return None
+    return WriteAheadLog(
+        Path(settings.product_wal_path),
+        group_commit_window_seconds=settings.product_wal_group_commit_ms / 1000,
+    )
+
+
+@lru_cache(maxsize=1)
+def make_product_snapshotter() -> ProductSnapshotter | None:
+    """Cria o snapshotter do armazenamento em memória, se PRODUCT_SNAPSHOT_PATH estiver definido.
+
+    Returns:
+        ProductSnapshotter | None: Snapshotter (singleton) ou None se desativado (ou com o backend SQLite).
+    """
+    settings = get_settings()
+    if not settings.product_snapshot_path or settings.product_repository_backend != "memory":
+        return None
+    return ProductSnapshotter(
+        make_product_store(),
+        Path(settings.product_snapshot_path),
+        interval_seconds=settings.product_snapshot_interval_seconds,
+        wal=make_product_wal(),
+        compact_bytes=settings.product_wal_compact_bytes,
+    )
+
+
+@lru_cache(maxsize=1)
+def make_product_json_cache() -> ProductJsonCache:
+    """Cria o cache do JSON serializado de cada produto (singleton), limitado a PRODUCT_JSON_CACHE_MAX_BYTES.
+
+    Returns:
+        ProductJsonCache: Cache compartilhado pelo repositório e pelo controller.
+    """
+    return ProductJsonCache(max_bytes=get_settings().product_json_cache_max_bytes)
+
+
 def make_product_repository() -> IProductRepository:
-    """Cria uma instância do repositório de produtos em memória.
+    """Cria o repositório de produtos sobre o armazenamento compartilhado (PRODUCT_REPOSITORY_BACKEND).
+
+    Decoradores, de dentro para fora: métricas de latência por operação; coalescência
+    de leituras idênticas concorrentes (PRODUCT_SINGLE_FLIGHT_ENABLED); e o cache
+    read-through de leituras por ID/nome (PRODUCT_CACHE_ENABLED); e a invalidação do cache
+    de JSON por produto nas escritas (PRODUCT_JSON_CACHE_MAX_BYTES > 0). As métricas ficam
+    por dentro, medindo só o que chega ao armazenamento.
 
     Returns:
         IProductRepository: Repositório de produtos.
     """
-    return InMemoryProductRepository()
+    settings = get_settings()
+    store: IProductRepository = (
+        make_sqlite_product_store() if settings.product_repository_backend == "sqlite" else make_product_store()
+    )
+    repository: IProductRepository = InstrumentedProductRepository(store)
+    if settings.product_single_flight_enabled:
+        repository = SingleFlightProductRepository(repository)
+    if settings.product_cache_enabled:
+        repository = CachedProductRepository(
+            repository,
+            max_entries=settings.product_cache_max_entries,
+            ttl_seconds=settings.product_cache_ttl_seconds,
+            negative_ttl_seconds=settings.product_cache_negative_ttl_seconds,
+        )
+    if settings.product_json_cache_max_bytes > 0:
+        repository = JsonCachedProductRepository(repository, make_product_json_cache())
+    return repository
 
 
 @lru_cache(maxsize=1)
@@ -34,4 +136,4 @@ def make_product_controller() -> ProductController:
         ProductController: Controller de produtos.
     """
     product_service = make_product_service()
-    return ProductController(product_service)
+    return ProductController(product_service, make_product_json_cache())
@@ -1,3 +1,6 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,9 +12,11 @@ from src.core.exceptions.fastapi_handlers import (
     http_exception_handler,
     validation_exception_handler,
 )
-from src.core.middleware import HttpLoggingMiddleware
+from src.core.middleware import HttpLoggingMiddleware, MetricsMiddleware
 from src.core.settings import get_settings
+from src.factories import make_product_snapshotter
 from src.routes.health import router as health_router
+from src.routes.metrics import router as metrics_router
 from src.routes.products import router as products_router
 from src.utils.logger import get_logger
 
@@ -21,15 +26,33 @@ settings = get_settings()
 # Application logging (auto-configured on first call)
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Carrega o snapshot do catálogo no boot e grava o último no desligamento."""
+    snapshotter = make_product_snapshotter()
+    if snapshotter is not None:
+        await snapshotter.start()
+    try:
+        yield
+    finally:
+        if snapshotter is not None:
+            await snapshotter.stop()
+
+
 # Cria a aplicação FastAPI
 app = FastAPI(
     title=settings.app_name,
     description=settings.app_description,
     version=settings.app_version,
     debug=settings.debug,
+    lifespan=lifespan,
 )
 
 # Registra middleware (ordem inversa: último adicionado executa primeiro)
+# Métricas HTTP (contagem e latência por rota)
+app.add_middleware(MetricsMiddleware)
+
 # Logging HTTP deve ser o primeiro executado
 app.add_middleware(HttpLoggingMiddleware)
 
@@ -49,4 +72,5 @@ app.add_exception_handler(RequestValidationError, validation_exception_handler)
 
 # Inclui rotas
 app.include_router(health_router)
+app.include_router(metrics_router)
 app.include_router(products_router)
@@ -1,7 +1,11 @@
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AwareDatetime, BaseModel, Field, field_validator
+
+# Campos de ordenação da listagem; o prefixo "-" indica ordem decrescente.
+ProductSortField = Literal["price", "-price", "stock", "-stock", "created_at", "-created_at"]
 
 
 class ProductBase(BaseModel):
@@ -55,12 +59,91 @@ class ProductUpdate(BaseModel):
     stock: int | None = Field(None, ge=0, description="Quantidade em estoque")
 
 
+class ProductBulkUpdate(ProductUpdate):
+    """Item de atualização em lote: campos de ProductUpdate + ID do produto alvo."""
+
+    id: UUID = Field(..., description="ID do produto a ser atualizado")
+    expected_version: int | None = Field(
+        None, ge=1, description="Aplica a atualização apenas se o produto estiver nesta versão"
+    )
+
+
 class ProductResponse(ProductBase):
     """Modelo de resposta para produto.
 
-    Inclui campos adicionais retornados pela API (ID e timestamps).
+    Inclui campos adicionais retornados pela API (ID, versão e timestamps).
     """
 
     id: UUID = Field(..., description="ID único do produto (UUID)")
+    version: int = Field(1, ge=1, description="Versão do registro (incrementada a cada alteração)")
     created_at: datetime = Field(..., description="Data de criação")
     updated_at: datetime | None = Field(None, description="Data da última atualização")
+
+
+class ProductPage(BaseModel):
+    """Página de produtos obtida por paginação baseada em cursor (keyset)."""
+
+    items: list[ProductResponse] = Field(default_factory=list, description="Produtos da página")
+    next_cursor: str | None = Field(default=None, description="Cursor para a próxima página (None na última)")
+
+
+class ProductQuery(BaseModel):
+    """Filtros e ordenação de uma listagem de produtos.
+
+    Sem filtros nem `sort`, a listagem é a padrão (ordem de inserção). Com `sort`, os
+    empates são desfeitos pela ordem de inserção (invertida na ordem decrescente, que é
+    exatamente a crescente ao contrário), então a ordem é total e estável.
+    """
+
+    price_min: float | None = Field(None, ge=0, description="Preço mínimo (inclusive)")
+    price_max: float | None = Field(None, ge=0, description="Preço máximo (inclusive)")
+    in_stock: bool | None = Field(None, description="true: só produtos com estoque; false: só sem estoque")
+    created_since: AwareDatetime | None = Field(None, description="Criados a partir deste instante (inclusive)")
+    created_until: AwareDatetime | None = Field(None, description="Criados até este instante (inclusive)")
+    name_prefix: str | None = Field(
+        None, min_length=1, max_length=200, description="Prefixo do nome (sem diferenciar maiúsculas/minúsculas)"
+    )
+    sort: ProductSortField | None = Field(
+        None, description="Campo de ordenação; '-' na frente para decrescente (padrão: ordem de inserção)"
+    )
+
+    @property
+    def is_default(self) -> bool:
+        """Indica se é a listagem padrão (sem filtros, na ordem de inserção)."""
+        return (
+            self.price_min is None
+            and self.price_max is None
+            and self.in_stock is None
+            and self.created_since is None
+            and self.created_until is None
+            and self.name_prefix is None
+            and self.sort is None
+        )
+
+
+class ProductListQuery(ProductQuery):
+    """Parâmetros de query da listagem de produtos: filtros, ordenação e paginação."""
+
+    skip: int = Field(0, ge=0, description="Produtos a pular (paginação por deslocamento, só sem filtros)")
+    limit: int = Field(100, ge=1, le=1000, description="Número máximo de produtos")
+    after: str | None = Field(None, min_length=1, description="Cursor opaco do header X-Next-Cursor")
+
+
+class ProductCount(BaseModel):
+    """Quantidade de produtos que passam nos filtros de uma consulta."""
+
+    count: int = Field(..., ge=0, description="Quantidade de produtos")
+
+
+class BulkItemResult(BaseModel):
+    """Resultado de um item em uma operação em lote.
+
+    Cada item reporta o próprio status HTTP, permitindo sucesso parcial no lote.
+    """
+
+    index: int = Field(..., description="Posição do item no lote enviado")
+    status_code: int = Field(..., description="Status HTTP equivalente para o item")
+    id: UUID | None = Field(default=None, description="ID do produto afetado")
+    product: ProductResponse | None = Field(default=None, description="Produto resultante (criação/atualização)")
+    error_code: str | None = Field(default=None, description="Código de erro, quando o item falhou")
+    message: str | None = Field(default=None, description="Mensagem de erro, quando o item falhou")
@@ -1,5 +1,18 @@
+from src.repositories.in_memory.columnar_store import ColumnarProductStore
 from src.repositories.in_memory.in_memory_product_repository import InMemoryProductRepository
+from src.repositories.in_memory.snapshot import ProductSnapshot, SnapshotError, read_snapshot, write_snapshot
+from src.repositories.in_memory.snapshotter import ProductSnapshotter
+from src.repositories.in_memory.wal import WalEntry, WalError, WriteAheadLog
 
 __all__ = [
+    "ColumnarProductStore",
     "InMemoryProductRepository",
+    "ProductSnapshot",
+    "ProductSnapshotter",
+    "SnapshotError",
+    "WalEntry",
+    "WalError",
+    "WriteAheadLog",
+    "read_snapshot",
+    "write_snapshot",
 ]
@@ -0,0 +1,181 @@
+"""Armazenamento colunar dos produtos do repositório em memória.
+
+Em vez de um `ProductResponse` por produto (com `__dict__`, o set de campos definidos e
+um `datetime` por timestamp), cada campo fica em uma coluna: arrays tipados para os
+números e timestamps, listas para os textos. O produto só é montado (sem validação)
+quando alguém o lê, isto é, na borda da API.
+"""
+
+from array import array
+from collections.abc import Iterator, MutableMapping
+from uuid import UUID
+
+from src.models.product import ProductResponse
+from src.repositories.in_memory.snapshot import build_product
+from src.utils.timestamps import from_micros, to_micros
+
+# updated_at=None na coluna de timestamps (o mesmo marcador do snapshot)
+_NO_TIMESTAMP = -(2**63)
+# Reconstrói o pool de descrições quando ele passar de 2x o número de produtos + esta folga.
+_MIN_POOL_SLACK = 1024
+
+
+class ColumnarProductStore(MutableMapping[UUID, ProductResponse]):
+    """Produtos guardados em colunas, com a interface de um `dict[UUID, ProductResponse]`.
+
+    - `price` em `array('d')`; `stock` e `version` em `array('q')`; `created_at` e
+      `updated_at` em `array('q')`, como microssegundos desde a época (UTC).
+    - Nome e descrição em listas de `str`; descrições iguais compartilham o mesmo
+      objeto (pool local, reconstruído quando acumula textos que saíram do catálogo).
+    - O ID fica como referência ao `UUID` que os índices do repositório já guardam (a
+      chave deste mapa), então a coluna não cria objetos novos nem na escrita nem na leitura.
+
+    A ordem de iteração é a de inserção, como no `dict`: substituir um produto mantém
+    sua posição. A remoção move a última linha para o buraco (O(1)), sem afetar essa ordem.
+    Como no snapshot, `stock` precisa caber em 64 bits.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa o armazenamento vazio."""
+        self._row_by_id: dict[UUID, int] = {}
+        self._ids: list[UUID] = []
+        self._names: list[str] = []
+        self._descriptions: list[str | None] = []
+        self._prices = array("d")
+        self._stocks = array("q")
+        self._versions = array("q")
+        self._created_at = array("q")
+        self._updated_at = array("q")
+        self._description_pool: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        """Quantidade de produtos."""
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[UUID]:
+        """Percorre os IDs na ordem de inserção."""
+        return iter(self._row_by_id)
+
+    def __contains__(self, key: object) -> bool:
+        """Indica se há um produto com o ID."""
+        return key in self._row_by_id
+
+    def __getitem__(self, key: UUID) -> ProductResponse:
+        """Monta o produto do ID.
+
+        Raises:
+            KeyError: Se não houver produto com o ID.
+        """
+        return self._materialize(self._row_by_id[key])
+
+    def get(self, key: UUID, default: ProductResponse | None = None) -> ProductResponse | None:
+        """Monta o produto do ID, ou retorna `default` se não houver."""
+        row = self._row_by_id.get(key)
+        return default if row is None else self._materialize(row)
+
+    def __setitem__(self, key: UUID, product: ProductResponse) -> None:
+        """Grava (ou substitui) o produto do ID nas colunas.
+
+        Raises:
+            ValueError: Se o ID do produto for diferente da chave.
+        """
+        if product.id != key:
+            raise ValueError(f"Product id {product.id} does not match key {key}")
+        description = product.description
+        if description is not None:
+            description = self._description_pool.setdefault(description, description)
+        updated_at = _NO_TIMESTAMP if product.updated_at is None else to_micros(product.updated_at)
+
+        row = self._row_by_id.get(key)
+        if row is None:
+            self._row_by_id[key] = len(self._ids)
+            self._ids.append(key)
+            self._names.append(product.name)
+            self._descriptions.append(description)
+            self._prices.append(product.price)
+            self._stocks.append(product.stock)
+            self._versions.append(product.version)
+            self._created_at.append(to_micros(product.created_at))
+            self._updated_at.append(updated_at)
+            return
+
+        self._names[row] = product.name
+        self._descriptions[row] = description
+        self._prices[row] = product.price
+        self._stocks[row] = product.stock
+        self._versions[row] = product.version
+        self._created_at[row] = to_micros(product.created_at)
+        self._updated_at[row] = updated_at
+        self._trim_description_pool()
+
+    def __delitem__(self, key: UUID) -> None:
+        """Remove o produto do ID, movendo a última linha para o lugar dele.
+
+        Raises:
+            KeyError: Se não houver produto com o ID.
+        """
+        row = self._row_by_id.pop(key)
+        last = len(self._ids) - 1
+        if row != last:
+            self._move_row(last, row)
+            self._row_by_id[self._ids[row]] = row
+        self._ids.pop()
+        self._names.pop()
+        self._descriptions.pop()
+        self._prices.pop()
+        self._stocks.pop()
+        self._versions.pop()
+        self._created_at.pop()
+        self._updated_at.pop()
+        self._trim_description_pool()
+
+    def copy(self) -> "ColumnarProductStore":
+        """Copia as colunas (os textos e UUIDs são compartilhados, pois são imutáveis).
+
+        Returns:
+            ColumnarProductStore: Cópia independente das escritas seguintes.
+        """
+        clone = ColumnarProductStore()
+        clone._row_by_id = self._row_by_id.copy()
+        clone._ids = self._ids.copy()
+        clone._names = self._names.copy()
+        clone._descriptions = self._descriptions.copy()
+        clone._prices = self._prices[:]
+        clone._stocks = self._stocks[:]
+        clone._versions = self._versions[:]
+        clone._created_at = self._created_at[:]
+        clone._updated_at = self._updated_at[:]
+        clone._description_pool = self._description_pool.copy()
+        return clone
+
+    def _move_row(self, source: int, target: int) -> None:
+        """Copia todas as colunas da linha `source` para a linha `target`."""
+        self._ids[target] = self._ids[source]
+        self._names[target] = self._names[source]
+        self._descriptions[target] = self._descriptions[source]
+        self._prices[target] = self._prices[source]
+        self._stocks[target] = self._stocks[source]
+        self._versions[target] = self._versions[source]
+        self._created_at[target] = self._created_at[source]
+        self._updated_at[target] = self._updated_at[source]
+
+    def _materialize(self, row: int) -> ProductResponse:
+        """Monta o `ProductResponse` de uma linha, sem validação."""
+        updated_at = self._updated_at[row]
+        return build_product(
+            {
+                "name": self._names[row],
+                "description": self._descriptions[row],
+                "price": self._prices[row],
+                "stock": self._stocks[row],
+                "id": self._ids[row],
+                "version": self._versions[row],
+                "created_at": from_micros(self._created_at[row]),
+                "updated_at": None if updated_at == _NO_TIMESTAMP else from_micros(updated_at),
+            }
+        )
+
+    def _trim_description_pool(self) -> None:
+        """Reconstrói o pool de descrições quando ele acumula textos que não estão mais em uso."""
+        if len(self._description_pool) > 2 * len(self._ids) + _MIN_POOL_SLACK:
+            self._description_pool = {text: text for text in self._descriptions if text is not None}
@@ -1,13 +1,103 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import AsyncIterator, Collection, Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from datetime import UTC, datetime
+from itertools import islice
 from uuid import UUID, uuid4
 
-from src.models.product import ProductCreate, ProductResponse, ProductUpdate
-from src.repositories.interfaces.product_repository import IProductRepository
+from pydantic import ValidationError
+
+from src.core.exceptions import (
+    DuplicateValueError,
+    EntityNotFoundError,
+    InvalidEntityError,
+    RepositoryError,
+    VersionConflictError,
+)
+from src.models.product import (
+    ProductBulkUpdate,
+    ProductCreate,
+    ProductPage,
+    ProductQuery,
+    ProductResponse,
+    ProductUpdate,
+)
+from src.repositories.in_memory.columnar_store import ColumnarProductStore
+from src.repositories.in_memory.query_columns import QueryColumns
+from src.repositories.in_memory.snapshot import ProductSnapshot
+from src.repositories.in_memory.wal import WalEntry, WriteAheadLog
+from src.repositories.interfaces.product_repository import IProductRepository, normalize_product_name
+from src.utils.cursor import decode_cursor, decode_sort_cursor, encode_cursor, encode_sort_cursor
+from src.utils.striped_locks import StripedLocks
+
+# Compacta o log de ordem quando mais da metade das entradas estiver removida
+# (e houver ao menos este número de entradas removidas).
+_MIN_DEAD_ENTRIES_TO_COMPACT = 1024
 
 
 class InMemoryProductRepository(IProductRepository):
-    def __init__(self) -> None:
-        self._products_list = []
+    """Repositório de produtos em memória.
+
+    Controle de concorrência:
+    - Toda escrita de um registro (create/update/delete, inclusive item a item nos
+      lotes) segura o lock da faixa do seu ID durante a verificação e a gravação, então
+      escritas no mesmo produto se serializam e escritas em produtos diferentes não.
+    - A unicidade de nomes usa uma tabela de reservas: o nome é reservado de forma
+      síncrona (sem ponto de suspensão entre a verificação e a reserva) antes de
+      qualquer espera, e liberado depois que o índice de nomes passa a tê-lo. Duas
+      criações com o mesmo nome nunca passam juntas, mesmo que suspendam no meio.
+    - Leituras não usam lock: cada escrita publica o novo estado com atribuições
+      simples nos índices, sem estados intermediários visíveis entre suspensões.
+
+    Com um WAL, cada escrita aplicada é anexada ao log na mesma passada (a ordem do log
+    é a ordem de aplicação) e o método só retorna depois do fsync do lote que a contém.
+    Leituras concorrentes podem ver uma escrita antes de ela estar em disco.
+
+    Com `columnar=True`, os produtos ficam em um `ColumnarProductStore` (colunas em vez
+    de um objeto por produto) e cada leitura monta um `ProductResponse` novo.
+    """
+
+    def __init__(
+        self, locks: StripedLocks | None = None, wal: WriteAheadLog | None = None, *, columnar: bool = False
+    ) -> None:
+        """Inicializa o repositório vazio.
+
+        Args:
+            locks: Locks por faixa de ID das escritas (padrão: 64 faixas).
+            wal: Write-ahead log das escritas (None desativa; deve estar aberto antes da primeira escrita).
+            columnar: Guarda os produtos em colunas (menos memória por produto; leituras montam o objeto).
+        """
+        self._columnar = columnar
+        # Índice primário (ID -> produto). Os dois formatos preservam a ordem de inserção,
+        # e substituir o valor de uma chave existente mantém sua posição original.
+        self._products = self._new_records()
+        # Índice secundário único (nome normalizado -> ID).
+        self._ids_by_name: dict[str, UUID] = {}
+        # Nomes reservados por escritas em andamento (nome normalizado -> ID do dono).
+        self._name_reservations: dict[str, UUID] = {}
+        self._locks = locks or StripedLocks()
+        self._wal = wal
+        # Log de ordem para paginação keyset: cada produto recebe um número de
+        # sequência crescente. As sequências paralelas são append-only e ordenadas por
+        # sequência; remoções deixam a entrada "morta" até a próxima compactação. Os
+        # inteiros ficam em arrays tipados (8 bytes cada, sem um objeto int por produto).
+        self._order_seqs = array("q")
+        self._order_ids: list[UUID] = []
+        self._order_index_by_id: dict[UUID, int] = {}
+        # Ponteiros "próxima entrada viva" (union-find com compressão de caminho):
+        # entradas vivas apontam para si mesmas, mortas para uma posição posterior.
+        # Saltar uma sequência de entradas mortas custa O(1) amortizado.
+        self._next_live = array("q")
+        self._dead_entries = 0
+        self._next_seq = 0
+        # Colunas dos campos filtráveis, alinhadas ao log de ordem, e índices ordenados
+        # de preço, estoque e criação (filtros, ordenação e contagem de find_page/count).
+        self._query_columns = QueryColumns()
+        # Versão do catálogo: prefixo aleatório por instância (um reinício nunca repete
+        # uma versão antiga) + contador incrementado a cada alteração.
+        self._catalog_epoch = uuid4().hex[:12]
+        self._revision = 0
 
     async def create(self, entity: ProductCreate) -> ProductResponse:
         """Cria um novo produto.
@@ -17,18 +107,12 @@ class InMemoryProductRepository(IProductRepository):
 
         Returns:
             ProductResponse: Produto criado.
-        """
-        now = datetime.now(UTC)
-        product_id = uuid4()
-        product = ProductResponse(
-            **entity.model_dump(),
-            id=product_id,
-            created_at=now,
-            updated_at=None,
-        )
-
-        self._products_list.append(product)
 
+        Raises:
+            DuplicateValueError: Se já existir (ou estiver sendo criado) um produto com o mesmo nome.
+        """
+        product = await self._create_one(entity)
+        await self._commit()
         return product
 
     async def get_by_id(self, entity_id: UUID) -> ProductResponse | None:
@@ -40,7 +124,7 @@ class InMemoryProductRepository(IProductRepository):
         Returns:
             ProductResponse | None: Produto encontrado ou None.
         """
-        return next((product for product in self._products_list if product.id == entity_id), None)
+        return self._products.get(entity_id)
 
     async def get_by_name(self, name: str) -> ProductResponse | None:
         """Busca um produto por nome.
@@ -51,11 +135,10 @@ class InMemoryProductRepository(IProductRepository):
         Returns:
             ProductResponse | None: Produto encontrado ou None.
         """
-        name_lower = name.lower()
-        return next(
-            (product for product in self._products_list if product.name.lower() == name_lower),
-            None,
-        )
+        product_id = self._ids_by_name.get(normalize_product_name(name))
+        if product_id is None:
+            return None
+        return self._products.get(product_id)
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[ProductResponse]:
         """Busca todos os produtos com paginação.
@@ -65,26 +148,399 @@ class InMemoryProductRepository(IProductRepository):
             limit: Número máximo de produtos a retornar.
 
         Returns:
-            list[ProductResponse]: Lista de produtos.
+            list[ProductResponse]: Lista de produtos (em ordem de inserção).
+        """
+        return list(islice(self._products.values(), skip, skip + limit))
+
+    async def get_page(self, after: str | None = None, limit: int = 100) -> ProductPage:
+        """Busca uma página de produtos a partir de um cursor (paginação keyset).
+
+        O cursor guarda o número de sequência do último item entregue; a busca da
+        posição inicial é O(log n) e a página custa O(limit) amortizado, independente
+        da profundidade e de quantos produtos foram removidos antes dela.
+
+        Args:
+            after: Cursor opaco retornado pela página anterior (None para a primeira).
+            limit: Número máximo de produtos a retornar.
+
+        Returns:
+            ProductPage: Produtos da página e o cursor da próxima.
+
+        Raises:
+            InvalidCursorError: Se o cursor for inválido.
         """
-        products = self._products_list
-        return products[skip : skip + limit]
+        start = 0 if after is None else bisect_right(self._order_seqs, decode_cursor(after))
 
-    async def update(self, entity_id: UUID, entity: ProductUpdate) -> ProductResponse | None:
+        items: list[ProductResponse] = []
+        last_seq = -1
+        index = self._find_live(start)
+        while index < len(self._order_ids) and len(items) < limit:
+            items.append(self._products[self._order_ids[index]])
+            last_seq = self._order_seqs[index]
+            index = self._find_live(index + 1)
+
+        has_more = index < len(self._order_ids)
+        next_cursor = encode_cursor(last_seq) if has_more else None
+        return ProductPage(items=items, next_cursor=next_cursor)
+
+    async def find_page(self, query: ProductQuery, after: str | None = None, limit: int = 100) -> ProductPage:
+        """Busca uma página de produtos filtrados e ordenados (paginação keyset).
+
+        Os filtros são avaliados sobre as colunas do log de ordem (`QueryColumns`), sem
+        ler os produtos; só os itens da página são lidos do índice primário. Com `sort`,
+        o índice ordenado do campo é percorrido a partir do cursor até a página encher
+        (O(log n + posições visitadas)); o desempate é a sequência, como na ordem padrão.
+        Sem `sort`, a varredura segue o log a partir do cursor e para quando a página
+        enche, ou, com uma faixa estreita de preço, estoque ou criação, parte só dos
+        candidatos do índice do campo.
+
+        Args:
+            query: Filtros e ordenação.
+            after: Cursor opaco retornado pela página anterior (None para a primeira).
+            limit: Número máximo de produtos a retornar.
+
+        Returns:
+            ProductPage: Produtos da página e o cursor da próxima.
+
+        Raises:
+            InvalidCursorError: Se o cursor for inválido ou de outra ordenação.
+        """
+        if query.is_default:
+            return await self.get_page(after=after, limit=limit)
+
+        columns = self._query_columns
+        if query.sort is None:
+            start = 0 if after is None else bisect_right(self._order_seqs, decode_cursor(after))
+            rows = columns.scan(query, start, limit + 1)
+        else:
+            position = None
+            if after is not None:
+                value, last_seq = decode_sort_cursor(after, query.sort)
+                # Posição que separa as entradas de mesmo valor que vêm depois do cursor:
+                # as de sequência maior (crescente) ou menor (decrescente) que a dele.
+                boundary = bisect_left if query.sort.startswith("-") else bisect_right
+                position = (value, boundary(self._order_seqs, last_seq))
+            rows = columns.top(query, position, limit + 1)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_seq = self._order_seqs[rows[-1]]
+            if query.sort is None:
+                next_cursor = encode_cursor(last_seq)
+            else:
+                next_cursor = encode_sort_cursor(query.sort, columns.sort_value(query.sort, rows[-1]), last_seq)
+        items = [self._products[self._order_ids[row]] for row in rows]
+        return ProductPage(items=items, next_cursor=next_cursor)
+
+    async def count(self, query: ProductQuery) -> int:
+        """Conta os produtos que passam nos filtros de uma consulta.
+
+        Uma faixa de preço, estoque ou criação sozinha é respondida pelos índices
+        ordenados em O(log n), sem percorrer os produtos.
+
+        Args:
+            query: Filtros (a ordenação é ignorada).
+
+        Returns:
+            int: Quantidade de produtos.
+        """
+        return self._query_columns.count(query)
+
+    async def get_catalog_version(self) -> str:
+        """Retorna um token opaco que muda a cada alteração do catálogo.
+
+        Returns:
+            str: Versão atual do catálogo.
+        """
+        return f"{self._catalog_epoch}-{self._revision}"
+
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[ProductResponse]:
+        """Percorre todos os produtos, na ordem de get_all, sem materializar o catálogo.
+
+        Cada lote é uma página keyset, então inserções e remoções feitas enquanto o
+        consumidor está suspenso não invalidam a iteração.
+
+        Args:
+            batch_size: Quantidade de produtos lida por vez.
+
+        Yields:
+            ProductResponse: Próximo produto do catálogo.
+        """
+        after: str | None = None
+        while True:
+            page = await self.get_page(after=after, limit=batch_size)
+            for product in page.items:
+                yield product
+            if page.next_cursor is None:
+                return
+            after = page.next_cursor
+
+    async def update(
+        self, entity_id: UUID, entity: ProductUpdate, expected_version: int | None = None
+    ) -> ProductResponse | None:
         """Atualiza um produto existente.
 
+        A comparação de versão e a gravação acontecem sob o lock da faixa do ID, então
+        o compare-and-swap é atômico sem serializar escritas em outros produtos.
+
         Args:
             entity_id: ID do produto a ser atualizado.
             entity: Dados atualizados do produto.
+            expected_version: Versão que o chamador leu (None atualiza incondicionalmente).
 
         Returns:
             ProductResponse | None: Produto atualizado ou None se não encontrado.
+
+        Raises:
+            DuplicateValueError: Se o novo nome pertencer a outro produto.
+            VersionConflictError: Se a versão atual for diferente de `expected_version`.
+        """
+        async with self._locks.lock_for(entity_id):
+            product = self._apply_update(entity_id, entity.model_dump(exclude_unset=True), expected_version)
+        await self._commit()
+        return product
+
+    async def delete(self, entity_id: UUID) -> bool:
+        """Deleta um produto.
+
+        Args:
+            entity_id: ID do produto a ser deletado.
+
+        Returns:
+            bool: True se deletado, False se não encontrado.
+        """
+        async with self._locks.lock_for(entity_id):
+            deleted = self._remove(entity_id)
+        await self._commit()
+        return deleted
+
+    async def create_many(self, entities: list[ProductCreate]) -> list[ProductResponse | RepositoryError]:
+        """Cria vários produtos, item a item, na ordem do lote.
+
+        Cada item é uma criação atômica (reserva do nome + lock do ID); conflitos entre
+        itens do lote são detectados pelo próprio índice de nomes à medida que os itens
+        são inseridos.
+
+        Args:
+            entities: Dados dos produtos a serem criados.
+
+        Returns:
+            list[ProductResponse | RepositoryError]: Um resultado por item, na mesma ordem.
         """
-        product = next((product for product in self._products_list if product.id == entity_id), None)
+        results: list[ProductResponse | RepositoryError] = []
+        for entity in entities:
+            try:
+                results.append(await self._create_one(entity))
+            except DuplicateValueError as err:
+                results.append(err)
+        await self._commit()
+        return results
+
+    async def update_many(self, entities: list[ProductBulkUpdate]) -> list[ProductResponse | RepositoryError]:
+        """Atualiza vários produtos, item a item, cada um sob o lock do seu ID.
+
+        Args:
+            entities: Atualizações, cada uma com o ID do produto alvo.
+
+        Returns:
+            list[ProductResponse | RepositoryError]: Um resultado por item, na mesma ordem.
+        """
+        results: list[ProductResponse | RepositoryError] = []
+        seen_ids: set[UUID] = set()
+        for entity in entities:
+            if entity.id in seen_ids:
+                results.append(DuplicateValueError("id", entity.id))
+                continue
+            seen_ids.add(entity.id)
+
+            try:
+                async with self._locks.lock_for(entity.id):
+                    updated = self._apply_update(
+                        entity.id,
+                        entity.model_dump(exclude_unset=True, exclude={"id", "expected_version"}),
+                        entity.expected_version,
+                    )
+            except (DuplicateValueError, VersionConflictError) as err:
+                results.append(err)
+            except ValidationError as err:
+                results.append(InvalidEntityError(str(err)))
+            else:
+                results.append(updated if updated is not None else EntityNotFoundError(entity.id))
+        await self._commit()
+        return results
+
+    async def delete_many(self, entity_ids: list[UUID]) -> list[bool]:
+        """Deleta vários produtos, item a item, cada um sob o lock do seu ID.
+
+        Args:
+            entity_ids: IDs dos produtos a serem deletados.
+
+        Returns:
+            list[bool]: Para cada ID, True se deletado, False se não encontrado.
+        """
+        results: list[bool] = []
+        for entity_id in entity_ids:
+            async with self._locks.lock_for(entity_id):
+                results.append(self._remove(entity_id))
+        await self._commit()
+        return results
+
+    def capture_snapshot(self) -> ProductSnapshot:
+        """Tira um retrato do catálogo para persistência.
+
+        Copia apenas referências (os produtos publicados nunca são alterados no lugar) ou,
+        no formato colunar, as colunas; o custo no event loop é uma passada sobre os
+        índices. Os produtos são montados depois, na thread que grava o arquivo, sem
+        bloquear as escritas.
+
+        Returns:
+            ProductSnapshot: Produtos com suas sequências de ordem, na ordem do catálogo.
+        """
+        seqs = self._order_seqs
+        index_by_id = self._order_index_by_id
+        order = [(seqs[index_by_id[product_id]], product_id) for product_id in self._products]
+        entries = _SnapshotEntries(order, self._products.copy())
+        return ProductSnapshot(entries=entries, next_seq=self._next_seq, revision=self._revision)
+
+    def restore_snapshot(self, snapshot: ProductSnapshot) -> None:
+        """Substitui o conteúdo do repositório pelo de um snapshot.
+
+        Os produtos e as sequências de ordem são restaurados como estavam (cursores
+        emitidos antes do reinício continuam válidos); a versão do catálogo ganha uma
+        época nova, então ETags de listagem antigos não casam por engano.
+
+        Args:
+            snapshot: Retrato lido de `read_snapshot`.
+        """
+        products = [product for _, product in snapshot.entries]
+        name_keys = [normalize_product_name(product.name) for product in products]
+        self._products = self._new_records()
+        self._products.update((product.id, product) for product in products)
+        self._ids_by_name = {name_key: product.id for name_key, product in zip(name_keys, products, strict=True)}
+        self._name_reservations = {}
+        self._order_seqs = array("q", [seq for seq, _ in snapshot.entries])
+        self._order_ids = [product.id for product in products]
+        self._order_index_by_id = {product_id: index for index, product_id in enumerate(self._order_ids)}
+        self._next_live = array("q", range(len(self._order_ids)))
+        self._dead_entries = 0
+        self._next_seq = snapshot.next_seq
+        self._query_columns = QueryColumns.from_products(products, name_keys)
+        self._catalog_epoch = uuid4().hex[:12]
+        self._revision = snapshot.revision
+
+    def replay_wal(self, entries: Iterable[WalEntry]) -> int:
+        """Reaplica entradas do WAL (após `restore_snapshot`), sem registrá-las de novo.
+
+        Args:
+            entries: Entradas com revisão maior que a do snapshot, na ordem do log.
+
+        Returns:
+            int: Quantidade de entradas aplicadas.
+        """
+        applied = 0
+        for entry in entries:
+            if entry.product is None:
+                self._unlink(entry.product_id)
+            else:
+                current = self._products.get(entry.product_id)
+                name_key = normalize_product_name(entry.product.name)
+                if current is None:
+                    self._append_to_order(entry.product, name_key, entry.seq)
+                else:
+                    del self._ids_by_name[normalize_product_name(current.name)]
+                    self._query_columns.set(self._order_index_by_id[entry.product_id], entry.product, name_key)
+                self._products[entry.product_id] = entry.product
+                self._ids_by_name[name_key] = entry.product_id
+            self._revision = entry.revision
+            applied += 1
+        return applied
+
+    def _new_records(self) -> dict[UUID, ProductResponse] | ColumnarProductStore:
+        """Cria o índice primário vazio no formato configurado."""
+        return ColumnarProductStore() if self._columnar else {}
+
+    async def _commit(self) -> None:
+        """Espera o fsync das entradas de WAL anexadas até aqui (no-op sem WAL)."""
+        if self._wal is not None:
+            await self._wal.commit()
+
+    async def _create_one(self, entity: ProductCreate) -> ProductResponse:
+        """Cria um produto: reserva o nome, segura o lock do novo ID e insere.
+
+        Raises:
+            DuplicateValueError: Se o nome já existir ou estiver reservado.
+        """
+        product_id = uuid4()
+        name_key = normalize_product_name(entity.name)
+        with self._reserved_name(name_key, product_id, entity.name):
+            async with self._locks.lock_for(product_id):
+                return self._insert(entity, product_id, name_key)
+
+    @contextmanager
+    def _reserved_name(self, name_key: str, owner_id: UUID, name: str) -> Iterator[None]:
+        """Reserva um nome para `owner_id` durante o bloco.
+
+        A verificação e a reserva acontecem sem ponto de suspensão entre elas, então
+        só uma escrita concorrente consegue reservar cada nome.
+
+        Raises:
+            DuplicateValueError: Se o nome pertencer a (ou estiver reservado por) outro produto.
+        """
+        if self._name_owner(name_key, owner_id) != owner_id:
+            raise DuplicateValueError("name", name)
+        self._name_reservations[name_key] = owner_id
+        try:
+            yield
+        finally:
+            if self._name_reservations.get(name_key) == owner_id:
+                del self._name_reservations[name_key]
+
+    def _name_owner(self, name_key: str, default: UUID) -> UUID:
+        """Retorna o ID que detém o nome (cadastrado ou reservado), ou `default` se estiver livre."""
+        return self._ids_by_name.get(name_key) or self._name_reservations.get(name_key, default)
+
+    def _insert(self, entity: ProductCreate, product_id: UUID, name_key: str) -> ProductResponse:
+        """Insere um produto (com o nome já reservado) e atualiza todos os índices."""
+        now = datetime.now(UTC)
+        product = ProductResponse(
+            **entity.model_dump(),
+            id=product_id,
+            created_at=now,
+            updated_at=None,
+        )
+
+        self._products[product_id] = product
+        self._ids_by_name[name_key] = product_id
+        seq = self._append_to_order(product, name_key)
+        self._revision += 1
+        if self._wal is not None:
+            self._wal.append_put(self._revision, seq, product)
+
+        return product
+
+    def _apply_update(
+        self, entity_id: UUID, update_data: dict, expected_version: int | None = None
+    ) -> ProductResponse | None:
+        """Aplica uma atualização parcial e mantém o índice de nomes consistente.
+
+        Raises:
+            DuplicateValueError: Se o novo nome pertencer a outro produto.
+            VersionConflictError: Se a versão atual for diferente de `expected_version`.
+            ValidationError: Se o produto resultante for inválido.
+        """
+        product = self._products.get(entity_id)
         if not product:
             return None
+        if expected_version is not None and product.version != expected_version:
+            raise VersionConflictError(entity_id, expected_version, product.version)
+
+        new_name = update_data.get("name")
+        old_name_key = normalize_product_name(product.name)
+        new_name_key = old_name_key if new_name is None else normalize_product_name(new_name)
+        if self._name_owner(new_name_key, entity_id) != entity_id:
+            raise DuplicateValueError("name", new_name)
 
-        update_data = entity.model_dump(exclude_unset=True)
         if update_data:
             temp_data = product.model_dump()
             temp_data.update(update_data)
@@ -93,22 +549,112 @@ class InMemoryProductRepository(IProductRepository):
 
         updated_product = product.model_copy(update=update_data)
         updated_product.updated_at = datetime.now(UTC)
+        updated_product.version = product.version + 1
 
-        self._products_list[self._products_list.index(product)] = updated_product
+        index = self._order_index_by_id[entity_id]
+        self._products[entity_id] = updated_product
+        if new_name_key != old_name_key:
+            del self._ids_by_name[old_name_key]
+            self._ids_by_name[new_name_key] = entity_id
+        else:
+            # Mantém na coluna o mesmo objeto que é chave do índice de nomes.
+            new_name_key = self._query_columns.name_keys[index]
+        self._query_columns.set(index, updated_product, new_name_key)
+        self._revision += 1
+        if self._wal is not None:
+            self._wal.append_put(self._revision, self._order_seqs[index], updated_product)
         return updated_product
 
-    async def delete(self, entity_id: UUID) -> bool:
-        """Deleta um produto.
+    def _remove(self, entity_id: UUID) -> bool:
+        """Remove um produto de todos os índices e registra a remoção no WAL."""
+        if not self._unlink(entity_id):
+            return False
+        self._revision += 1
+        if self._wal is not None:
+            self._wal.append_delete(self._revision, entity_id)
+        return True
 
-        Args:
-            entity_id: ID do produto a ser deletado.
+    def _unlink(self, entity_id: UUID) -> bool:
+        """Remove um produto de todos os índices (sem mexer na revisão)."""
+        product = self._products.pop(entity_id, None)
+        if product is None:
+            return False
+
+        del self._ids_by_name[normalize_product_name(product.name)]
+        index = self._order_index_by_id.pop(entity_id)
+        self._next_live[index] = index + 1
+        self._query_columns.kill(index)
+        self._dead_entries += 1
+        if self._dead_entries >= _MIN_DEAD_ENTRIES_TO_COMPACT and self._dead_entries * 2 > len(self._order_ids):
+            self._compact_order()
+        return True
+
+    def _append_to_order(self, product: ProductResponse, name_key: str, seq: int | None = None) -> int:
+        """Registra um produto recém-criado no fim do log de ordem (e das colunas de consulta).
 
         Returns:
-            bool: True se deletado, False se não encontrado.
+            int: Sequência atribuída (`seq`, na reaplicação do WAL, ou a próxima livre).
         """
-        product = next((product for product in self._products_list if product.id == entity_id), None)
-        if not product:
-            return False
+        if seq is None:
+            seq = self._next_seq
+        self._next_seq = max(self._next_seq, seq + 1)
+        index = len(self._order_ids)
+        self._order_seqs.append(seq)
+        self._order_ids.append(product.id)
+        self._order_index_by_id[product.id] = index
+        self._next_live.append(index)
+        self._query_columns.append(product, name_key)
+        return seq
 
-        self._products_list.remove(product)
-        return True
+    def _find_live(self, index: int) -> int:
+        """Retorna a primeira posição viva do log de ordem a partir de `index`.
+
+        Retorna len(self._order_ids) se não houver entrada viva após `index`.
+        """
+        next_live = self._next_live
+        size = len(next_live)
+        root = index
+        while root < size and next_live[root] != root:
+            root = next_live[root]
+        # Compressão de caminho: as entradas percorridas passam a apontar direto para a raiz.
+        while index < size and next_live[index] != index:
+            following = next_live[index]
+            next_live[index] = root
+            index = following
+        return root
+
+    def _compact_order(self) -> None:
+        """Remove do log de ordem as entradas de produtos deletados.
+
+        Os números de sequência são preservados, então cursores já emitidos continuam válidos.
+        """
+        keep = self._query_columns.live_indexes()
+        self._order_seqs = array("q", map(self._order_seqs.__getitem__, keep))
+        self._order_ids = list(map(self._order_ids.__getitem__, keep))
+        self._query_columns.compact(keep)
+        self._order_index_by_id = {pid: index for index, pid in enumerate(self._order_ids)}
+        self._next_live = array("q", range(len(self._order_ids)))
+        self._dead_entries = 0
+
+
+class _SnapshotEntries(Collection[tuple[int, ProductResponse]]):
+    """Entradas de um snapshot, com cada produto lido só durante a iteração.
+
+    Guarda os pares (sequência, ID) e uma cópia do índice primário: no formato colunar,
+    os produtos são montados na thread que grava o arquivo, e não no event loop.
+    """
+
+    def __init__(self, order: list[tuple[int, UUID]], records: Mapping[UUID, ProductResponse]) -> None:
+        self._order = order
+        self._records = records
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __iter__(self) -> Iterator[tuple[int, ProductResponse]]:
+        records = self._records
+        for seq, product_id in self._order:
+            yield seq, records[product_id]
+
+    def __contains__(self, entry: object) -> bool:
+        return any(entry == candidate for candidate in self)
@@ -0,0 +1,356 @@
+"""Colunas e índices ordenados dos campos filtráveis do repositório em memória.
+
+As colunas ficam alinhadas ao log de ordem do repositório (a posição `i` de cada
+coluna é a `i`-ésima entrada do log). Preço, estoque e criação têm também um
+`SortedIndex` de pares (valor, posição), mantido a cada escrita, então faixas e
+ordenações por esses campos custam O(log n + k). Os demais filtros são passadas sobre
+as posições candidatas, sem ler os objetos dos produtos, e só os produtos da página
+são montados.
+"""
+
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from heapq import nlargest, nsmallest
+from itertools import chain, compress
+
+from src.models.product import ProductQuery, ProductResponse
+from src.repositories.in_memory.sorted_index import SortedIndex
+from src.repositories.interfaces.product_repository import normalize_name_prefix
+from src.utils.timestamps import to_micros
+
+# Posições avaliadas no primeiro bloco de uma varredura; os blocos seguintes dobram até
+# o máximo. Sem ordenação, a varredura para assim que a página enche.
+_FIRST_CHUNK = 1024
+_MAX_CHUNK = 65536
+# count() só parte dos candidatos de um índice se a faixa tiver até 1/8 das entradas.
+_CANDIDATES_PER_SCAN = 8
+# Maior posição possível: (valor, _LAST_POSITION) fica depois de todos os pares do valor.
+_LAST_POSITION = sys.maxsize
+
+# Faixa de um índice: (menor par incluído, primeiro par excluído); None é aberto.
+_Range = tuple[tuple[float, int] | None, tuple[float, int] | None]
+
+
+class QueryColumns:
+    """Preço, estoque, criação e nome normalizado de cada entrada do log de ordem.
+
+    - `price` em `array('d')`; `stock` e `created_at` (µs desde a época) em `array('q')`.
+    - O nome normalizado é o mesmo objeto `str` que é chave do índice de nomes, então a
+      coluna custa só a referência.
+    - `alive` marca com 1 as entradas de produtos existentes (remoções zeram a posição
+      até a próxima compactação do log); `dead` conta as zeradas.
+    - `indexes` tem um `SortedIndex` por campo numérico, só com as entradas vivas
+      (16 bytes por produto em cada um).
+    """
+
+    def __init__(self) -> None:
+        """Inicializa as colunas vazias."""
+        self.prices = array("d")
+        self.stocks = array("q")
+        self.created_at = array("q")
+        self.name_keys: list[str] = []
+        self.alive = bytearray()
+        self.dead = 0
+        self.indexes = {"price": SortedIndex("d"), "stock": SortedIndex("q"), "created_at": SortedIndex("q")}
+
+    @classmethod
+    def from_products(cls, products: Iterable[ProductResponse], name_keys: Iterable[str]) -> "QueryColumns":
+        """Monta as colunas e os índices de uma vez (uma ordenação por índice, sem inserções).
+
+        Args:
+            products: Produtos na ordem do log.
+            name_keys: Nome normalizado de cada produto, na mesma ordem.
+
+        Returns:
+            QueryColumns: Colunas com todas as entradas vivas.
+        """
+        columns = cls()
+        for product, name_key in zip(products, name_keys, strict=True):
+            columns.prices.append(product.price)
+            columns.stocks.append(product.stock)
+            columns.created_at.append(to_micros(product.created_at))
+            columns.name_keys.append(name_key)
+        columns.alive = bytearray(b"\x01") * len(columns.name_keys)
+        positions = range(len(columns.name_keys))
+        columns.indexes = {
+            "price": SortedIndex.from_column("d", columns.prices, positions),
+            "stock": SortedIndex.from_column("q", columns.stocks, positions),
+            "created_at": SortedIndex.from_column("q", columns.created_at, positions),
+        }
+        return columns
+
+    def __len__(self) -> int:
+        """Quantidade de posições (vivas ou não)."""
+        return len(self.alive)
+
+    def append(self, product: ProductResponse, name_key: str) -> None:
+        """Acrescenta a entrada de um produto no fim das colunas e nos índices.
+
+        Args:
+            product: Produto recém-registrado no log de ordem.
+            name_key: Nome normalizado do produto.
+        """
+        position = len(self.alive)
+        created_at = to_micros(product.created_at)
+        self.prices.append(product.price)
+        self.stocks.append(product.stock)
+        self.created_at.append(created_at)
+        self.name_keys.append(name_key)
+        self.alive.append(1)
+        self.indexes["price"].add(product.price, position)
+        self.indexes["stock"].add(product.stock, position)
+        self.indexes["created_at"].add(created_at, position)
+
+    def set(self, index: int, product: ProductResponse, name_key: str) -> None:
+        """Regrava a entrada de um produto atualizado (e move seus pares nos índices).
+
+        Args:
+            index: Posição do produto no log de ordem.
+            product: Produto com os novos valores.
+            name_key: Nome normalizado do produto.
+        """
+        if self.prices[index] != product.price:
+            self.indexes["price"].remove(self.prices[index], index)
+            self.indexes["price"].add(product.price, index)
+            self.prices[index] = product.price
+        if self.stocks[index] != product.stock:
+            self.indexes["stock"].remove(self.stocks[index], index)
+            self.indexes["stock"].add(product.stock, index)
+            self.stocks[index] = product.stock
+        self.name_keys[index] = name_key
+
+    def kill(self, index: int) -> None:
+        """Marca a entrada de um produto removido e a tira dos índices.
+
+        Args:
+            index: Posição do produto no log de ordem.
+        """
+        self.alive[index] = 0
+        self.dead += 1
+        self.indexes["price"].remove(self.prices[index], index)
+        self.indexes["stock"].remove(self.stocks[index], index)
+        self.indexes["created_at"].remove(self.created_at[index], index)
+
+    def live_indexes(self) -> list[int]:
+        """Posições das entradas vivas, em ordem."""
+        return list(compress(range(len(self.alive)), self.alive))
+
+    def compact(self, keep: list[int]) -> None:
+        """Mantém só as posições `keep` (as vivas, em ordem), como o log de ordem compactado.
+
+        Args:
+            keep: Posições mantidas, em ordem crescente.
+        """
+        new_positions = array("q", bytes(8 * len(self.alive)))
+        for position, old_position in enumerate(keep):
+            new_positions[old_position] = position
+        for index in self.indexes.values():
+            index.remap(new_positions)
+        self.prices = array("d", map(self.prices.__getitem__, keep))
+        self.stocks = array("q", map(self.stocks.__getitem__, keep))
+        self.created_at = array("q", map(self.created_at.__getitem__, keep))
+        self.name_keys = list(map(self.name_keys.__getitem__, keep))
+        self.alive = bytearray(b"\x01") * len(keep)
+        self.dead = 0
+
+    def sort_value(self, sort: str, index: int) -> float:
+        """Valor do campo de ordenação `sort` (com ou sem "-") na posição `index`."""
+        return self._column(sort.removeprefix("-"))[index]
+
+    def count(self, query: ProductQuery) -> int:
+        """Quantidade de entradas vivas que passam nos filtros (a ordenação é ignorada).
+
+        Sem filtros, é a quantidade de entradas vivas. Com uma única faixa indexada e
+        nenhum outro filtro, é a diferença de dois postos no índice (O(log n)). Com mais
+        filtros, avalia só os candidatos da faixa mais estreita, se ela tiver no máximo
+        1/`_CANDIDATES_PER_SCAN` das entradas (as posições vêm fora de ordem, então ler
+        muitas custa mais que varrer as colunas); senão, varre todas as colunas.
+
+        Args:
+            query: Filtros da consulta.
+
+        Returns:
+            int: Quantidade de produtos que passam nos filtros.
+        """
+        live = len(self.alive) - self.dead
+        ranges = self._ranges(query)
+        if not ranges and query.name_prefix is None:
+            return live
+        if len(ranges) == 1 and query.name_prefix is None:
+            ((field, (low, high)),) = ranges.items()
+            return self.indexes[field].count(low, high)
+        counts = {field: self.indexes[field].count(low, high) for field, (low, high) in ranges.items()}
+        field = min(counts, key=counts.__getitem__, default=None)
+        if field is not None and counts[field] * _CANDIDATES_PER_SCAN <= live:
+            return len(self._filter(query, list(chain.from_iterable(self.indexes[field].chunks(*ranges[field])))))
+        size = len(self.alive)
+        return sum(
+            len(self._matching(query, start, min(start + _MAX_CHUNK, size))) for start in range(0, size, _MAX_CHUNK)
+        )
+
+    def scan(self, query: ProductQuery, start: int, limit: int) -> list[int]:
+        """Posições que passam nos filtros, na ordem do log, a partir de `start`.
+
+        Se uma faixa indexada for estreita o bastante (k candidatos com k² <= limit * n,
+        ou seja, menos trabalho que a varredura que para quando a página enche, que
+        percorre cerca de limit * n / k posições), as posições vêm do índice e são
+        ordenadas; senão, avalia blocos crescentes do log e para com `limit` posições.
+
+        Args:
+            query: Filtros da consulta (a ordenação é ignorada).
+            start: Primeira posição avaliada.
+            limit: Número máximo de posições retornadas.
+
+        Returns:
+            list[int]: Até `limit` posições, em ordem crescente.
+        """
+        ranges = self._ranges(query)
+        narrowest = self._narrowest(ranges, limit, len(self.alive) - self.dead)
+        if narrowest is not None:
+            rows = sorted(chain.from_iterable(self.indexes[narrowest].chunks(*ranges[narrowest])))
+            return list(self._filter(query, rows[bisect_left(rows, start) :])[:limit])
+
+        size = len(self.alive)
+        chunk = _FIRST_CHUNK
+        matches: list[int] = []
+        while start < size and len(matches) < limit:
+            stop = min(start + chunk, size)
+            matches.extend(self._matching(query, start, stop))
+            start = stop
+            chunk = min(chunk * 2, _MAX_CHUNK)
+        return matches[:limit]
+
+    def top(self, query: ProductQuery, after: tuple[float, int] | None, limit: int) -> list[int]:
+        """Primeiras posições na ordem de `query.sort` (desempate pela posição no log), após o cursor.
+
+        Percorre o índice do campo de ordenação a partir do cursor (dentro da faixa do
+        próprio campo, se houver), filtra cada bloco e para quando a página enche:
+        O(log n + posições visitadas). Se a faixa de outro campo indexado for bem mais
+        estreita (k² <= limit * tamanho da faixa percorrida), avalia só os candidatos
+        dela e escolhe os `limit` primeiros. A ordem decrescente é a crescente ao
+        contrário, inclusive no desempate.
+
+        Args:
+            query: Filtros e ordenação (`sort` obrigatório).
+            after: Valor do campo de ordenação no último item da página anterior e a
+                posição, no log, que separa o que vem depois dele: as entradas com o
+                mesmo valor a partir dela (crescente) ou antes dela (decrescente).
+            limit: Número máximo de posições retornadas.
+
+        Returns:
+            list[int]: Até `limit` posições, na ordem da listagem.
+        """
+        if query.sort is None:
+            raise ValueError("top() requires a sort field")
+        descending = query.sort.startswith("-")
+        field = query.sort.removeprefix("-")
+        ranges = self._ranges(query)
+        low, high = ranges.pop(field, (None, None))
+        if after is not None:
+            if descending:
+                high = after if high is None else min(high, after)
+            else:
+                low = after if low is None else max(low, after)
+
+        index = self.indexes[field]
+        narrowest = self._narrowest(ranges, limit, index.count(low, high))
+        if narrowest is not None:
+            column = self._column(field)
+            rows = sorted(chain.from_iterable(self.indexes[narrowest].chunks(*ranges[narrowest])))
+            rows = self._filter(query, rows)
+            if after is not None:
+                rows = _after(rows, column, after, descending=descending)
+            if descending:
+                return nlargest(limit, reversed(rows), key=column.__getitem__)
+            return nsmallest(limit, rows, key=column.__getitem__)
+
+        matches: list[int] = []
+        for rows in index.chunks(low, high, reverse=descending):
+            matches.extend(self._filter(query, rows))
+            if len(matches) >= limit:
+                break
+        return matches[:limit]
+
+    def _ranges(self, query: ProductQuery) -> dict[str, _Range]:
+        """Faixa de cada campo indexado filtrado pela consulta."""
+        ranges: dict[str, _Range] = {}
+        if query.price_min is not None or query.price_max is not None:
+            ranges["price"] = (_low(query.price_min), _high(query.price_max))
+        if query.in_stock is not None:
+            ranges["stock"] = ((1, 0), None) if query.in_stock else (None, (0, _LAST_POSITION))
+        if query.created_since is not None or query.created_until is not None:
+            since = None if query.created_since is None else to_micros(query.created_since)
+            until = None if query.created_until is None else to_micros(query.created_until)
+            ranges["created_at"] = (_low(since), _high(until))
+        return ranges
+
+    def _narrowest(self, ranges: dict[str, _Range], limit: int, span: int) -> str | None:
+        """Campo da faixa com menos candidatos, se ela compensar (k² <= limit * span)."""
+        counts = {field: self.indexes[field].count(low, high) for field, (low, high) in ranges.items()}
+        if not counts:
+            return None
+        field = min(counts, key=counts.__getitem__)
+        return field if counts[field] ** 2 <= limit * span else None
+
+    def _matching(self, query: ProductQuery, start: int, stop: int) -> Sequence[int]:
+        """Posições vivas de [start, stop) que passam nos filtros da consulta."""
+        rows: Sequence[int] = range(start, stop)
+        if self.dead:
+            rows = list(compress(rows, self.alive[start:stop]))
+        return self._filter(query, rows)
+
+    def _filter(self, query: ProductQuery, rows: Sequence[int]) -> Sequence[int]:
+        """Posições de `rows` (vivas) que passam nos filtros, na mesma ordem.
+
+        Cada filtro é uma passada sobre as posições que sobraram do anterior; o prefixo
+        do nome, o teste mais caro, vem por último.
+        """
+        prices, stocks, created_at, name_keys = self.prices, self.stocks, self.created_at, self.name_keys
+        low, high = query.price_min, query.price_max
+        if low is not None and high is not None:
+            rows = [row for row in rows if low <= prices[row] <= high]
+        elif low is not None:
+            rows = [row for row in rows if prices[row] >= low]
+        elif high is not None:
+            rows = [row for row in rows if prices[row] <= high]
+        if query.in_stock is not None:
+            in_stock = query.in_stock
+            rows = [row for row in rows if (stocks[row] > 0) is in_stock]
+        if query.created_since is not None:
+            since = to_micros(query.created_since)
+            rows = [row for row in rows if created_at[row] >= since]
+        if query.created_until is not None:
+            until = to_micros(query.created_until)
+            rows = [row for row in rows if created_at[row] <= until]
+        if query.name_prefix is not None:
+            prefix = normalize_name_prefix(query.name_prefix)
+            rows = [row for row in rows if name_keys[row].startswith(prefix)]
+        return rows
+
+    def _column(self, field: str) -> array:
+        """Coluna de um campo indexado."""
+        if field == "price":
+            return self.prices
+        if field == "stock":
+            return self.stocks
+        return self.created_at
+
+
+def _low(value: float | None) -> tuple[float, int] | None:
+    """Menor par de um valor (limite inferior inclusivo de uma faixa)."""
+    return None if value is None else (value, 0)
+
+
+def _high(value: float | None) -> tuple[float, int] | None:
+    """Par logo depois de todos os pares de um valor (limite superior inclusivo de uma faixa)."""
+    return None if value is None else (value, _LAST_POSITION)
+
+
+def _after(rows: Sequence[int], column: array, after: tuple[float, int], *, descending: bool) -> list[int]:
+    """Posições que vêm depois do cursor (valor, posição) na ordem da listagem."""
+    value, boundary = after
+    if descending:
+        return [row for row in rows if column[row] < value or (column[row] == value and row < boundary)]
+    return [row for row in rows if column[row] > value or (column[row] == value and row >= boundary)]
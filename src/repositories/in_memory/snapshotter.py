@@ -0,0 +1,153 @@
+import asyncio
+import contextlib
+import time
+from pathlib import Path
+
+from src.repositories.in_memory.in_memory_product_repository import InMemoryProductRepository
+from src.repositories.in_memory.snapshot import read_snapshot, write_snapshot
+from src.repositories.in_memory.wal import WriteAheadLog
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ProductSnapshotter:
+    """Persistência periódica do repositório em memória em um snapshot binário.
+
+    - `start` carrega o snapshot existente (se houver) e agenda os snapshots periódicos.
+    - A cada intervalo, se o catálogo mudou, o retrato é tirado no event loop (cópia de
+      referências) e serializado em uma thread de fundo, com gravação atômica.
+    - `stop` encerra o agendamento e grava um último snapshot.
+
+    Com um WAL, `start` reaplica as entradas posteriores ao snapshot antes de abrir um
+    segmento novo, e cada snapshot compacta o log: o segmento é trocado no mesmo instante
+    do retrato e os anteriores são apagados depois que ele é gravado. O log também é
+    compactado antes do intervalo quando o segmento corrente passa de `compact_bytes`.
+    """
+
+    def __init__(
+        self,
+        repository: InMemoryProductRepository,
+        path: Path,
+        interval_seconds: float = 60.0,
+        wal: WriteAheadLog | None = None,
+        compact_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        """Inicializa o snapshotter.
+
+        Args:
+            repository: Repositório em memória a ser persistido.
+            path: Caminho do arquivo de snapshot.
+            interval_seconds: Intervalo entre snapshots.
+            wal: Write-ahead log do repositório (None desativa).
+            compact_bytes: Tamanho do segmento corrente do WAL que antecipa a compactação.
+        """
+        self.repository = repository
+        self.path = path
+        self.interval_seconds = interval_seconds
+        self.wal = wal
+        self.compact_bytes = compact_bytes
+        self._persisted_version: str | None = None
+        self._write_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Carrega o snapshot e o WAL existentes e inicia os snapshots periódicos."""
+        await self.load()
+        if self.wal is not None:
+            self.wal.open()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="product-snapshotter")
+
+    async def stop(self) -> None:
+        """Encerra os snapshots periódicos e grava o estado final."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.snapshot()
+        if self.wal is not None:
+            await self.wal.close()
+
+    async def load(self) -> int:
+        """Restaura o repositório a partir do snapshot e do WAL, se existirem.
+
+        Returns:
+            int: Produtos lidos do snapshot mais entradas reaplicadas do WAL (0 se não houver nenhum dos dois).
+
+        Raises:
+            SnapshotError: Se o arquivo existir mas estiver corrompido.
+            WalError: Se o WAL estiver corrompido antes do último lote.
+        """
+        started_at = time.perf_counter()
+        snapshot = await asyncio.to_thread(read_snapshot, self.path)
+        if snapshot is not None:
+            self.repository.restore_snapshot(snapshot)
+            logger.info(
+                "Product snapshot loaded",
+                path=str(self.path),
+                products=len(snapshot.entries),
+                duration_ms=round((time.perf_counter() - started_at) * 1000, 2),
+            )
+        loaded = 0 if snapshot is None else len(snapshot.entries)
+        if (wal := self.wal) is not None:
+            started_at = time.perf_counter()
+            after_revision = 0 if snapshot is None else snapshot.revision
+            replayed = await asyncio.to_thread(lambda: list(wal.replay(after_revision)))
+            if replayed:
+                loaded += self.repository.replay_wal(replayed)
+                logger.info(
+                    "Product WAL replayed",
+                    directory=str(wal.directory),
+                    entries=len(replayed),
+                    duration_ms=round((time.perf_counter() - started_at) * 1000, 2),
+                )
+        self._persisted_version = await self.repository.get_catalog_version()
+        return loaded
+
+    async def snapshot(self) -> bool:
+        """Grava um snapshot se o catálogo mudou desde o último.
+
+        Returns:
+            bool: True se um snapshot foi gravado.
+        """
+        async with self._write_lock:
+            version = await self.repository.get_catalog_version()
+            if version == self._persisted_version:
+                return False
+            started_at = time.perf_counter()
+            snapshot = self.repository.capture_snapshot()
+            # Sem suspensão entre o retrato e a troca: o segmento novo só tem escritas posteriores.
+            segment = self.wal.rotate() if self.wal is not None else None
+            size = await asyncio.to_thread(write_snapshot, self.path, snapshot)
+            if self.wal is not None and segment is not None:
+                await asyncio.to_thread(self.wal.drop_segments_before, segment)
+            self._persisted_version = version
+            logger.info(
+                "Product snapshot written",
+                path=str(self.path),
+                products=len(snapshot.entries),
+                bytes=size,
+                duration_ms=round((time.perf_counter() - started_at) * 1000, 2),
+            )
+            return True
+
+    async def _run(self) -> None:
+        """Laço dos snapshots periódicos (uma falha de gravação não encerra o laço).
+
+        Com WAL, o laço acorda com mais frequência para compactar o log assim que o
+        segmento corrente passa de `compact_bytes`, sem esperar o intervalo inteiro.
+        """
+        loop = asyncio.get_running_loop()
+        next_snapshot_at = loop.time() + self.interval_seconds
+        while True:
+            await asyncio.sleep(min(1.0, self.interval_seconds) if self.wal is not None else self.interval_seconds)
+            oversized = self.wal is not None and self.wal.segment_bytes > self.compact_bytes
+            if not oversized and loop.time() < next_snapshot_at:
+                continue
+            next_snapshot_at = loop.time() + self.interval_seconds
+            try:
+                await self.snapshot()
+            except OSError as err:
+                logger.error("Product snapshot failed", path=str(self.path), error=str(err))
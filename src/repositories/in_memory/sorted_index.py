@@ -0,0 +1,203 @@
+"""Índice ordenado em blocos para consultas por faixa no repositório em memória."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator, Sequence
+
+# Tamanho de referência dos blocos: um bloco é dividido ao passar do dobro disso.
+_LOAD = 1000
+
+# Chave do índice: (valor do campo, posição no log de ordem).
+_Key = tuple[float, int]
+
+
+class SortedIndex:
+    """Pares (valor, posição) em ordem crescente, com inserção, remoção e faixas em O(log n).
+
+    Os pares ficam em blocos de até 2 * `_LOAD` itens, cada um com um array de valores e
+    um de posições (16 bytes por par, sem um objeto Python por item). O máximo de cada
+    bloco fica em uma lista à parte, então localizar um par é um `bisect` nos máximos e
+    outro dentro do bloco; inserir ou remover move no máximo um bloco. Uma faixa com k
+    pares custa O(log n + k) e é entregue em fatias de arrays, um bloco por vez.
+
+    Posições iguais não se repetem (cada entrada do log tem uma posição), então o par
+    identifica a entrada e empates de valor seguem a ordem do log.
+    """
+
+    def __init__(self, typecode: str) -> None:
+        """Inicializa o índice vazio.
+
+        Args:
+            typecode: Tipo dos valores no `array` ("d" para float, "q" para inteiros).
+        """
+        self._typecode = typecode
+        self._values: list[array] = []
+        self._positions: list[array] = []
+        self._maxes: list[_Key] = []
+        self._size = 0
+
+    @classmethod
+    def from_column(cls, typecode: str, column: Sequence[float], positions: Sequence[int]) -> "SortedIndex":
+        """Monta o índice de uma vez a partir de uma coluna (uma ordenação, sem inserções).
+
+        Args:
+            typecode: Tipo dos valores no `array`.
+            column: Valores por posição.
+            positions: Posições a indexar, em ordem crescente.
+
+        Returns:
+            SortedIndex: Índice com um par (column[posição], posição) por posição.
+        """
+        index = cls(typecode)
+        # sorted é estável: valores iguais mantêm as posições em ordem crescente.
+        ordered = sorted(positions, key=column.__getitem__)
+        for start in range(0, len(ordered), _LOAD):
+            block = ordered[start : start + _LOAD]
+            index._append_block(array(typecode, map(column.__getitem__, block)), array("q", block))
+        return index
+
+    def __len__(self) -> int:
+        """Quantidade de pares."""
+        return self._size
+
+    def add(self, value: float, position: int) -> None:
+        """Insere um par.
+
+        Args:
+            value: Valor do campo.
+            position: Posição da entrada no log de ordem.
+        """
+        key = (value, position)
+        if not self._maxes:
+            self._append_block(array(self._typecode, [value]), array("q", [position]))
+            return
+        if key > self._maxes[-1]:
+            # Caso comum (criação em ordem crescente, novas posições no fim do log): sem busca.
+            block = len(self._maxes) - 1
+            values, positions = self._values[block], self._positions[block]
+            values.append(value)
+            positions.append(position)
+        else:
+            block = bisect_left(self._maxes, key)
+            values, positions = self._values[block], self._positions[block]
+            offset = self._offset(block, key)
+            values.insert(offset, value)
+            positions.insert(offset, position)
+        self._maxes[block] = (values[-1], positions[-1])
+        self._size += 1
+        if len(values) > 2 * _LOAD:
+            self._split(block)
+
+    def remove(self, value: float, position: int) -> None:
+        """Remove um par.
+
+        Args:
+            value: Valor do campo gravado no índice.
+            position: Posição da entrada no log de ordem.
+
+        Raises:
+            KeyError: Se o par não estiver no índice.
+        """
+        key = (value, position)
+        block = bisect_left(self._maxes, key)
+        if block == len(self._maxes):
+            raise KeyError(key)
+        values, positions = self._values[block], self._positions[block]
+        offset = self._offset(block, key)
+        if offset == len(values) or values[offset] != value or positions[offset] != position:
+            raise KeyError(key)
+        del values[offset]
+        del positions[offset]
+        self._size -= 1
+        if values:
+            self._maxes[block] = (values[-1], positions[-1])
+        else:
+            del self._values[block], self._positions[block], self._maxes[block]
+
+    def count(self, low: _Key | None = None, high: _Key | None = None) -> int:
+        """Quantidade de pares com `low <= par < high`, em O(log n + blocos).
+
+        Args:
+            low: Menor par incluído (None para o início).
+            high: Primeiro par excluído (None para o fim).
+
+        Returns:
+            int: Quantidade de pares na faixa.
+        """
+        end = self._size if high is None else self._rank(high)
+        return max(0, end - self._rank(low))
+
+    def chunks(self, low: _Key | None = None, high: _Key | None = None, *, reverse: bool = False) -> Iterator[array]:
+        """Percorre as posições dos pares com `low <= par < high`, um bloco por vez.
+
+        Args:
+            low: Menor par incluído (None para o início).
+            high: Primeiro par excluído (None para o fim).
+            reverse: Percorre do maior para o menor par.
+
+        Yields:
+            array: Posições de um trecho da faixa, na ordem pedida.
+        """
+        first_block, first_offset = self._locate(low)
+        last_block, last_offset = self._locate(high) if high is not None else (len(self._maxes), 0)
+        blocks = range(first_block, min(last_block, len(self._maxes) - 1) + 1)
+        for block in reversed(blocks) if reverse else blocks:
+            start = first_offset if block == first_block else 0
+            stop = last_offset if block == last_block else len(self._positions[block])
+            if start < stop:
+                positions = self._positions[block][start:stop]
+                yield positions[::-1] if reverse else positions
+
+    def remap(self, new_positions: Sequence[int]) -> None:
+        """Troca cada posição `p` por `new_positions[p]` (após a compactação do log).
+
+        O mapeamento precisa ser crescente nas posições indexadas, o que mantém a ordem dos pares.
+
+        Args:
+            new_positions: Nova posição de cada posição antiga.
+        """
+        self._positions = [array("q", map(new_positions.__getitem__, positions)) for positions in self._positions]
+        self._maxes = [
+            (values[-1], positions[-1]) for values, positions in zip(self._values, self._positions, strict=True)
+        ]
+
+    def _append_block(self, values: array, positions: array) -> None:
+        """Acrescenta um bloco no fim (os pares precisam ser maiores que os já indexados)."""
+        self._values.append(values)
+        self._positions.append(positions)
+        self._maxes.append((values[-1], positions[-1]))
+        self._size += len(values)
+
+    def _split(self, block: int) -> None:
+        """Divide um bloco cheio ao meio."""
+        values, positions = self._values[block], self._positions[block]
+        self._values[block : block + 1] = [values[:_LOAD], values[_LOAD:]]
+        self._positions[block : block + 1] = [positions[:_LOAD], positions[_LOAD:]]
+        self._maxes[block : block + 1] = [
+            (values[_LOAD - 1], positions[_LOAD - 1]),
+            (values[-1], positions[-1]),
+        ]
+
+    def _offset(self, block: int, key: _Key) -> int:
+        """Posição, dentro do bloco, do primeiro par >= `key`."""
+        value, position = key
+        values = self._values[block]
+        start = bisect_left(values, value)
+        if start == len(values) or values[start] != value:
+            return start
+        stop = bisect_right(values, value, start)
+        return bisect_left(self._positions[block], position, start, stop)
+
+    def _locate(self, key: _Key | None) -> tuple[int, int]:
+        """Bloco e posição dentro dele do primeiro par >= `key` (início se None)."""
+        if key is None:
+            return 0, 0
+        block = bisect_left(self._maxes, key)
+        if block == len(self._maxes):
+            return block, 0
+        return block, self._offset(block, key)
+
+    def _rank(self, key: _Key | None) -> int:
+        """Quantidade de pares menores que `key` (0 se None)."""
+        block, offset = self._locate(key)
+        return sum(map(len, self._values[:block])) + offset
@@ -0,0 +1,267 @@
+"""Write-ahead log (WAL) do repositório em memória, com group commit.
+
+Cada escrita aplicada em memória gera uma entrada com o estado resultante do registro
+(PUT com o produto inteiro, ou DELETE com o ID) e a revisão do catálogo após a escrita.
+Reaplicar uma entrada é idempotente, e o boot reaplica, sobre o snapshot, apenas as
+entradas com revisão maior que a dele.
+
+O log é dividido em segmentos (`wal-<n>.log`). A compactação roda junto do snapshot:
+o segmento corrente é trocado no mesmo instante em que o retrato é tirado e, depois que
+o snapshot está gravado, os segmentos anteriores são apagados.
+
+Formato de cada entrada (little-endian): tamanho do payload (u32), CRC32 do payload
+(u32) e payload = operação (u8) + revisão (u64) + registro do produto (PUT) ou ID (DELETE).
+Uma entrada incompleta no fim do log (queda durante a escrita) é descartada no boot.
+"""
+
+import asyncio
+import os
+import re
+import struct
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+from uuid import UUID
+
+from src.models.product import ProductResponse
+from src.repositories.in_memory.snapshot import decode_product_record, encode_product_record
+
+_FRAME = struct.Struct("<II")
+_ENTRY = struct.Struct("<BQ")
+_OP_PUT = 1
+_OP_DELETE = 2
+_SEGMENT_NAME = re.compile(r"^wal-(\d{8})\.log$")
+
+
+class WalError(Exception):
+    """WAL corrompido no meio de um segmento (não é só uma cauda incompleta)."""
+
+
+@dataclass(frozen=True)
+class WalEntry:
+    """Entrada do WAL já decodificada.
+
+    Attributes:
+        revision: Revisão do catálogo após a escrita.
+        product_id: ID do produto afetado.
+        seq: Sequência de ordem do produto (PUT) ou None (DELETE).
+        product: Estado do produto após a escrita (PUT) ou None (DELETE).
+    """
+
+    revision: int
+    product_id: UUID
+    seq: int | None = None
+    product: ProductResponse | None = None
+
+
+class WriteAheadLog:
+    """WAL em segmentos com group commit de fsync.
+
+    `append_*` apenas serializa a entrada em um buffer (síncrono, sem ponto de
+    suspensão, então a ordem do log é a ordem em que as escritas foram aplicadas).
+    `commit` espera até que tudo o que foi anexado antes dele esteja em disco: escritores
+    concorrentes que chegam durante a janela de group commit (ou enquanto um fsync está
+    em andamento) compartilham o mesmo write + fsync, feito em uma thread de fundo.
+    """
+
+    def __init__(self, directory: Path, group_commit_window_seconds: float = 0.002) -> None:
+        """Inicializa o WAL (sem abrir arquivos).
+
+        Args:
+            directory: Diretório dos segmentos.
+            group_commit_window_seconds: Espera antes de cada fsync para agrupar mais
+                escritores no mesmo lote (0 agrupa só quem chegar durante o fsync anterior).
+        """
+        self.directory = directory
+        self.group_commit_window_seconds = group_commit_window_seconds
+        self._file: BinaryIO | None = None
+        self._writing_file: BinaryIO | None = None
+        self._segment = 0
+        self._segment_bytes = 0
+        self._pending = bytearray()
+        self._pending_future: asyncio.Future[None] | None = None
+        self._inflight_future: asyncio.Future[None] | None = None
+        self._flusher: asyncio.Task[None] | None = None
+        self.batches = 0
+        self.entries = 0
+
+    @property
+    def segment_bytes(self) -> int:
+        """Bytes anexados ao segmento corrente (critério de compactação)."""
+        return self._segment_bytes
+
+    def replay(self, after_revision: int) -> Iterator[WalEntry]:
+        """Percorre as entradas de todos os segmentos com revisão maior que `after_revision`.
+
+        Uma cauda incompleta ou corrompida é truncada: os lotes são gravados um de cada
+        vez, então ela só pode ser o último lote, ainda não confirmado quando o processo
+        caiu, e nenhum segmento seguinte pode ter dados.
+
+        Args:
+            after_revision: Revisão já coberta pelo snapshot carregado.
+
+        Yields:
+            WalEntry: Entradas na ordem em que foram aplicadas.
+
+        Raises:
+            WalError: Se houver dados válidos depois de uma entrada corrompida.
+        """
+        segments = self._segments()
+        for index, path in enumerate(segments):
+            data = path.read_bytes()
+            offset = 0
+            while offset < len(data):
+                entry, next_offset = _decode_frame(data, offset)
+                if entry is None:
+                    if any(later.stat().st_size > 0 for later in segments[index + 1 :]):
+                        raise WalError(f"WAL segment {path} is corrupted at offset {offset}")
+                    with path.open("r+b") as file:
+                        file.truncate(offset)
+                    break
+                if entry.revision > after_revision:
+                    yield entry
+                offset = next_offset
+
+    def open(self) -> None:
+        """Abre um segmento novo para anexar entradas."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        segments = self._segments()
+        self._open_segment(_segment_number(segments[-1]) + 1 if segments else 1)
+
+    def rotate(self) -> int:
+        """Passa a anexar em um segmento novo.
+
+        Returns:
+            int: Número do novo segmento; os anteriores podem ser apagados com
+            `drop_segments_before` depois que um snapshot tirado neste instante for gravado.
+        """
+        previous = self._file
+        self._open_segment(self._segment + 1)
+        # Um segmento com gravação em andamento é fechado pelo próprio flusher.
+        if previous is not None and previous is not self._writing_file:
+            previous.close()
+        return self._segment
+
+    def drop_segments_before(self, segment: int) -> None:
+        """Apaga os segmentos anteriores a `segment` (já cobertos por um snapshot)."""
+        for path in self._segments():
+            if _segment_number(path) < segment:
+                path.unlink(missing_ok=True)
+
+    def append_put(self, revision: int, seq: int, product: ProductResponse) -> None:
+        """Anexa o estado de um produto criado ou atualizado."""
+        self._append(_ENTRY.pack(_OP_PUT, revision) + encode_product_record(seq, product))
+
+    def append_delete(self, revision: int, product_id: UUID) -> None:
+        """Anexa a remoção de um produto."""
+        self._append(_ENTRY.pack(_OP_DELETE, revision) + product_id.bytes)
+
+    async def commit(self) -> None:
+        """Espera até que todas as entradas já anexadas estejam gravadas com fsync.
+
+        Raises:
+            OSError: Se a gravação do lote falhar.
+        """
+        if self._pending:
+            future = self._pending_future
+            if self._flusher is None:
+                self._flusher = asyncio.create_task(self._flush_loop(), name="product-wal-flusher")
+        else:
+            future = self._inflight_future
+        if future is not None and not future.done():
+            await asyncio.shield(future)
+        elif future is not None:
+            future.result()
+
+    async def close(self) -> None:
+        """Grava o que estiver pendente e fecha o segmento corrente."""
+        await self.commit()
+        if self._flusher is not None:
+            await self._flusher
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _append(self, payload: bytes) -> None:
+        if self._file is None:
+            raise RuntimeError("WAL is not open")
+        if self._pending_future is None:
+            self._pending_future = asyncio.get_running_loop().create_future()
+        frame = _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+        self._pending += frame
+        self._segment_bytes += len(frame)
+        self.entries += 1
+
+    async def _flush_loop(self) -> None:
+        """Grava lotes enquanto houver entradas pendentes (um write + fsync por lote)."""
+        try:
+            while self._pending:
+                if self.group_commit_window_seconds > 0:
+                    await asyncio.sleep(self.group_commit_window_seconds)
+                data, self._pending = self._pending, bytearray()
+                future, self._pending_future = self._pending_future, None
+                self._inflight_future = future
+                if future is None:
+                    continue
+                file = self._writing_file = self._file
+                if file is None:
+                    future.set_exception(RuntimeError("WAL is not open"))
+                    future.exception()
+                    return
+                try:
+                    await asyncio.to_thread(_write_and_sync, file, data)
+                except OSError as err:
+                    future.set_exception(err)
+                    # Marca a exceção como recuperada mesmo que ninguém mais aguarde o future.
+                    future.exception()
+                else:
+                    future.set_result(None)
+                finally:
+                    self._writing_file = None
+                    self._inflight_future = None
+                    if file is not self._file:
+                        file.close()
+                self.batches += 1
+        finally:
+            self._flusher = None
+
+    def _open_segment(self, segment: int) -> None:
+        self._segment = segment
+        self._file = (self.directory / f"wal-{segment:08d}.log").open("ab")
+        self._segment_bytes = 0
+
+    def _segments(self) -> list[Path]:
+        if not self.directory.exists():
+            return []
+        return sorted(path for path in self.directory.iterdir() if _SEGMENT_NAME.match(path.name))
+
+
+def _segment_number(path: Path) -> int:
+    """Retorna o número de um segmento a partir do nome do arquivo."""
+    match = _SEGMENT_NAME.match(path.name)
+    return int(match.group(1)) if match else 0
+
+
+def _write_and_sync(file: BinaryIO, data: bytearray) -> None:
+    """Grava um lote e faz o fsync (roda na thread de fundo)."""
+    file.write(data)
+    file.flush()
+    os.fsync(file.fileno())
+
+
+def _decode_frame(data: bytes, offset: int) -> tuple[WalEntry | None, int]:
+    """Decodifica a entrada em `offset`; (None, offset) se estiver incompleta ou corrompida."""
+    if offset + _FRAME.size > len(data):
+        return None, offset
+    length, crc = _FRAME.unpack_from(data, offset)
+    start = offset + _FRAME.size
+    payload = data[start : start + length]
+    if len(payload) != length or zlib.crc32(payload) != crc or length < _ENTRY.size:
+        return None, offset
+    op, revision = _ENTRY.unpack_from(payload, 0)
+    if op == _OP_DELETE:
+        return WalEntry(revision=revision, product_id=UUID(bytes=payload[_ENTRY.size :])), start + length
+    seq, product, _ = decode_product_record(payload, _ENTRY.size)
+    return WalEntry(revision=revision, product_id=product.id, seq=seq, product=product), start + length
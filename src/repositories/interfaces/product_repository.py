@@ -1,7 +1,45 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from uuid import UUID
 
-from src.models.product import ProductCreate, ProductResponse, ProductUpdate
+from src.core.exceptions import RepositoryError
+from src.models.product import (
+    ProductBulkUpdate,
+    ProductCreate,
+    ProductPage,
+    ProductQuery,
+    ProductResponse,
+    ProductUpdate,
+)
+
+
+def normalize_product_name(name: str) -> str:
+    """Normaliza um nome de produto para comparação e unicidade.
+
+    Nomes são únicos sem diferenciar maiúsculas/minúsculas nem espaços nas pontas.
+
+    Args:
+        name: Nome do produto.
+
+    Returns:
+        str: Nome normalizado (casefold, sem espaços nas pontas).
+    """
+    return name.strip().casefold()
+
+
+def normalize_name_prefix(prefix: str) -> str:
+    """Normaliza um prefixo de nome para comparar com nomes normalizados.
+
+    Diferente de normalize_product_name, preserva os espaços do fim: "caneta " não
+    deve casar com "canetas".
+
+    Args:
+        prefix: Prefixo informado na busca.
+
+    Returns:
+        str: Prefixo normalizado (casefold, sem espaços no início).
+    """
+    return prefix.lstrip().casefold()
 
 
 class IProductRepository(ABC):
@@ -18,6 +56,90 @@ class IProductRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_page(self, after: str | None = None, limit: int = 100) -> ProductPage:
+        """Busca uma página de produtos a partir de um cursor (paginação keyset).
+
+        A ordem é a mesma de get_all. Inserções e remoções concorrentes não
+        deslocam as páginas seguintes, pois o cursor aponta para uma posição
+        estável, e não para um deslocamento.
+
+        Args:
+            after: Cursor opaco retornado pela página anterior (None para a primeira).
+            limit: Número máximo de produtos a retornar.
+
+        Returns:
+            ProductPage: Produtos da página e o cursor da próxima.
+
+        Raises:
+            InvalidCursorError: Se o cursor for inválido.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_page(self, query: ProductQuery, after: str | None = None, limit: int = 100) -> ProductPage:
+        """Busca uma página de produtos filtrados e ordenados (paginação keyset).
+
+        Os filtros são combinados com E; as faixas (`price_min`/`price_max`,
+        `created_since`/`created_until`) são inclusivas e `name_prefix` compara com o
+        nome normalizado (ver normalize_name_prefix). Sem `sort`, a ordem é a de get_all
+        e o cursor é o mesmo de get_page; com `sort`, o desempate é a ordem de get_all
+        (invertida no decrescente) e o cursor guarda o valor do campo e a posição do
+        último item, então só vale para a mesma ordenação.
+
+        Args:
+            query: Filtros e ordenação.
+            after: Cursor opaco retornado pela página anterior (None para a primeira).
+            limit: Número máximo de produtos a retornar.
+
+        Returns:
+            ProductPage: Produtos da página e o cursor da próxima.
+
+        Raises:
+            InvalidCursorError: Se o cursor for inválido ou de outra ordenação.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count(self, query: ProductQuery) -> int:
+        """Conta os produtos que passam nos filtros de uma consulta.
+
+        Args:
+            query: Filtros, com a mesma semântica de find_page (a ordenação é ignorada).
+
+        Returns:
+            int: Quantidade de produtos.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[ProductResponse]:
+        """Percorre todos os produtos, na ordem de get_all, sem materializar o catálogo.
+
+        Os produtos são lidos em lotes de `batch_size`; a memória usada não depende
+        do tamanho do catálogo.
+
+        Args:
+            batch_size: Quantidade de produtos lida do armazenamento por vez.
+
+        Returns:
+            AsyncIterator[ProductResponse]: Gerador assíncrono de produtos.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_catalog_version(self) -> str:
+        """Retorna um token opaco que muda a cada alteração do catálogo.
+
+        Qualquer create/update/delete bem-sucedido (inclusive em lote) produz um token
+        diferente; sem alterações, o token se mantém. Serve de validador (ETag) para
+        as listagens.
+
+        Returns:
+            str: Versão atual do catálogo.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_id(self, entity_id: UUID) -> ProductResponse | None:
         """Busca um produto por ID.
@@ -32,7 +154,7 @@ class IProductRepository(ABC):
 
     @abstractmethod
     async def get_by_name(self, name: str) -> ProductResponse | None:
-        """Busca um produto por nome.
+        """Busca um produto por nome (comparação via normalize_product_name).
 
         Args:
             name: Nome do produto.
@@ -51,19 +173,33 @@ class IProductRepository(ABC):
 
         Returns:
             ProductResponse: Produto criado.
+
+        Raises:
+            DuplicateValueError: Se já existir um produto com o mesmo nome normalizado.
         """
         raise NotImplementedError
 
     @abstractmethod
-    async def update(self, entity_id: UUID, entity: ProductUpdate) -> ProductResponse | None:
+    async def update(
+        self, entity_id: UUID, entity: ProductUpdate, expected_version: int | None = None
+    ) -> ProductResponse | None:
         """Atualiza um produto existente.
 
+        Com `expected_version`, a atualização é um compare-and-swap: só é aplicada se
+        o produto ainda estiver nessa versão, verificada e gravada atomicamente. Toda
+        atualização aplicada incrementa `version`.
+
         Args:
             entity_id: ID do produto a ser atualizado.
             entity: Dados atualizados do produto.
+            expected_version: Versão que o chamador leu (None atualiza incondicionalmente).
 
         Returns:
             ProductResponse | None: Produto atualizado ou None se não encontrado.
+
+        Raises:
+            DuplicateValueError: Se o novo nome pertencer a outro produto.
+            VersionConflictError: Se a versão atual for diferente de `expected_version`.
         """
         raise NotImplementedError
 
@@ -78,3 +214,49 @@ class IProductRepository(ABC):
             bool: True se deletado, False se não encontrado.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    async def create_many(self, entities: list[ProductCreate]) -> list[ProductResponse | RepositoryError]:
+        """Cria vários produtos em uma única passada.
+
+        Conflitos de nome são verificados contra o repositório e entre os próprios
+        itens do lote (o primeiro item com um nome vence). Itens com falha não
+        impedem a criação dos demais.
+
+        Args:
+            entities: Dados dos produtos a serem criados.
+
+        Returns:
+            list[ProductResponse | RepositoryError]: Um resultado por item, na mesma ordem;
+                o produto criado ou o erro (ex.: DuplicateValueError) daquele item.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_many(self, entities: list[ProductBulkUpdate]) -> list[ProductResponse | RepositoryError]:
+        """Atualiza vários produtos em uma única passada.
+
+        Os itens são aplicados na ordem do lote; um ID repetido no lote é rejeitado.
+        Itens com `expected_version` são compare-and-swap, como em `update`.
+
+        Args:
+            entities: Atualizações, cada uma com o ID do produto alvo.
+
+        Returns:
+            list[ProductResponse | RepositoryError]: Um resultado por item, na mesma ordem;
+                o produto atualizado ou o erro (EntityNotFoundError, DuplicateValueError,
+                InvalidEntityError, VersionConflictError) daquele item.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_many(self, entity_ids: list[UUID]) -> list[bool]:
+        """Deleta vários produtos em uma única passada.
+
+        Args:
+            entity_ids: IDs dos produtos a serem deletados.
+
+        Returns:
+            list[bool]: Para cada ID, True se deletado, False se não encontrado.
+        """
+        raise NotImplementedError
@@ -0,0 +1,4 @@
+from src.repositories.sqlite.connection_pool import SqliteConnectionPool
+from src.repositories.sqlite.sqlite_product_repository import SqliteProductRepository
+
+__all__ = ["SqliteConnectionPool", "SqliteProductRepository"]
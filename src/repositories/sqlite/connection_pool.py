@@ -0,0 +1,134 @@
+import asyncio
+import contextlib
+import sqlite3
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# Statements preparados mantidos por conexão (o sqlite3 reaproveita pelo texto do SQL).
+_STATEMENT_CACHE_SIZE = 128
+
+
+class SqliteConnectionPool:
+    """Pool de conexões SQLite executadas em uma thread pool própria.
+
+    - Leituras usam `size` conexões, cada uma emprestada a uma chamada por vez; em
+      modo WAL, leitores não bloqueiam o escritor nem uns aos outros.
+    - Escritas usam uma única conexão, serializada por um `asyncio.Lock`: o SQLite só
+      admite um escritor por vez, e esperar no event loop é mais barato que disputar o
+      lock do arquivo (`SQLITE_BUSY`) entre threads. Entre processos, a disputa fica com
+      o `busy_timeout`.
+    - Toda chamada roda na thread pool, então o event loop nunca bloqueia em I/O.
+
+    As conexões ficam em autocommit (`isolation_level=None`); as escritas abrem a
+    própria transação (`BEGIN IMMEDIATE`).
+    """
+
+    def __init__(self, path: Path, size: int = 4, busy_timeout_ms: int = 5000) -> None:
+        """Abre as conexões e configura o banco (modo WAL).
+
+        Args:
+            path: Caminho do arquivo do banco.
+            size: Quantidade de conexões de leitura.
+            busy_timeout_ms: Espera máxima pelo lock do arquivo (outro processo escrevendo).
+
+        Raises:
+            ValueError: Se `size` não for positivo.
+        """
+        if size <= 0:
+            raise ValueError(f"size must be positive, got {size}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._busy_timeout_ms = busy_timeout_ms
+        self._executor = ThreadPoolExecutor(max_workers=size + 1, thread_name_prefix="sqlite")
+        self._writer = self._connect()
+        self._writer_lock = asyncio.Lock()
+        self._readers = [self._connect() for _ in range(size)]
+        self._idle_readers: asyncio.Queue[sqlite3.Connection] = asyncio.Queue()
+        for connection in self._readers:
+            self._idle_readers.put_nowait(connection)
+
+    async def read(self, call: Callable[[sqlite3.Connection], T]) -> T:
+        """Executa `call` com uma conexão de leitura emprestada, na thread pool.
+
+        Args:
+            call: Função síncrona que recebe a conexão.
+
+        Returns:
+            T: Resultado de `call`.
+        """
+        connection = await self._idle_readers.get()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, call, connection)
+        finally:
+            self._idle_readers.put_nowait(connection)
+
+    async def write(self, call: Callable[[sqlite3.Connection], T]) -> T:
+        """Executa `call` em uma transação de escrita (`BEGIN IMMEDIATE`), na thread pool.
+
+        A transação é confirmada se `call` retornar e desfeita se levantar exceção. Se a
+        task for cancelada, a thread não é interrompida: o cancelamento só é repassado
+        depois que ela termina (COMMIT ou ROLLBACK), e até lá o lock continua com esta
+        chamada, então nenhuma outra escrita usa a conexão no meio da transação.
+
+        Args:
+            call: Função síncrona que recebe a conexão.
+
+        Returns:
+            T: Resultado de `call`.
+        """
+        async with self._writer_lock:
+            future = asyncio.get_running_loop().run_in_executor(self._executor, _in_transaction, self._writer, call)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                while not future.done():
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await asyncio.wait((future,))
+                raise
+
+    def write_sync(self, call: Callable[[sqlite3.Connection], T]) -> T:
+        """Executa `call` em uma transação de escrita na thread atual (uso no boot, fora do event loop).
+
+        Args:
+            call: Função síncrona que recebe a conexão.
+
+        Returns:
+            T: Resultado de `call`.
+        """
+        return _in_transaction(self._writer, call)
+
+    def close(self) -> None:
+        """Fecha as conexões e encerra a thread pool."""
+        self._executor.shutdown(wait=True)
+        for connection in (self._writer, *self._readers):
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        connection.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
+        connection.execute("PRAGMA journal_mode = WAL")
+        # Em modo WAL, NORMAL só faz fsync nos checkpoints: uma queda do sistema pode
+        # perder as últimas transações, mas nunca corrompe o banco.
+        connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+
+def _in_transaction[R](connection: sqlite3.Connection, call: Callable[[sqlite3.Connection], R]) -> R:
+    """Executa `call` entre BEGIN IMMEDIATE e COMMIT (ROLLBACK em caso de exceção)."""
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        result = call(connection)
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+    return result
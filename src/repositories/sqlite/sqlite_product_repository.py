@@ -0,0 +1,591 @@
+import sqlite3
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+
+from src.core.exceptions import (
+    DuplicateValueError,
+    EntityNotFoundError,
+    InvalidEntityError,
+    RepositoryError,
+    VersionConflictError,
+)
+from src.models.product import (
+    ProductBulkUpdate,
+    ProductCreate,
+    ProductPage,
+    ProductQuery,
+    ProductResponse,
+    ProductUpdate,
+)
+from src.repositories.interfaces.product_repository import (
+    IProductRepository,
+    normalize_name_prefix,
+    normalize_product_name,
+)
+from src.repositories.sqlite.connection_pool import SqliteConnectionPool
+from src.utils.cursor import decode_cursor, decode_sort_cursor, encode_cursor, encode_sort_cursor
+from src.utils.timestamps import from_micros, to_micros
+
+# `seq` é a chave de ordem (keyset): atribuída a partir de catalog_meta.next_seq, nunca
+# reaproveitada, então um cursor continua apontando para a mesma posição após remoções.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id BLOB PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    description TEXT,
+    price REAL NOT NULL,
+    stock INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT
+) WITHOUT ROWID;
+CREATE UNIQUE INDEX IF NOT EXISTS products_seq ON products (seq);
+CREATE UNIQUE INDEX IF NOT EXISTS products_name_key ON products (name_key);
+CREATE INDEX IF NOT EXISTS products_price ON products (price, seq);
+CREATE INDEX IF NOT EXISTS products_stock ON products (stock, seq);
+CREATE INDEX IF NOT EXISTS products_created_at ON products (created_at, seq);
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    singleton INTEGER PRIMARY KEY CHECK (singleton = 1),
+    epoch TEXT NOT NULL,
+    revision INTEGER NOT NULL,
+    next_seq INTEGER NOT NULL
+);
+"""
+_INIT_META = "INSERT OR IGNORE INTO catalog_meta (singleton, epoch, revision, next_seq) VALUES (1, ?, 0, 0)"
+
+_COLUMNS = "id, name, description, price, stock, version, created_at, updated_at"
+_SELECT_BY_ID = f"SELECT {_COLUMNS} FROM products WHERE id = ?"
+_SELECT_BY_NAME = f"SELECT {_COLUMNS} FROM products WHERE name_key = ?"
+_SELECT_OFFSET = f"SELECT {_COLUMNS} FROM products ORDER BY seq LIMIT ? OFFSET ?"
+_SELECT_AFTER = f"SELECT {_COLUMNS}, seq FROM products WHERE seq > ? ORDER BY seq LIMIT ?"
+# Fragmentos de find_page: a consulta é montada só com estes textos constantes (os valores
+# vão sempre como parâmetros), então o número de variantes é pequeno e cada uma fica no
+# cache de statements.
+_SELECT_FIND = f"SELECT {_COLUMNS}, seq FROM products"
+_SELECT_COUNT = "SELECT COUNT(*) FROM products"
+_SORT_COLUMNS = {"price": "price", "stock": "stock", "created_at": "created_at"}
+_SELECT_VERSION = "SELECT epoch, revision FROM catalog_meta"
+_INSERT = (
+    "INSERT INTO products (id, seq, name, name_key, description, price, stock, version, created_at, updated_at)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_UPDATE = (
+    "UPDATE products SET name = ?, name_key = ?, description = ?, price = ?, stock = ?, version = ?, updated_at = ?"
+    " WHERE id = ?"
+)
+_DELETE = "DELETE FROM products WHERE id = ?"
+_NEXT_SEQ = "UPDATE catalog_meta SET next_seq = next_seq + ? RETURNING next_seq"
+_BUMP_REVISION = "UPDATE catalog_meta SET revision = revision + ?"
+
+
+class SqliteProductRepository(IProductRepository):
+    """Repositório de produtos em um arquivo SQLite.
+
+    - Chave primária no ID (16 bytes), índice único no nome normalizado e índice
+      único na sequência de ordem, usado pela paginação keyset (`seq > ?`).
+    - A versão do catálogo (época + revisão) fica no próprio banco e é incrementada na
+      mesma transação de cada escrita: processos diferentes sobre o mesmo arquivo veem
+      o mesmo catálogo e os mesmos ETags.
+    - As consultas são textos SQL constantes, preparados uma vez por conexão e
+      reaproveitados pelo cache de statements do sqlite3.
+    - Os produtos lidos são montados com `model_construct` (os dados foram validados
+      na gravação).
+    """
+
+    def __init__(self, pool: SqliteConnectionPool) -> None:
+        """Inicializa o repositório, criando o esquema se ainda não existir.
+
+        Args:
+            pool: Pool de conexões do banco.
+        """
+        self.pool = pool
+        pool.write_sync(_create_schema)
+
+    def close(self) -> None:
+        """Fecha as conexões do banco."""
+        self.pool.close()
+
+    async def get_by_id(self, entity_id: UUID) -> ProductResponse | None:
+        """Busca um produto por ID.
+
+        Args:
+            entity_id: ID do produto.
+
+        Returns:
+            ProductResponse | None: Produto encontrado ou None.
+        """
+        row = await self.pool.read(lambda connection: connection.execute(_SELECT_BY_ID, (entity_id.bytes,)).fetchone())
+        return None if row is None else _to_product(row)
+
+    async def get_by_name(self, name: str) -> ProductResponse | None:
+        """Busca um produto por nome.
+
+        Args:
+            name: Nome do produto.
+
+        Returns:
+            ProductResponse | None: Produto encontrado ou None.
+        """
+        name_key = normalize_product_name(name)
+        row = await self.pool.read(lambda connection: connection.execute(_SELECT_BY_NAME, (name_key,)).fetchone())
+        return None if row is None else _to_product(row)
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> list[ProductResponse]:
+        """Busca todos os produtos com paginação.
+
+        Args:
+            skip: Número de produtos a pular.
+            limit: Número máximo de produtos a retornar.
+
+        Returns:
+            list[ProductResponse]: Lista de produtos (em ordem de inserção).
+        """
+        rows = await self.pool.read(lambda connection: connection.execute(_SELECT_OFFSET, (limit, skip)).fetchall())
+        return [_to_product(row) for row in rows]
+
+    async def get_page(self, after: str | None = None, limit: int = 100) -> ProductPage:
+        """Busca uma página de produtos a partir de um cursor (paginação keyset).
+
+        A consulta percorre o índice de `seq` a partir do cursor e lê um item a mais
+        para saber se há próxima página.
+
+        Args:
+            after: Cursor opaco retornado pela página anterior (None para a primeira).
+            limit: Número máximo de produtos a retornar.
+
+        Returns:
+            ProductPage: Produtos da página e o cursor da próxima.
+
+        Raises:
+            InvalidCursorError: Se o cursor for inválido.
+        """
+        last_seq = -1 if after is None else decode_cursor(after)
+        rows = await self.pool.read(
+            lambda connection: connection.execute(_SELECT_AFTER, (last_seq, limit + 1)).fetchall()
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1][-1]) if has_more and rows else None
+        return ProductPage(items=[_to_product(row) for row in rows], next_cursor=next_cursor)
+
+    async def find_page(self, query: ProductQuery, after: str | None = None, limit: int = 100) -> ProductPage:
+        """Busca uma página de produtos filtrados e ordenados (paginação keyset).
+
+        Os filtros viram condições do WHERE (o prefixo do nome, uma faixa no índice de
+        `name_key`) e a ordenação um ORDER BY com desempate por `seq`, atendido pelos
+        índices `(coluna, seq)` (percorridos ao contrário no decrescente); o cursor vira
+        a condição de keyset `(coluna, seq) > (valor, seq)` (ou `<`) do último item entregue.
+
+        Args:
+            query: Filtros e ordenação.
+            after: Cursor opaco retornado pela página anterior (None para a primeira).
+            limit: Número máximo de produtos a retornar.
+
+        Returns:
+            ProductPage: Produtos da página e o cursor da próxima.
+
+        Raises:
+            InvalidCursorError: Se o cursor for inválido ou de outra ordenação.
+        """
+        if query.is_default:
+            return await self.get_page(after=after, limit=limit)
+
+        sql, params = _find_statement(query, after, limit + 1)
+        rows = await self.pool.read(lambda connection: connection.execute(sql, params).fetchall())
+        has_more = len(rows) > limit
+        products = [_to_product(row) for row in rows[:limit]]
+        next_cursor = None
+        if has_more:
+            last_seq = rows[limit - 1][-1]
+            if query.sort is None:
+                next_cursor = encode_cursor(last_seq)
+            else:
+                next_cursor = encode_sort_cursor(query.sort, _sort_value(products[-1], query.sort), last_seq)
+        return ProductPage(items=products, next_cursor=next_cursor)
+
+    async def count(self, query: ProductQuery) -> int:
+        """Conta os produtos que passam nos filtros de uma consulta (COUNT com o mesmo WHERE de find_page).
+
+        Args:
+            query: Filtros (a ordenação é ignorada).
+
+        Returns:
+            int: Quantidade de produtos.
+        """
+        conditions, params = _filter_conditions(query)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        (count,) = await self.pool.read(lambda connection: connection.execute(_SELECT_COUNT + where, params).fetchone())
+        return count
+
+    async def get_catalog_version(self) -> str:
+        """Retorna um token opaco que muda a cada alteração do catálogo.
+
+        Returns:
+            str: Versão atual do catálogo.
+        """
+        epoch, revision = await self.pool.read(lambda connection: connection.execute(_SELECT_VERSION).fetchone())
+        return f"{epoch}-{revision}"
+
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[ProductResponse]:
+        """Percorre todos os produtos, na ordem de get_all, em páginas keyset.
+
+        Args:
+            batch_size: Quantidade de produtos lida por consulta.
+
+        Yields:
+            ProductResponse: Próximo produto do catálogo.
+        """
+        after: str | None = None
+        while True:
+            page = await self.get_page(after=after, limit=batch_size)
+            for product in page.items:
+                yield product
+            if page.next_cursor is None:
+                return
+            after = page.next_cursor
+
+    async def create(self, entity: ProductCreate) -> ProductResponse:
+        """Cria um novo produto.
+
+        Args:
+            entity: Dados do produto a ser criado.
+
+        Returns:
+            ProductResponse: Produto criado.
+
+        Raises:
+            DuplicateValueError: Se já existir um produto com o mesmo nome.
+        """
+        products = _new_products([entity])
+
+        def insert(connection: sqlite3.Connection) -> None:
+            _insert(connection, products[0], _reserve_seqs(connection, 1))
+            connection.execute(_BUMP_REVISION, (1,))
+
+        try:
+            await self.pool.write(insert)
+        except sqlite3.IntegrityError as err:
+            raise DuplicateValueError("name", entity.name) from err
+        return products[0]
+
+    async def update(
+        self, entity_id: UUID, entity: ProductUpdate, expected_version: int | None = None
+    ) -> ProductResponse | None:
+        """Atualiza um produto existente.
+
+        A leitura da versão atual e a gravação acontecem na mesma transação de escrita,
+        então o compare-and-swap é atômico também entre processos.
+
+        Args:
+            entity_id: ID do produto a ser atualizado.
+            entity: Dados atualizados do produto.
+            expected_version: Versão que o chamador leu (None atualiza incondicionalmente).
+
+        Returns:
+            ProductResponse | None: Produto atualizado ou None se não encontrado.
+
+        Raises:
+            DuplicateValueError: Se o novo nome pertencer a outro produto.
+            VersionConflictError: Se a versão atual for diferente de `expected_version`.
+        """
+        update_data = entity.model_dump(exclude_unset=True)
+
+        def apply(connection: sqlite3.Connection) -> ProductResponse | None:
+            updated = _apply_update(connection, entity_id, update_data, expected_version)
+            if updated is not None:
+                connection.execute(_BUMP_REVISION, (1,))
+            return updated
+
+        return await self.pool.write(apply)
+
+    async def delete(self, entity_id: UUID) -> bool:
+        """Deleta um produto.
+
+        Args:
+            entity_id: ID do produto a ser deletado.
+
+        Returns:
+            bool: True se deletado, False se não encontrado.
+        """
+        return (await self.delete_many([entity_id]))[0]
+
+    async def create_many(self, entities: list[ProductCreate]) -> list[ProductResponse | RepositoryError]:
+        """Cria vários produtos em uma única transação.
+
+        Um item com nome duplicado (no banco ou em um item anterior do lote) falha
+        sozinho: no SQLite, a violação desfaz apenas o próprio INSERT.
+
+        Args:
+            entities: Dados dos produtos a serem criados.
+
+        Returns:
+            list[ProductResponse | RepositoryError]: Um resultado por item, na mesma ordem.
+        """
+        products = _new_products(entities)
+
+        def insert_all(connection: sqlite3.Connection) -> list[ProductResponse | RepositoryError]:
+            first_seq = _reserve_seqs(connection, len(products))
+            results: list[ProductResponse | RepositoryError] = []
+            for offset, product in enumerate(products):
+                try:
+                    _insert(connection, product, first_seq + offset)
+                except sqlite3.IntegrityError:
+                    results.append(DuplicateValueError("name", product.name))
+                else:
+                    results.append(product)
+            _bump_revision(connection, results)
+            return results
+
+        return await self.pool.write(insert_all)
+
+    async def update_many(self, entities: list[ProductBulkUpdate]) -> list[ProductResponse | RepositoryError]:
+        """Atualiza vários produtos em uma única transação, na ordem do lote.
+
+        Args:
+            entities: Atualizações, cada uma com o ID do produto alvo.
+
+        Returns:
+            list[ProductResponse | RepositoryError]: Um resultado por item, na mesma ordem.
+        """
+        items = [
+            (
+                entity.id,
+                entity.model_dump(exclude_unset=True, exclude={"id", "expected_version"}),
+                entity.expected_version,
+            )
+            for entity in entities
+        ]
+
+        def apply_all(connection: sqlite3.Connection) -> list[ProductResponse | RepositoryError]:
+            results: list[ProductResponse | RepositoryError] = []
+            seen_ids: set[UUID] = set()
+            for entity_id, update_data, expected_version in items:
+                if entity_id in seen_ids:
+                    results.append(DuplicateValueError("id", entity_id))
+                    continue
+                seen_ids.add(entity_id)
+                try:
+                    updated = _apply_update(connection, entity_id, update_data, expected_version)
+                except (DuplicateValueError, VersionConflictError) as err:
+                    results.append(err)
+                except ValidationError as err:
+                    results.append(InvalidEntityError(str(err)))
+                else:
+                    results.append(updated if updated is not None else EntityNotFoundError(entity_id))
+            _bump_revision(connection, results)
+            return results
+
+        return await self.pool.write(apply_all)
+
+    async def delete_many(self, entity_ids: list[UUID]) -> list[bool]:
+        """Deleta vários produtos em uma única transação.
+
+        Args:
+            entity_ids: IDs dos produtos a serem deletados.
+
+        Returns:
+            list[bool]: Para cada ID, True se deletado, False se não encontrado.
+        """
+
+        def delete_all(connection: sqlite3.Connection) -> list[bool]:
+            results = [connection.execute(_DELETE, (entity_id.bytes,)).rowcount > 0 for entity_id in entity_ids]
+            _bump_revision(connection, results)
+            return results
+
+        return await self.pool.write(delete_all)
+
+
+def _create_schema(connection: sqlite3.Connection) -> None:
+    """Cria as tabelas e índices e a linha de metadados do catálogo."""
+    for statement in _SCHEMA.split(";"):
+        if statement.strip():
+            connection.execute(statement)
+    connection.execute(_INIT_META, (uuid4().hex[:12],))
+
+
+def _new_products(entities: list[ProductCreate]) -> list[ProductResponse]:
+    """Monta os produtos a inserir (ID e data de criação atribuídos fora da transação)."""
+    now = datetime.now(UTC)
+    return [ProductResponse(**entity.model_dump(), id=uuid4(), created_at=now, updated_at=None) for entity in entities]
+
+
+def _reserve_seqs(connection: sqlite3.Connection, count: int) -> int:
+    """Reserva `count` sequências de ordem consecutivas e retorna a primeira."""
+    (next_seq,) = connection.execute(_NEXT_SEQ, (count,)).fetchone()
+    return next_seq - count
+
+
+def _bump_revision(connection: sqlite3.Connection, results: list) -> None:
+    """Incrementa a revisão do catálogo pelo número de itens aplicados no lote."""
+    applied = sum(1 for result in results if result is True or isinstance(result, ProductResponse))
+    if applied:
+        connection.execute(_BUMP_REVISION, (applied,))
+
+
+def _insert(connection: sqlite3.Connection, product: ProductResponse, seq: int) -> None:
+    """Insere um produto.
+
+    Raises:
+        sqlite3.IntegrityError: Se o nome normalizado já existir.
+    """
+    connection.execute(
+        _INSERT,
+        (
+            product.id.bytes,
+            seq,
+            product.name,
+            normalize_product_name(product.name),
+            product.description,
+            product.price,
+            product.stock,
+            product.version,
+            product.created_at.isoformat(),
+            None,
+        ),
+    )
+
+
+def _apply_update(
+    connection: sqlite3.Connection, entity_id: UUID, update_data: dict, expected_version: int | None
+) -> ProductResponse | None:
+    """Aplica uma atualização parcial dentro da transação corrente.
+
+    Raises:
+        DuplicateValueError: Se o novo nome pertencer a outro produto.
+        VersionConflictError: Se a versão atual for diferente de `expected_version`.
+        ValidationError: Se o produto resultante for inválido.
+    """
+    row = connection.execute(_SELECT_BY_ID, (entity_id.bytes,)).fetchone()
+    if row is None:
+        return None
+    product = _to_product(row)
+    if expected_version is not None and product.version != expected_version:
+        raise VersionConflictError(entity_id, expected_version, product.version)
+
+    if update_data:
+        ProductResponse(**{**product.model_dump(), **update_data})
+    updated = product.model_copy(update=update_data)
+    updated.updated_at = datetime.now(UTC)
+    updated.version = product.version + 1
+    try:
+        connection.execute(
+            _UPDATE,
+            (
+                updated.name,
+                normalize_product_name(updated.name),
+                updated.description,
+                updated.price,
+                updated.stock,
+                updated.version,
+                updated.updated_at.isoformat(),
+                entity_id.bytes,
+            ),
+        )
+    except sqlite3.IntegrityError as err:
+        raise DuplicateValueError("name", update_data.get("name")) from err
+    return updated
+
+
+def _find_statement(query: ProductQuery, after: str | None, limit: int) -> tuple[str, list[object]]:
+    """Monta o SQL e os parâmetros de find_page.
+
+    Raises:
+        InvalidCursorError: Se o cursor for inválido ou de outra ordenação.
+    """
+    conditions, params = _filter_conditions(query)
+    if query.sort is None:
+        order = "seq"
+        if after is not None:
+            conditions.append("seq > ?")
+            params.append(decode_cursor(after))
+    else:
+        descending = query.sort.startswith("-")
+        column = _SORT_COLUMNS[query.sort.removeprefix("-")]
+        # O decrescente é o crescente ao contrário (inclusive no desempate), então o
+        # mesmo índice (coluna, seq) atende as duas direções.
+        order = f"{column} DESC, seq DESC" if descending else f"{column}, seq"
+        if after is not None:
+            value, seq = decode_sort_cursor(after, query.sort)
+            bound: object = from_micros(int(value)).isoformat() if column == "created_at" else value
+            comparison = "<" if descending else ">"
+            conditions.append(f"({column} {comparison} ? OR ({column} = ? AND seq {comparison} ?))")
+            params.extend((bound, bound, seq))
+
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    params.append(limit)
+    return f"{_SELECT_FIND}{where} ORDER BY {order} LIMIT ?", params
+
+
+def _filter_conditions(query: ProductQuery) -> tuple[list[str], list[object]]:
+    """Condições do WHERE e parâmetros dos filtros de uma consulta."""
+    conditions: list[str] = []
+    params: list[object] = []
+    if query.price_min is not None:
+        conditions.append("price >= ?")
+        params.append(query.price_min)
+    if query.price_max is not None:
+        conditions.append("price <= ?")
+        params.append(query.price_max)
+    if query.in_stock is not None:
+        conditions.append("stock > 0" if query.in_stock else "stock = 0")
+    if query.name_prefix is not None:
+        prefix = normalize_name_prefix(query.name_prefix)
+        conditions.append("name_key >= ?")
+        params.append(prefix)
+        upper_bound = _prefix_upper_bound(prefix)
+        if upper_bound is not None:
+            conditions.append("name_key < ?")
+            params.append(upper_bound)
+    # created_at é gravado em ISO 8601 UTC, que ordena como texto na mesma ordem dos instantes.
+    if query.created_since is not None:
+        conditions.append("created_at >= ?")
+        params.append(from_micros(to_micros(query.created_since)).isoformat())
+    if query.created_until is not None:
+        conditions.append("created_at <= ?")
+        params.append(from_micros(to_micros(query.created_until)).isoformat())
+    return conditions, params
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Menor texto maior que todos os que começam com `prefix` (None se não houver limite).
+
+    O SQLite compara TEXT byte a byte em UTF-8, que segue a ordem dos code points.
+    """
+    while prefix:
+        following = ord(prefix[-1]) + 1
+        if following == 0xD800:
+            following = 0xE000  # surrogates não são codificáveis em UTF-8
+        if following <= 0x10FFFF:
+            return prefix[:-1] + chr(following)
+        prefix = prefix[:-1]
+    return None
+
+
+def _sort_value(product: ProductResponse, sort: str) -> float:
+    """Valor do campo de ordenação guardado no cursor (`created_at` em µs desde a época)."""
+    field = sort.removeprefix("-")
+    if field == "price":
+        return product.price
+    if field == "stock":
+        return product.stock
+    return to_micros(product.created_at)
+
+
+def _to_product(row: tuple) -> ProductResponse:
+    """Monta um produto a partir de uma linha (sem validação: os dados foram validados na gravação)."""
+    raw_id, name, description, price, stock, version, created_at, updated_at = row[:8]
+    return ProductResponse.model_construct(
+        id=UUID(bytes=raw_id),
+        name=name,
+        description=description,
+        price=price,
+        stock=stock,
+        version=version,
+        created_at=datetime.fromisoformat(created_at),
+        updated_at=None if updated_at is None else datetime.fromisoformat(updated_at),
+    )
@@ -0,0 +1,14 @@
+from src.repositories.wrappers.cached_product_repository import CachedProductRepository
+from src.repositories.wrappers.forwarding_product_repository import ForwardingProductRepository
+from src.repositories.wrappers.instrumented_product_repository import InstrumentedProductRepository
+from src.repositories.wrappers.json_cached_product_repository import JsonCachedProductRepository, ProductJsonCache
+from src.repositories.wrappers.single_flight_product_repository import SingleFlightProductRepository
+
+__all__ = [
+    "CachedProductRepository",
+    "ForwardingProductRepository",
+    "InstrumentedProductRepository",
+    "JsonCachedProductRepository",
+    "ProductJsonCache",
+    "SingleFlightProductRepository",
+]
@@ -0,0 +1,246 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core.exceptions import RepositoryError
+from src.core.metrics import PRODUCT_CACHE_EVICTIONS_TOTAL, PRODUCT_CACHE_REQUESTS_TOTAL
+from src.models.product import ProductBulkUpdate, ProductCreate, ProductResponse, ProductUpdate
+from src.repositories.interfaces.product_repository import IProductRepository, normalize_product_name
+from src.repositories.wrappers.forwarding_product_repository import ForwardingProductRepository
+
+# Chaves do cache: ("id", UUID) ou ("name", nome normalizado)
+_CacheKey = tuple[str, UUID | str]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Contadores do cache de produtos.
+
+    Attributes:
+        hits: Leituras atendidas pelo cache (inclui hits negativos).
+        misses: Leituras repassadas ao repositório.
+        evictions: Entradas removidas por LRU (capacidade esgotada).
+        size: Entradas em cache neste momento.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class CachedProductRepository(ForwardingProductRepository):
+    """Cache read-through de `get_by_id` e `get_by_name`, com TTL e despejo LRU.
+
+    - Capacidade limitada: ao exceder `max_entries`, a entrada usada há mais tempo sai.
+    - Cada entrada expira após `ttl_seconds`; buscas sem resultado (None) também são
+      guardadas, por `negative_ttl_seconds`, para que IDs/nomes inexistentes não
+      martelem o repositório.
+    - Toda escrita que passa pelo cache (create/update/delete e os lotes) invalida as
+      entradas afetadas, inclusive entradas negativas do novo nome.
+
+    Uma leitura que se sobrepõe a uma escrita não grava seu resultado no cache (a época
+    de escrita muda no início e no fim de cada escrita), então um valor antigo nunca
+    sobrescreve a invalidação.
+    """
+
+    def __init__(
+        self,
+        inner: IProductRepository,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 60.0,
+        negative_ttl_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Inicializa o cache.
+
+        Args:
+            inner: Repositório que efetivamente executa as operações.
+            max_entries: Quantidade máxima de entradas (positivas + negativas).
+            ttl_seconds: Validade de uma entrada com produto.
+            negative_ttl_seconds: Validade de uma entrada "não encontrado" (0 desativa).
+            clock: Relógio monotônico (injetável para testes).
+        """
+        super().__init__(inner)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock
+        # chave -> (produto ou None, instante de expiração); a ordem do dict é a ordem LRU.
+        self._entries: OrderedDict[_CacheKey, tuple[ProductResponse | None, float]] = OrderedDict()
+        # ID -> chave de nome em cache que aponta para ele (para invalidar por ID).
+        self._name_key_by_id: dict[UUID, _CacheKey] = {}
+        self._write_epoch = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._hit_counter = PRODUCT_CACHE_REQUESTS_TOTAL.labels("hit")
+        self._miss_counter = PRODUCT_CACHE_REQUESTS_TOTAL.labels("miss")
+        self._eviction_counter = PRODUCT_CACHE_EVICTIONS_TOTAL.labels()
+
+    def stats(self) -> CacheStats:
+        """Retorna os contadores do cache.
+
+        Returns:
+            CacheStats: Hits, misses, despejos e tamanho atual.
+        """
+        return CacheStats(hits=self._hits, misses=self._misses, evictions=self._evictions, size=len(self._entries))
+
+    async def get_by_id(self, entity_id: UUID) -> ProductResponse | None:
+        """Busca um produto por ID, pelo cache quando possível.
+
+        Args:
+            entity_id: ID do produto.
+
+        Returns:
+            ProductResponse | None: Produto encontrado ou None.
+        """
+        key: _CacheKey = ("id", entity_id)
+        found, product = self._lookup(key)
+        if found:
+            return product
+
+        epoch = self._write_epoch
+        product = await self._inner.get_by_id(entity_id)
+        if epoch == self._write_epoch:
+            self._store(key, product)
+        return product
+
+    async def get_by_name(self, name: str) -> ProductResponse | None:
+        """Busca um produto por nome, pelo cache quando possível.
+
+        Args:
+            name: Nome do produto.
+
+        Returns:
+            ProductResponse | None: Produto encontrado ou None.
+        """
+        key: _CacheKey = ("name", normalize_product_name(name))
+        found, product = self._lookup(key)
+        if found:
+            return product
+
+        epoch = self._write_epoch
+        product = await self._inner.get_by_name(name)
+        if epoch == self._write_epoch:
+            self._store(key, product)
+            if product is not None:
+                self._name_key_by_id[product.id] = key
+        return product
+
+    async def create(self, entity: ProductCreate) -> ProductResponse:
+        """Cria um novo produto e invalida o "não encontrado" do nome."""
+        self._begin_write()
+        product = await self._inner.create(entity)
+        self._invalidate_product(product)
+        return product
+
+    async def update(
+        self, entity_id: UUID, entity: ProductUpdate, expected_version: int | None = None
+    ) -> ProductResponse | None:
+        """Atualiza um produto existente e invalida suas entradas."""
+        self._begin_write()
+        try:
+            product = await self._inner.update(entity_id, entity, expected_version)
+        finally:
+            self._invalidate_id(entity_id)
+        if product is not None:
+            self._invalidate_product(product)
+        return product
+
+    async def delete(self, entity_id: UUID) -> bool:
+        """Deleta um produto e invalida suas entradas."""
+        self._begin_write()
+        try:
+            return await self._inner.delete(entity_id)
+        finally:
+            self._invalidate_id(entity_id)
+
+    async def create_many(self, entities: list[ProductCreate]) -> list[ProductResponse | RepositoryError]:
+        """Cria vários produtos e invalida o "não encontrado" de cada nome criado."""
+        self._begin_write()
+        results = await self._inner.create_many(entities)
+        for result in results:
+            if isinstance(result, ProductResponse):
+                self._invalidate_product(result)
+        return results
+
+    async def update_many(self, entities: list[ProductBulkUpdate]) -> list[ProductResponse | RepositoryError]:
+        """Atualiza vários produtos e invalida as entradas de cada um."""
+        self._begin_write()
+        try:
+            results = await self._inner.update_many(entities)
+        finally:
+            for entity in entities:
+                self._invalidate_id(entity.id)
+        for result in results:
+            if isinstance(result, ProductResponse):
+                self._invalidate_product(result)
+        return results
+
+    async def delete_many(self, entity_ids: list[UUID]) -> list[bool]:
+        """Deleta vários produtos e invalida as entradas de cada um."""
+        self._begin_write()
+        try:
+            return await self._inner.delete_many(entity_ids)
+        finally:
+            for entity_id in entity_ids:
+                self._invalidate_id(entity_id)
+
+    def _lookup(self, key: _CacheKey) -> tuple[bool, ProductResponse | None]:
+        """Retorna (encontrado, produto) e atualiza a ordem LRU e os contadores."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            product, expires_at = entry
+            if self._clock() < expires_at:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                self._hit_counter.inc()
+                return True, product
+            self._discard(key)
+        self._misses += 1
+        self._miss_counter.inc()
+        return False, None
+
+    def _store(self, key: _CacheKey, product: ProductResponse | None) -> None:
+        """Guarda uma entrada (positiva ou negativa) e aplica o limite de capacidade."""
+        ttl = self.ttl_seconds if product is not None else self.negative_ttl_seconds
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        self._entries[key] = (product, self._clock() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted_key, (evicted_product, _) = self._entries.popitem(last=False)
+            self._forget_name_key(evicted_key, evicted_product)
+            self._evictions += 1
+            self._eviction_counter.inc()
+
+    def _discard(self, key: _CacheKey) -> None:
+        """Remove uma entrada, se existir."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._forget_name_key(key, entry[0])
+
+    def _forget_name_key(self, key: _CacheKey, product: ProductResponse | None) -> None:
+        """Remove o vínculo ID -> chave de nome de uma entrada de nome que saiu do cache."""
+        if key[0] == "name" and product is not None and self._name_key_by_id.get(product.id) == key:
+            del self._name_key_by_id[product.id]
+
+    def _begin_write(self) -> None:
+        """Marca o início de uma escrita: leituras em andamento não gravam no cache."""
+        self._write_epoch += 1
+
+    def _invalidate_id(self, entity_id: UUID) -> None:
+        """Invalida a entrada do ID e a entrada do nome que apontava para ele."""
+        self._write_epoch += 1
+        self._entries.pop(("id", entity_id), None)
+        name_key = self._name_key_by_id.pop(entity_id, None)
+        if name_key is not None:
+            self._entries.pop(name_key, None)
+
+    def _invalidate_product(self, product: ProductResponse) -> None:
+        """Invalida as entradas do produto, inclusive um "não encontrado" do seu nome atual."""
+        self._invalidate_id(product.id)
+        self._discard(("name", normalize_product_name(product.name)))
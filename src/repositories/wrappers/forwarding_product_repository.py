@@ -0,0 +1,92 @@
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+from src.core.exceptions import RepositoryError
+from src.models.product import (
+    ProductBulkUpdate,
+    ProductCreate,
+    ProductPage,
+    ProductQuery,
+    ProductResponse,
+    ProductUpdate,
+)
+from src.repositories.interfaces.product_repository import IProductRepository
+
+
+class ForwardingProductRepository(IProductRepository):
+    """Repositório que repassa todas as operações para outro repositório.
+
+    Base dos decoradores de repositório (métricas, cache, etc.): a subclasse sobrescreve
+    só as operações que lhe interessam e herda o repasse das demais.
+    """
+
+    def __init__(self, inner: IProductRepository) -> None:
+        """Inicializa o repositório.
+
+        Args:
+            inner: Repositório que efetivamente executa as operações.
+        """
+        self._inner = inner
+
+    @property
+    def inner(self) -> IProductRepository:
+        """Repositório decorado."""
+        return self._inner
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> list[ProductResponse]:
+        """Repassa `get_all` ao repositório decorado."""
+        return await self._inner.get_all(skip=skip, limit=limit)
+
+    async def get_page(self, after: str | None = None, limit: int = 100) -> ProductPage:
+        """Repassa `get_page` ao repositório decorado."""
+        return await self._inner.get_page(after=after, limit=limit)
+
+    async def find_page(self, query: ProductQuery, after: str | None = None, limit: int = 100) -> ProductPage:
+        """Repassa `find_page` ao repositório decorado."""
+        return await self._inner.find_page(query, after=after, limit=limit)
+
+    async def count(self, query: ProductQuery) -> int:
+        """Repassa `count` ao repositório decorado."""
+        return await self._inner.count(query)
+
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[ProductResponse]:
+        """Repassa `iter_all` ao repositório decorado."""
+        return self._inner.iter_all(batch_size=batch_size)
+
+    async def get_catalog_version(self) -> str:
+        """Repassa `get_catalog_version` ao repositório decorado."""
+        return await self._inner.get_catalog_version()
+
+    async def get_by_id(self, entity_id: UUID) -> ProductResponse | None:
+        """Repassa `get_by_id` ao repositório decorado."""
+        return await self._inner.get_by_id(entity_id)
+
+    async def get_by_name(self, name: str) -> ProductResponse | None:
+        """Repassa `get_by_name` ao repositório decorado."""
+        return await self._inner.get_by_name(name)
+
+    async def create(self, entity: ProductCreate) -> ProductResponse:
+        """Repassa `create` ao repositório decorado."""
+        return await self._inner.create(entity)
+
+    async def update(
+        self, entity_id: UUID, entity: ProductUpdate, expected_version: int | None = None
+    ) -> ProductResponse | None:
+        """Repassa `update` ao repositório decorado."""
+        return await self._inner.update(entity_id, entity, expected_version)
+
+    async def delete(self, entity_id: UUID) -> bool:
+        """Repassa `delete` ao repositório decorado."""
+        return await self._inner.delete(entity_id)
+
+    async def create_many(self, entities: list[ProductCreate]) -> list[ProductResponse | RepositoryError]:
+        """Repassa `create_many` ao repositório decorado."""
+        return await self._inner.create_many(entities)
+
+    async def update_many(self, entities: list[ProductBulkUpdate]) -> list[ProductResponse | RepositoryError]:
+        """Repassa `update_many` ao repositório decorado."""
+        return await self._inner.update_many(entities)
+
+    async def delete_many(self, entity_ids: list[UUID]) -> list[bool]:
+        """Repassa `delete_many` ao repositório decorado."""
+        return await self._inner.delete_many(entity_ids)
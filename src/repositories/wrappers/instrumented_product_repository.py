@@ -0,0 +1,140 @@
+import time
+from collections.abc import AsyncIterator, Awaitable
+from typing import TypeVar
+from uuid import UUID
+
+from src.core.exceptions import RepositoryError
+from src.core.metrics import REPOSITORY_OPERATION_DURATION_SECONDS, REPOSITORY_OPERATION_ERRORS_TOTAL
+from src.core.metrics.registry import CounterChild, HistogramChild
+from src.models.product import (
+    ProductBulkUpdate,
+    ProductCreate,
+    ProductPage,
+    ProductQuery,
+    ProductResponse,
+    ProductUpdate,
+)
+from src.repositories.interfaces.product_repository import IProductRepository
+from src.repositories.wrappers.forwarding_product_repository import ForwardingProductRepository
+
+T = TypeVar("T")
+
+_OPERATIONS = (
+    "get_all",
+    "get_page",
+    "find_page",
+    "count",
+    "iter_all",
+    "get_catalog_version",
+    "get_by_id",
+    "get_by_name",
+    "create",
+    "update",
+    "delete",
+    "create_many",
+    "update_many",
+    "delete_many",
+)
+
+
+class InstrumentedProductRepository(ForwardingProductRepository):
+    """Repositório que mede a latência e conta as falhas de cada operação do repositório decorado.
+
+    Os filhos das métricas (um por operação) são resolvidos na construção, então cada
+    chamada custa duas leituras de relógio e um `observe`, sem buscas por label.
+    """
+
+    def __init__(self, inner: IProductRepository) -> None:
+        """Inicializa o repositório.
+
+        Args:
+            inner: Repositório que efetivamente executa as operações.
+        """
+        super().__init__(inner)
+        repository = type(inner).__name__
+        self._durations: dict[str, HistogramChild] = {
+            operation: REPOSITORY_OPERATION_DURATION_SECONDS.labels(repository, operation) for operation in _OPERATIONS
+        }
+        self._errors: dict[str, CounterChild] = {
+            operation: REPOSITORY_OPERATION_ERRORS_TOTAL.labels(repository, operation) for operation in _OPERATIONS
+        }
+
+    async def _timed(self, operation: str, call: Awaitable[T]) -> T:
+        start = time.perf_counter()
+        try:
+            return await call
+        except Exception:
+            self._errors[operation].inc()
+            raise
+        finally:
+            self._durations[operation].observe(time.perf_counter() - start)
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> list[ProductResponse]:
+        """Busca todos os produtos com paginação (medido)."""
+        return await self._timed("get_all", self._inner.get_all(skip=skip, limit=limit))
+
+    async def get_page(self, after: str | None = None, limit: int = 100) -> ProductPage:
+        """Busca uma página de produtos a partir de um cursor (medido)."""
+        return await self._timed("get_page", self._inner.get_page(after=after, limit=limit))
+
+    async def find_page(self, query: ProductQuery, after: str | None = None, limit: int = 100) -> ProductPage:
+        """Busca uma página de produtos filtrados e ordenados (medido)."""
+        return await self._timed("find_page", self._inner.find_page(query, after=after, limit=limit))
+
+    async def count(self, query: ProductQuery) -> int:
+        """Conta os produtos que passam nos filtros (medido)."""
+        return await self._timed("count", self._inner.count(query))
+
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[ProductResponse]:
+        """Percorre todos os produtos (medido do início ao fim da iteração).
+
+        O tempo inclui as pausas do consumidor entre os itens, então mede a duração da
+        varredura completa e não só o trabalho do repositório.
+        """
+        start = time.perf_counter()
+        try:
+            async for product in self._inner.iter_all(batch_size=batch_size):
+                yield product
+        except Exception:
+            self._errors["iter_all"].inc()
+            raise
+        finally:
+            self._durations["iter_all"].observe(time.perf_counter() - start)
+
+    async def get_catalog_version(self) -> str:
+        """Retorna a versão do catálogo (medido)."""
+        return await self._timed("get_catalog_version", self._inner.get_catalog_version())
+
+    async def get_by_id(self, entity_id: UUID) -> ProductResponse | None:
+        """Busca um produto por ID (medido)."""
+        return await self._timed("get_by_id", self._inner.get_by_id(entity_id))
+
+    async def get_by_name(self, name: str) -> ProductResponse | None:
+        """Busca um produto por nome (medido)."""
+        return await self._timed("get_by_name", self._inner.get_by_name(name))
+
+    async def create(self, entity: ProductCreate) -> ProductResponse:
+        """Cria um novo produto (medido)."""
+        return await self._timed("create", self._inner.create(entity))
+
+    async def update(
+        self, entity_id: UUID, entity: ProductUpdate, expected_version: int | None = None
+    ) -> ProductResponse | None:
+        """Atualiza um produto existente (medido)."""
+        return await self._timed("update", self._inner.update(entity_id, entity, expected_version))
+
+    async def delete(self, entity_id: UUID) -> bool:
+        """Deleta um produto (medido)."""
+        return await self._timed("delete", self._inner.delete(entity_id))
+
+    async def create_many(self, entities: list[ProductCreate]) -> list[ProductResponse | RepositoryError]:
+        """Cria vários produtos (medido)."""
+        return await self._timed("create_many", self._inner.create_many(entities))
+
+    async def update_many(self, entities: list[ProductBulkUpdate]) -> list[ProductResponse | RepositoryError]:
+        """Atualiza vários produtos (medido)."""
+        return await self._timed("update_many", self._inner.update_many(entities))
+
+    async def delete_many(self, entity_ids: list[UUID]) -> list[bool]:
+        """Deleta vários produtos (medido)."""
+        return await self._timed("delete_many", self._inner.delete_many(entity_ids))
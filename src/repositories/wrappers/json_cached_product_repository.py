@@ -0,0 +1,159 @@
+import sys
+from collections import OrderedDict
+from collections.abc import Iterable
+from uuid import UUID
+
+from src.core.exceptions import RepositoryError
+from src.core.metrics import PRODUCT_JSON_CACHE_BYTES
+from src.core.responses import dump_model_json
+from src.models.product import ProductBulkUpdate, ProductResponse, ProductUpdate
+from src.repositories.interfaces.product_repository import IProductRepository
+from src.repositories.wrappers.forwarding_product_repository import ForwardingProductRepository
+
+
+class ProductJsonCache:
+    """JSON (bytes) de cada produto, calculado na primeira leitura e limitado em memória.
+
+    A entrada de um ID guarda a versão do produto que foi serializado: um produto em
+    outra versão (alterado por este ou por outro processo) nunca recebe bytes antigos,
+    é apenas reserializado. Ao passar de `max_bytes`, saem as entradas usadas há mais
+    tempo (LRU). O tamanho contado é o dos objetos bytes (`sys.getsizeof`), exposto na
+    métrica `product_json_cache_bytes`.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024) -> None:
+        """Inicializa o cache.
+
+        Args:
+            max_bytes: Memória máxima das entradas, em bytes (0 só serializa, sem guardar).
+        """
+        self.max_bytes = max_bytes
+        # ID -> (versão serializada, JSON); a ordem do dict é a ordem LRU.
+        self._entries: OrderedDict[UUID, tuple[int, bytes]] = OrderedDict()
+        self._nbytes = 0
+        self._gauge = PRODUCT_JSON_CACHE_BYTES.labels()
+
+    @property
+    def nbytes(self) -> int:
+        """Memória ocupada pelas entradas, em bytes."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        """Quantidade de produtos em cache."""
+        return len(self._entries)
+
+    def dump(self, product: ProductResponse) -> bytes:
+        """Retorna o JSON do produto, do cache quando a versão bate.
+
+        Args:
+            product: Produto já validado.
+
+        Returns:
+            bytes: Objeto JSON compacto (o mesmo de `dump_model_json`).
+        """
+        entry = self._entries.get(product.id)
+        if entry is not None and entry[0] == product.version:
+            self._entries.move_to_end(product.id)
+            return entry[1]
+
+        payload = dump_model_json(product)
+        if entry is None or entry[0] < product.version:
+            self._store(product.id, product.version, payload)
+        return payload
+
+    def dump_list(self, products: Iterable[ProductResponse]) -> bytes:
+        """Monta o array JSON dos produtos concatenando os fragmentos em cache.
+
+        Args:
+            products: Produtos já validados.
+
+        Returns:
+            bytes: Array JSON compacto (o mesmo da serialização da lista inteira).
+        """
+        return b"[" + b",".join([self.dump(product) for product in products]) + b"]"
+
+    def invalidate(self, product_id: UUID) -> None:
+        """Descarta a entrada de um produto, se existir.
+
+        Args:
+            product_id: ID do produto.
+        """
+        entry = self._entries.pop(product_id, None)
+        if entry is not None:
+            self._resize(-sys.getsizeof(entry[1]))
+
+    def clear(self) -> None:
+        """Descarta todas as entradas."""
+        self._entries.clear()
+        self._resize(-self._nbytes)
+
+    def _store(self, product_id: UUID, version: int, payload: bytes) -> None:
+        """Guarda o JSON de um produto e aplica o limite de memória."""
+        size = sys.getsizeof(payload)
+        if size > self.max_bytes:
+            self.invalidate(product_id)
+            return
+        previous = self._entries.get(product_id)
+        self._entries[product_id] = (version, payload)
+        self._entries.move_to_end(product_id)
+        self._resize(size - (sys.getsizeof(previous[1]) if previous is not None else 0))
+        while self._nbytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._resize(-sys.getsizeof(evicted))
+
+    def _resize(self, delta: int) -> None:
+        """Atualiza o tamanho contado e a métrica."""
+        self._nbytes += delta
+        self._gauge.inc(delta)
+
+
+class JsonCachedProductRepository(ForwardingProductRepository):
+    """Mantém um `ProductJsonCache` coerente com as escritas que passam pelo repositório.
+
+    As leituras são repassadas sem alteração; quem serializa (a camada HTTP) usa o
+    mesmo cache. Updates e deletes, inclusive em lote, descartam as entradas dos IDs
+    afetados, liberando a memória na hora. A chave por versão no cache já impede bytes
+    desatualizados quando a escrita acontece por outro caminho (ex.: outro processo).
+    """
+
+    def __init__(self, inner: IProductRepository, cache: ProductJsonCache) -> None:
+        """Inicializa o repositório.
+
+        Args:
+            inner: Repositório que efetivamente executa as operações.
+            cache: Cache de JSON a manter coerente.
+        """
+        super().__init__(inner)
+        self._cache = cache
+
+    async def update(
+        self, entity_id: UUID, entity: ProductUpdate, expected_version: int | None = None
+    ) -> ProductResponse | None:
+        """Atualiza um produto existente e descarta seu JSON em cache."""
+        try:
+            return await self._inner.update(entity_id, entity, expected_version)
+        finally:
+            self._cache.invalidate(entity_id)
+
+    async def delete(self, entity_id: UUID) -> bool:
+        """Deleta um produto e descarta seu JSON em cache."""
+        try:
+            return await self._inner.delete(entity_id)
+        finally:
+            self._cache.invalidate(entity_id)
+
+    async def update_many(self, entities: list[ProductBulkUpdate]) -> list[ProductResponse | RepositoryError]:
+        """Atualiza vários produtos e descarta o JSON em cache de cada um."""
+        try:
+            return await self._inner.update_many(entities)
+        finally:
+            for entity in entities:
+                self._cache.invalidate(entity.id)
+
+    async def delete_many(self, entity_ids: list[UUID]) -> list[bool]:
+        """Deleta vários produtos e descarta o JSON em cache de cada um."""
+        try:
+            return await self._inner.delete_many(entity_ids)
+        finally:
+            for entity_id in entity_ids:
+                self._cache.invalidate(entity_id)
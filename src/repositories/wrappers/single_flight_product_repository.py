@@ -0,0 +1,169 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+from uuid import UUID
+
+from src.core.exceptions import RepositoryError
+from src.core.metrics import REPOSITORY_COALESCED_CALLS_TOTAL
+from src.models.product import (
+    ProductBulkUpdate,
+    ProductCreate,
+    ProductPage,
+    ProductQuery,
+    ProductResponse,
+    ProductUpdate,
+)
+from src.repositories.interfaces.product_repository import (
+    IProductRepository,
+    normalize_name_prefix,
+    normalize_product_name,
+)
+from src.repositories.wrappers.forwarding_product_repository import ForwardingProductRepository
+
+T = TypeVar("T")
+
+
+class SingleFlightProductRepository(ForwardingProductRepository):
+    """Coalescência de leituras idênticas concorrentes (single-flight).
+
+    Chamadas de leitura com a mesma operação e os mesmos argumentos que chegam enquanto
+    uma delas ainda está em andamento aguardam o mesmo resultado, em vez de irem cada
+    uma ao repositório. Todas recebem o mesmo valor ou a mesma exceção.
+
+    - O cancelamento de um chamador não cancela a busca compartilhada dos demais.
+    - Escritas "fecham" os voos em andamento: leituras iniciadas depois de uma escrita
+      abrem um voo novo e nunca recebem um resultado lido antes dela.
+    """
+
+    def __init__(self, inner: IProductRepository) -> None:
+        """Inicializa o repositório.
+
+        Args:
+            inner: Repositório que efetivamente executa as operações.
+        """
+        super().__init__(inner)
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._coalesced = {
+            operation: REPOSITORY_COALESCED_CALLS_TOTAL.labels(operation)
+            for operation in ("get_by_id", "get_by_name", "get_all", "get_page", "find_page", "count")
+        }
+
+    async def get_by_id(self, entity_id: UUID) -> ProductResponse | None:
+        """Busca um produto por ID, compartilhando buscas idênticas em andamento."""
+        return await self._coalesce("get_by_id", (entity_id,), lambda: self._inner.get_by_id(entity_id))
+
+    async def get_by_name(self, name: str) -> ProductResponse | None:
+        """Busca um produto por nome, compartilhando buscas idênticas em andamento."""
+        return await self._coalesce(
+            "get_by_name", (normalize_product_name(name),), lambda: self._inner.get_by_name(name)
+        )
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> list[ProductResponse]:
+        """Busca produtos com paginação, compartilhando buscas idênticas em andamento."""
+        return await self._coalesce("get_all", (skip, limit), lambda: self._inner.get_all(skip=skip, limit=limit))
+
+    async def get_page(self, after: str | None = None, limit: int = 100) -> ProductPage:
+        """Busca uma página por cursor, compartilhando buscas idênticas em andamento."""
+        return await self._coalesce("get_page", (after, limit), lambda: self._inner.get_page(after=after, limit=limit))
+
+    async def find_page(self, query: ProductQuery, after: str | None = None, limit: int = 100) -> ProductPage:
+        """Busca uma página filtrada e ordenada, compartilhando buscas idênticas em andamento."""
+        key = (*_query_key(query), query.sort, after, limit)
+        return await self._coalesce("find_page", key, lambda: self._inner.find_page(query, after=after, limit=limit))
+
+    async def count(self, query: ProductQuery) -> int:
+        """Conta os produtos filtrados, compartilhando contagens idênticas em andamento."""
+        return await self._coalesce("count", _query_key(query), lambda: self._inner.count(query))
+
+    async def create(self, entity: ProductCreate) -> ProductResponse:
+        """Cria um novo produto (encerra os voos de leitura em andamento)."""
+        return await self._write(self._inner.create(entity))
+
+    async def update(
+        self, entity_id: UUID, entity: ProductUpdate, expected_version: int | None = None
+    ) -> ProductResponse | None:
+        """Atualiza um produto (encerra os voos de leitura em andamento)."""
+        return await self._write(self._inner.update(entity_id, entity, expected_version))
+
+    async def delete(self, entity_id: UUID) -> bool:
+        """Deleta um produto (encerra os voos de leitura em andamento)."""
+        return await self._write(self._inner.delete(entity_id))
+
+    async def create_many(self, entities: list[ProductCreate]) -> list[ProductResponse | RepositoryError]:
+        """Cria vários produtos (encerra os voos de leitura em andamento)."""
+        return await self._write(self._inner.create_many(entities))
+
+    async def update_many(self, entities: list[ProductBulkUpdate]) -> list[ProductResponse | RepositoryError]:
+        """Atualiza vários produtos (encerra os voos de leitura em andamento)."""
+        return await self._write(self._inner.update_many(entities))
+
+    async def delete_many(self, entity_ids: list[UUID]) -> list[bool]:
+        """Deleta vários produtos (encerra os voos de leitura em andamento)."""
+        return await self._write(self._inner.delete_many(entity_ids))
+
+    async def _write(self, call: Awaitable[T]) -> T:
+        """Executa uma escrita desligando os voos de leitura abertos antes e durante ela."""
+        self._in_flight.clear()
+        try:
+            return await call
+        finally:
+            self._in_flight.clear()
+
+    async def _coalesce(self, operation: str, args: tuple[Hashable, ...], call: Callable[[], Awaitable[T]]) -> T:
+        """Executa `call` ou se junta à execução idêntica que já está em andamento.
+
+        O primeiro chamador (líder) executa a chamada na própria task, sem criar tasks
+        extras, e publica o resultado em um future que os demais aguardam. Se o líder
+        for cancelado, os que aguardavam não são: um deles assume e refaz a chamada.
+
+        Args:
+            operation: Nome da operação (parte da chave e label da métrica).
+            args: Argumentos normalizados da operação (restante da chave).
+            call: Fábrica da chamada ao repositório decorado.
+
+        Returns:
+            T: Resultado compartilhado da chamada.
+        """
+        key = (operation, *args)
+        while (flight := self._in_flight.get(key)) is not None:
+            self._coalesced[operation].inc()
+            try:
+                # shield: cancelar este chamador não cancela o future compartilhado.
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not flight.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                # O líder foi cancelado (e não este chamador): tenta de novo.
+
+        flight = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = flight
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as err:
+            flight.set_exception(err)
+            # Marca a exceção como recuperada mesmo que ninguém mais aguarde o future.
+            flight.exception()
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            if self._in_flight.get(key) is flight:
+                del self._in_flight[key]
+
+
+def _query_key(query: ProductQuery) -> tuple[Hashable, ...]:
+    """Filtros de uma consulta como chave de coalescência (prefixo normalizado)."""
+    name_prefix = None if query.name_prefix is None else normalize_name_prefix(query.name_prefix)
+    return (
+        query.price_min,
+        query.price_max,
+        query.in_stock,
+        query.created_since,
+        query.created_until,
+        name_prefix,
+    )
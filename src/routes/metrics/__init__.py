@@ -0,0 +1,9 @@
+from fastapi import APIRouter
+
+from src.routes.metrics import get
+
+router = APIRouter(prefix="/api/v1/metrics", tags=["metrics"])
+
+router.include_router(get.router)
+
+__all__ = ["router"]
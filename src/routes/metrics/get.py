@@ -0,0 +1,24 @@
+from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
+
+from src.controllers import MetricsController
+
+router = APIRouter()
+
+_metrics_controller = MetricsController()
+
+# Content-Type do formato texto de exposição do Prometheus
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/", status_code=status.HTTP_200_OK, response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Endpoint de métricas da aplicação.
+
+    Expõe contagens e histogramas de latência das requisições HTTP, latência das
+    operações de repositório e contagem de erros por `error_code`.
+
+    Returns:
+        PlainTextResponse: Métricas no formato texto do Prometheus.
+    """
+    return PlainTextResponse(await _metrics_controller.render(), media_type=PROMETHEUS_CONTENT_TYPE)
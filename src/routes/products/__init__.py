@@ -1,9 +1,11 @@
 from fastapi import APIRouter
 
-from src.routes.products import delete, get, patch, post, put
+from src.routes.products import batch, delete, get, patch, post, put
 
 router = APIRouter(prefix="/api/v1/products", tags=["products"])
 
+# As rotas de lote vêm primeiro para que "/batch" não seja capturado por "/{product_id}"
+router.include_router(batch.router)
 router.include_router(get.router)
 router.include_router(post.router)
 router.include_router(put.router)
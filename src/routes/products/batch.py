@@ -0,0 +1,40 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Body, Depends, status
+
+from src.controllers.product_controller import ProductController
+from src.factories import make_product_controller
+from src.models.product import BulkItemResult, ProductBulkUpdate, ProductCreate
+
+router = APIRouter()
+
+# Limite de itens por lote (o corpo inteiro é validado de uma vez pelo FastAPI)
+MAX_BATCH_SIZE = 10_000
+
+
+@router.post("/batch", response_model=list[BulkItemResult], status_code=status.HTTP_200_OK)
+async def create_products_batch(
+    products_data: Annotated[list[ProductCreate], Body(min_length=1, max_length=MAX_BATCH_SIZE)],
+    controller: ProductController = Depends(make_product_controller),
+) -> list[BulkItemResult]:
+    """Cria produtos em lote, com um resultado (status_code) por item."""
+    return await controller.create_many(products_data)
+
+
+@router.put("/batch", response_model=list[BulkItemResult], status_code=status.HTTP_200_OK)
+async def update_products_batch(
+    products_data: Annotated[list[ProductBulkUpdate], Body(min_length=1, max_length=MAX_BATCH_SIZE)],
+    controller: ProductController = Depends(make_product_controller),
+) -> list[BulkItemResult]:
+    """Atualiza produtos em lote, com um resultado (status_code) por item."""
+    return await controller.update_many(products_data)
+
+
+@router.delete("/batch", response_model=list[BulkItemResult], status_code=status.HTTP_200_OK)
+async def delete_products_batch(
+    product_ids: Annotated[list[UUID], Body(min_length=1, max_length=MAX_BATCH_SIZE)],
+    controller: ProductController = Depends(make_product_controller),
+) -> list[BulkItemResult]:
+    """Deleta produtos em lote, com um resultado (status_code) por item."""
+    return await controller.delete_many(product_ids)
@@ -1,28 +1,83 @@
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
 
 from src.controllers.product_controller import ProductController
+from src.core.responses import JSONBytesResponse
 from src.factories import make_product_controller
-from src.models.product import ProductResponse
+from src.models.product import ProductCount, ProductListQuery, ProductQuery, ProductResponse
+from src.utils.etag import ETAG_HEADER, catalog_etag, if_none_match_matches, product_etag
 
 router = APIRouter()
 
+# Header com o cursor da próxima página (ausente na última página)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 @router.get("/", response_model=list[ProductResponse], status_code=status.HTTP_200_OK)
 async def get_all_products(
+    params: Annotated[ProductListQuery, Query()],
     controller: ProductController = Depends(make_product_controller),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
-) -> list[ProductResponse]:
-    """Lista todos os produtos."""
-    return await controller.get_all(skip=skip, limit=limit)
+    if_none_match: str | None = Header(None),
+) -> Response:
+    """Lista todos os produtos.
+
+    A primeira página (skip=0) e as páginas com `after` usam paginação por cursor
+    e devolvem o cursor da próxima página no header `X-Next-Cursor`. `skip` continua
+    disponível para paginação por deslocamento.
+
+    Filtros (`price_min`, `price_max`, `in_stock`, `created_since`, `created_until`,
+    `name_prefix`) e ordenação (`sort`, ex.: `-price`) usam só a paginação por cursor;
+    o cursor de uma listagem ordenada vale apenas para a mesma ordenação.
+
+    O `ETag` da listagem só muda quando o catálogo muda; com `If-None-Match` igual,
+    a resposta é 304 sem corpo (a página nem chega a ser buscada).
+
+    O corpo é montado com o JSON em cache de cada produto (ver `ProductJsonCache`), sem
+    revalidar nem reserializar os itens.
+    """
+    etag = catalog_etag(await controller.get_catalog_version())
+    if if_none_match_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag})
+
+    page = await controller.get_page(after=params.after, limit=params.limit, skip=params.skip, query=params)
+    headers = {ETAG_HEADER: etag}
+    if page.next_cursor is not None:
+        headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return JSONBytesResponse(controller.to_json_list(page.items), headers=headers)
+
+
+@router.get("/count", response_model=ProductCount, status_code=status.HTTP_200_OK)
+async def count_products(
+    params: Annotated[ProductQuery, Query()],
+    controller: ProductController = Depends(make_product_controller),
+) -> ProductCount:
+    """Conta os produtos que passam nos filtros da listagem (`sort` é ignorado)."""
+    return await controller.count(params)
+
+
+@router.get("/export", response_class=StreamingResponse, status_code=status.HTTP_200_OK)
+async def export_products(
+    controller: ProductController = Depends(make_product_controller),
+) -> StreamingResponse:
+    """Exporta o catálogo inteiro em NDJSON (um produto por linha), via streaming."""
+    return StreamingResponse(controller.export(), media_type="application/x-ndjson")
 
 
 @router.get("/{product_id}", response_model=ProductResponse, status_code=status.HTTP_200_OK)
 async def get_product(
     product_id: UUID,
     controller: ProductController = Depends(make_product_controller),
-) -> ProductResponse:
-    """Busca um produto por ID."""
-    return await controller.get_by_id(product_id)
+    if_none_match: str | None = Header(None),
+) -> Response:
+    """Busca um produto por ID.
+
+    A resposta traz o `ETag` do produto; com `If-None-Match` igual, devolve 304 sem corpo.
+    """
+    product = await controller.get_by_id(product_id)
+    etag = product_etag(product)
+    if if_none_match_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag})
+    return JSONBytesResponse(controller.to_json(product), headers={ETAG_HEADER: etag})
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
 from src.controllers.product_controller import ProductController
+from src.core.responses import JSONBytesResponse, RequestBodyStreamingResponse
 from src.factories import make_product_controller
 from src.models.product import ProductCreate, ProductResponse
 
@@ -11,6 +12,24 @@ router = APIRouter()
 async def create_product(
     product_data: ProductCreate,
     controller: ProductController = Depends(make_product_controller),
-) -> ProductResponse:
+) -> Response:
     """Cria um novo produto."""
-    return await controller.create(product_data)
+    product = await controller.create(product_data)
+    return JSONBytesResponse(controller.to_json(product), status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/import", response_class=RequestBodyStreamingResponse, status_code=status.HTTP_200_OK)
+async def import_products(
+    request: Request,
+    controller: ProductController = Depends(make_product_controller),
+    chunk_size: int = Query(1000, ge=1, le=10_000),
+) -> RequestBodyStreamingResponse:
+    """Importa produtos de um corpo NDJSON (um ProductCreate por linha).
+
+    O corpo é lido de forma incremental e a resposta é um fluxo NDJSON com erros por
+    linha, progresso a cada lote gravado e um resumo final.
+    """
+    return RequestBodyStreamingResponse(
+        controller.import_ndjson(request.stream(), chunk_size=chunk_size),
+        media_type="application/x-ndjson",
+    )
@@ -1,10 +1,12 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Response, status
 
 from src.controllers.product_controller import ProductController
+from src.core.responses import JSONBytesResponse
 from src.factories import make_product_controller
 from src.models.product import ProductResponse, ProductUpdate
+from src.utils.etag import ETAG_HEADER, product_etag
 
 router = APIRouter()
 
@@ -14,6 +16,12 @@ async def update_product(
     product_id: UUID,
     product_data: ProductUpdate,
     controller: ProductController = Depends(make_product_controller),
-) -> ProductResponse:
-    """Atualiza um produto existente."""
-    return await controller.update(product_id, product_data)
+    if_match: str | None = Header(None),
+) -> Response:
+    """Atualiza um produto existente.
+
+    Com `If-Match` (ETag lido no GET), a atualização só acontece se o produto não
+    mudou desde a leitura; caso contrário, a resposta é 412.
+    """
+    product = await controller.update(product_id, product_data, if_match)
+    return JSONBytesResponse(controller.to_json(product), headers={ETAG_HEADER: product_etag(product)})
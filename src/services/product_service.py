@@ -1,14 +1,40 @@
+import json
+from collections.abc import AsyncIterator
 from uuid import UUID
 
+from pydantic import ValidationError
+
 from src.core.exceptions import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
     HTTP_409_CONFLICT,
+    HTTP_412_PRECONDITION_FAILED,
+    HTTP_422_UNPROCESSABLE_ENTITY,
     ApplicationServiceError,
+    DuplicateValueError,
+    EntityNotFoundError,
+    InvalidCursorError,
+    InvalidEntityError,
+    RepositoryError,
+    VersionConflictError,
     handle_service_errors_async,
 )
-from src.models.product import ProductCreate, ProductResponse, ProductUpdate
+from src.models.product import (
+    BulkItemResult,
+    ProductBulkUpdate,
+    ProductCreate,
+    ProductPage,
+    ProductQuery,
+    ProductResponse,
+    ProductUpdate,
+)
 from src.repositories.interfaces.product_repository import IProductRepository
+from src.utils.etag import if_match_version
 from src.utils.logger import get_logger
+from src.utils.ndjson import LineTooLongError, iter_ndjson_lines
 
 logger = get_logger(__name__)
 
@@ -37,16 +63,10 @@ class ProductService:
         """
         logger.debug("Creating product", operation="create_product")
 
-        existing_product = await self._repository.get_by_name(product_data.name)
-        if existing_product:
-            raise ApplicationServiceError(
-                service_name=self.SERVICE_NAME,
-                message=f"Product with name '{product_data.name}' already exists",
-                status_code=HTTP_409_CONFLICT,
-                error_code="PRODUCT_NAME_ALREADY_EXISTS",
-            )
-
-        product = await self._repository.create(product_data)
+        try:
+            product = await self._repository.create(product_data)
+        except DuplicateValueError as err:
+            raise self._name_conflict_error(product_data.name) from err
         logger.info("Product created", operation="create_product")
         return product
 
@@ -74,6 +94,15 @@ class ProductService:
             )
         return product
 
+    @handle_service_errors_async(service_name=SERVICE_NAME, error_code="GET_ERROR")
+    async def get_catalog_version(self) -> str:
+        """Retorna a versão atual do catálogo (muda a cada alteração).
+
+        Returns:
+            str: Token opaco de versão do catálogo.
+        """
+        return await self._repository.get_catalog_version()
+
     @handle_service_errors_async(service_name=SERVICE_NAME, error_code="GET_ERROR")
     async def get_product_by_name(self, name: str) -> ProductResponse:
         """Busca um produto por nome.
@@ -113,44 +142,261 @@ class ProductService:
         products = await self._repository.get_all(skip=skip, limit=limit)
         return products
 
+    @handle_service_errors_async(service_name=SERVICE_NAME, error_code="GET_ALL_ERROR")
+    async def get_products_page(
+        self, after: str | None = None, limit: int = 100, skip: int = 0, query: ProductQuery | None = None
+    ) -> ProductPage:
+        """Busca uma página de produtos.
+
+        Sem `skip`, usa paginação por cursor (keyset) e devolve o cursor da próxima
+        página. Com `skip`, usa paginação por deslocamento (sem cursor). Filtros e
+        ordenação (`query`) só existem na paginação por cursor.
+
+        Args:
+            after: Cursor opaco retornado pela página anterior (None para a primeira).
+            limit: Número máximo de produtos a retornar.
+            skip: Número de produtos a pular (paginação por deslocamento).
+            query: Filtros e ordenação (None para a listagem padrão).
+
+        Returns:
+            ProductPage: Produtos da página e o cursor da próxima.
+
+        Raises:
+            ApplicationServiceError: Se o cursor for inválido ou `skip` for combinado com
+                `after`, filtros ou ordenação.
+        """
+        logger.debug("Listing products page", operation="get_products_page")
+        if after is not None and skip:
+            raise ApplicationServiceError(
+                service_name=self.SERVICE_NAME,
+                message="Use either 'skip' or 'after', not both",
+                status_code=HTTP_400_BAD_REQUEST,
+                error_code="INVALID_PAGINATION",
+            )
+        filtered = query is not None and not query.is_default
+        if filtered and skip:
+            raise ApplicationServiceError(
+                service_name=self.SERVICE_NAME,
+                message="Filters and sorting use cursor pagination; 'skip' is not supported",
+                status_code=HTTP_400_BAD_REQUEST,
+                error_code="INVALID_PAGINATION",
+            )
+        if skip:
+            return ProductPage(items=await self._repository.get_all(skip=skip, limit=limit))
+
+        try:
+            if query is not None and filtered:
+                return await self._repository.find_page(query, after=after, limit=limit)
+            return await self._repository.get_page(after=after, limit=limit)
+        except InvalidCursorError as err:
+            raise ApplicationServiceError(
+                service_name=self.SERVICE_NAME,
+                message="Invalid pagination cursor",
+                status_code=HTTP_400_BAD_REQUEST,
+                error_code="INVALID_CURSOR",
+            ) from err
+
+    @handle_service_errors_async(service_name=SERVICE_NAME, error_code="COUNT_ERROR")
+    async def count_products(self, query: ProductQuery) -> int:
+        """Conta os produtos que passam nos filtros (a ordenação é ignorada).
+
+        Args:
+            query: Filtros da contagem.
+
+        Returns:
+            int: Quantidade de produtos.
+        """
+        logger.debug("Counting products", operation="count_products")
+        return await self._repository.count(query)
+
+    async def export_products(self, batch_size: int = 500) -> AsyncIterator[bytes]:
+        """Exporta o catálogo inteiro como NDJSON (um produto JSON por linha).
+
+        Cada bloco produzido corresponde a um lote do repositório, então o primeiro
+        byte sai assim que o primeiro lote é lido e a memória não cresce com o catálogo.
+
+        Args:
+            batch_size: Quantidade de produtos por bloco.
+
+        Yields:
+            bytes: Bloco de linhas NDJSON.
+        """
+        logger.info("Exporting products", operation="export_products")
+        exported = 0
+        lines: list[bytes] = []
+        async for product in self._repository.iter_all(batch_size=batch_size):
+            lines.append(product.model_dump_json().encode())
+            if len(lines) == batch_size:
+                exported += len(lines)
+                yield b"\n".join(lines) + b"\n"
+                lines = []
+        if lines:
+            exported += len(lines)
+            yield b"\n".join(lines) + b"\n"
+        logger.info("Products exported", operation="export_products", count=exported)
+
+    async def import_products(self, chunks: AsyncIterator[bytes], chunk_size: int = 1000) -> AsyncIterator[bytes]:
+        """Importa produtos de um fluxo NDJSON, devolvendo o progresso como NDJSON.
+
+        As linhas são lidas de forma incremental e validadas como ProductCreate; a cada
+        `chunk_size` linhas válidas o lote é gravado via create_many (checagem de nome
+        O(1) por item). A cada `chunk_size` linhas lidas (válidas ou não) os eventos
+        acumulados são enviados. O fluxo de entrada só avança quando o consumidor lê a
+        resposta, então a memória depende do tamanho do lote, não do arquivo.
+
+        Eventos produzidos (um JSON por linha):
+            - {"event": "error", "line": n, "status_code", "error_code", "message"}
+            - {"event": "progress", "processed", "created", "failed"} a cada bloco
+            - {"event": "summary", "processed", "created", "failed"} ao final
+
+        Args:
+            chunks: Fluxo de bytes do corpo da requisição.
+            chunk_size: Linhas válidas por lote gravado e linhas lidas por bloco de eventos.
+
+        Yields:
+            bytes: Eventos NDJSON.
+        """
+        logger.info("Importing products", operation="import_products")
+        processed = created = failed = 0
+        read_since_yield = 0
+        pending: list[tuple[int, ProductCreate]] = []
+        events: list[dict] = []
+
+        try:
+            async for line_number, line in iter_ndjson_lines(chunks):
+                processed += 1
+                read_since_yield += 1
+                try:
+                    pending.append((line_number, ProductCreate.model_validate_json(line)))
+                except ValidationError as err:
+                    failed += 1
+                    events.append(self._import_validation_error_event(line_number, err))
+
+                if len(pending) >= chunk_size:
+                    chunk_created, chunk_errors = await self._import_chunk(pending)
+                    created += chunk_created
+                    failed += len(chunk_errors)
+                    events.extend(chunk_errors)
+                    pending = []
+
+                if read_since_yield >= chunk_size or len(events) >= chunk_size:
+                    events.append({"event": "progress", "processed": processed, "created": created, "failed": failed})
+                    yield self._encode_ndjson(events)
+                    events = []
+                    read_since_yield = 0
+        except LineTooLongError as err:
+            failed += 1
+            events.append(
+                {
+                    "event": "error",
+                    "line": err.line_number,
+                    "status_code": HTTP_400_BAD_REQUEST,
+                    "error_code": "LINE_TOO_LONG",
+                    "message": str(err),
+                }
+            )
+
+        if pending:
+            chunk_created, chunk_errors = await self._import_chunk(pending)
+            created += chunk_created
+            failed += len(chunk_errors)
+            events.extend(chunk_errors)
+
+        logger.info(
+            "Products imported",
+            operation="import_products",
+            processed=processed,
+            created=created,
+            failed=failed,
+        )
+        events.append({"event": "summary", "processed": processed, "created": created, "failed": failed})
+        yield self._encode_ndjson(events)
+
+    async def _import_chunk(self, pending: list[tuple[int, ProductCreate]]) -> tuple[int, list[dict]]:
+        """Grava um lote do import e monta os eventos de erro por linha.
+
+        Args:
+            pending: Pares (número da linha, produto validado).
+
+        Returns:
+            tuple[int, list[dict]]: Quantidade criada e eventos de erro.
+        """
+        results = await self._repository.create_many([product for _, product in pending])
+        created = 0
+        errors: list[dict] = []
+        for (line_number, _), result in zip(pending, results, strict=True):
+            if isinstance(result, ProductResponse):
+                created += 1
+                continue
+            status_code, error_code, message = self._repository_error_details(result)
+            errors.append(
+                {
+                    "event": "error",
+                    "line": line_number,
+                    "status_code": status_code,
+                    "error_code": error_code,
+                    "message": message,
+                }
+            )
+        return created, errors
+
+    def _import_validation_error_event(self, line_number: int, err: ValidationError) -> dict:
+        """Monta o evento de erro para uma linha que não passou na validação."""
+        return {
+            "event": "error",
+            "line": line_number,
+            "status_code": HTTP_422_UNPROCESSABLE_ENTITY,
+            "error_code": "VALIDATION_ERROR",
+            "message": "; ".join(
+                f"{'.'.join(str(loc) for loc in error['loc']) or 'body'}: {error['msg']}"
+                for error in err.errors(include_url=False)
+            ),
+        }
+
+    @staticmethod
+    def _encode_ndjson(events: list[dict]) -> bytes:
+        """Serializa eventos como linhas NDJSON."""
+        return b"".join(json.dumps(event).encode() + b"\n" for event in events)
+
     @handle_service_errors_async(service_name=SERVICE_NAME, error_code="UPDATE_ERROR")
-    async def update_product(self, product_id: UUID, product_data: ProductUpdate) -> ProductResponse:
+    async def update_product(
+        self, product_id: UUID, product_data: ProductUpdate, if_match: str | None = None
+    ) -> ProductResponse:
         """Atualiza um produto existente.
 
+        Com `if_match`, a atualização só é aplicada se o produto ainda estiver na versão
+        do ETag informado (compare-and-swap no repositório, sem lock).
+
         Args:
             product_id: ID do produto a ser atualizado.
             product_data: Dados atualizados do produto.
+            if_match: Valor do header If-Match (ETag lido pelo cliente), se houver.
 
         Returns:
             ProductResponse: Produto atualizado.
 
         Raises:
-            ApplicationServiceError: Se o produto não for encontrado ou nome já existir.
+            ApplicationServiceError: Se o produto não for encontrado, o nome já existir ou
+                a versão do If-Match não for a atual (412).
         """
-        existing_product = await self._repository.get_by_id(product_id)
-        if not existing_product:
-            raise ApplicationServiceError(
-                service_name=self.SERVICE_NAME,
-                message=f"Product with ID {product_id} not found",
-                status_code=HTTP_404_NOT_FOUND,
-                error_code="PRODUCT_NOT_FOUND",
-            )
+        expected_version = None
+        if if_match is not None:
+            try:
+                expected_version = if_match_version(if_match, product_id)
+            except ValueError as err:
+                raise self._precondition_failed_error(product_id) from err
+
+        try:
+            updated_product = await self._repository.update(product_id, product_data, expected_version)
+        except DuplicateValueError as err:
+            raise self._name_conflict_error(product_data.name) from err
+        except VersionConflictError as err:
+            raise self._precondition_failed_error(product_id) from err
 
-        if product_data.name:
-            product_with_same_name = await self._repository.get_by_name(product_data.name)
-            if product_with_same_name and product_with_same_name.id != product_id:
-                raise ApplicationServiceError(
-                    service_name=self.SERVICE_NAME,
-                    message=f"Product with name '{product_data.name}' already exists",
-                    status_code=HTTP_409_CONFLICT,
-                    error_code="PRODUCT_NAME_ALREADY_EXISTS",
-                )
-
-        updated_product = await self._repository.update(product_id, product_data)
         if updated_product is None:
             raise ApplicationServiceError(
                 service_name=self.SERVICE_NAME,
-                message=f"Product with ID {product_id} not found during update",
+                message=f"Product with ID {product_id} not found",
                 status_code=HTTP_404_NOT_FOUND,
                 error_code="PRODUCT_NOT_FOUND",
             )
@@ -177,3 +423,160 @@ class ProductService:
                 error_code="PRODUCT_NOT_FOUND",
             )
         logger.info("Product deleted", operation="delete_product")
+
+    @handle_service_errors_async(service_name=SERVICE_NAME, error_code="BULK_CREATE_ERROR")
+    async def create_products(self, products_data: list[ProductCreate]) -> list[BulkItemResult]:
+        """Cria vários produtos em lote.
+
+        Args:
+            products_data: Dados dos produtos a serem criados.
+
+        Returns:
+            list[BulkItemResult]: Resultado de cada item, na ordem do lote.
+        """
+        results = await self._repository.create_many(products_data)
+        items = [self._bulk_result(index, result, HTTP_201_CREATED) for index, result in enumerate(results)]
+        self._log_bulk("create_products", items)
+        return items
+
+    @handle_service_errors_async(service_name=SERVICE_NAME, error_code="BULK_UPDATE_ERROR")
+    async def update_products(self, products_data: list[ProductBulkUpdate]) -> list[BulkItemResult]:
+        """Atualiza vários produtos em lote.
+
+        Args:
+            products_data: Atualizações, cada uma com o ID do produto alvo.
+
+        Returns:
+            list[BulkItemResult]: Resultado de cada item, na ordem do lote.
+        """
+        results = await self._repository.update_many(products_data)
+        items = [
+            self._bulk_result(index, result, HTTP_200_OK, entity_id=products_data[index].id)
+            for index, result in enumerate(results)
+        ]
+        self._log_bulk("update_products", items)
+        return items
+
+    @handle_service_errors_async(service_name=SERVICE_NAME, error_code="BULK_DELETE_ERROR")
+    async def delete_products(self, product_ids: list[UUID]) -> list[BulkItemResult]:
+        """Deleta vários produtos em lote.
+
+        Args:
+            product_ids: IDs dos produtos a serem deletados.
+
+        Returns:
+            list[BulkItemResult]: Resultado de cada item, na ordem do lote.
+        """
+        results = await self._repository.delete_many(product_ids)
+        items = [
+            self._bulk_result(
+                index,
+                None if deleted else EntityNotFoundError(product_id),
+                HTTP_204_NO_CONTENT,
+                entity_id=product_id,
+            )
+            for index, (product_id, deleted) in enumerate(zip(product_ids, results, strict=True))
+        ]
+        self._log_bulk("delete_products", items)
+        return items
+
+    def _bulk_result(
+        self,
+        index: int,
+        result: ProductResponse | RepositoryError | None,
+        success_status: int,
+        entity_id: UUID | None = None,
+    ) -> BulkItemResult:
+        """Monta o item de resposta em lote a partir do resultado do repositório.
+
+        Args:
+            index: Posição do item no lote.
+            result: Produto resultante, erro do repositório ou None (sucesso sem corpo).
+            success_status: Status HTTP usado quando o item tiver sucesso.
+            entity_id: ID do produto alvo, quando conhecido.
+
+        Returns:
+            BulkItemResult: Resultado do item.
+        """
+        if isinstance(result, ProductResponse):
+            return BulkItemResult(index=index, status_code=success_status, id=result.id, product=result)
+        if result is None:
+            return BulkItemResult(index=index, status_code=success_status, id=entity_id)
+
+        status_code, error_code, message = self._repository_error_details(result)
+        return BulkItemResult(
+            index=index,
+            status_code=status_code,
+            id=entity_id,
+            error_code=error_code,
+            message=message,
+        )
+
+    def _repository_error_details(self, err: RepositoryError) -> tuple[int, str, str]:
+        """Traduz um erro do repositório para status HTTP, código e mensagem.
+
+        Args:
+            err: Erro retornado pelo repositório para um item.
+
+        Returns:
+            tuple[int, str, str]: Status HTTP, código de erro e mensagem.
+
+        Raises:
+            RepositoryError: Se o erro não tiver tradução conhecida.
+        """
+        if isinstance(err, EntityNotFoundError):
+            return HTTP_404_NOT_FOUND, "PRODUCT_NOT_FOUND", f"Product with ID {err.entity_id} not found"
+        if isinstance(err, DuplicateValueError) and err.field == "name":
+            return HTTP_409_CONFLICT, "PRODUCT_NAME_ALREADY_EXISTS", f"Product with name '{err.value}' already exists"
+        if isinstance(err, DuplicateValueError):
+            return (
+                HTTP_409_CONFLICT,
+                "DUPLICATE_ITEM_IN_BATCH",
+                f"Product with ID {err.value} appears more than once in the batch",
+            )
+        if isinstance(err, InvalidEntityError):
+            return HTTP_422_UNPROCESSABLE_ENTITY, "VALIDATION_ERROR", f"Validation error: {err}"
+        if isinstance(err, VersionConflictError):
+            return (
+                HTTP_412_PRECONDITION_FAILED,
+                "PRODUCT_VERSION_MISMATCH",
+                f"Product with ID {err.entity_id} is at version {err.current_version}",
+            )
+        raise err
+
+    def _log_bulk(self, operation: str, items: list[BulkItemResult]) -> None:
+        """Registra um único log de resumo para a operação em lote."""
+        failed = sum(1 for item in items if item.error_code is not None)
+        logger.info("Bulk operation completed", operation=operation, total=len(items), failed=failed)
+
+    def _precondition_failed_error(self, product_id: UUID) -> ApplicationServiceError:
+        """Monta o erro 412 para atualizações com versão (If-Match) desatualizada.
+
+        Args:
+            product_id: ID do produto alvo.
+
+        Returns:
+            ApplicationServiceError: Erro com código PRODUCT_VERSION_MISMATCH.
+        """
+        return ApplicationServiceError(
+            service_name=self.SERVICE_NAME,
+            message=f"Product with ID {product_id} was modified; fetch it again and retry",
+            status_code=HTTP_412_PRECONDITION_FAILED,
+            error_code="PRODUCT_VERSION_MISMATCH",
+        )
+
+    def _name_conflict_error(self, name: str | None) -> ApplicationServiceError:
+        """Monta o erro 409 para nomes de produto duplicados.
+
+        Args:
+            name: Nome que causou o conflito.
+
+        Returns:
+            ApplicationServiceError: Erro com código PRODUCT_NAME_ALREADY_EXISTS.
+        """
+        return ApplicationServiceError(
+            service_name=self.SERVICE_NAME,
+            message=f"Product with name '{name}' already exists",
+            status_code=HTTP_409_CONFLICT,
+            error_code="PRODUCT_NAME_ALREADY_EXISTS",
+        )
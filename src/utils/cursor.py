@@ -0,0 +1,89 @@
+import base64
+import binascii
+import math
+
+from src.core.exceptions import InvalidCursorError
+
+_CURSOR_PREFIX = "v1:"
+# Cursor de listagem ordenada: "v1s:<campo de ordenação>:<valor>:<posição>"
+_SORT_CURSOR_PREFIX = "v1s:"
+
+
+def encode_cursor(position: int) -> str:
+    """Codifica uma posição de paginação em um cursor opaco.
+
+    Args:
+        position: Posição (chave de ordenação) do último item da página.
+
+    Returns:
+        str: Cursor opaco, seguro para uso em query string.
+    """
+    raw = f"{_CURSOR_PREFIX}{position}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decodifica um cursor opaco gerado por encode_cursor.
+
+    Args:
+        cursor: Cursor recebido do cliente.
+
+    Returns:
+        int: Posição codificada no cursor.
+
+    Raises:
+        InvalidCursorError: Se o cursor estiver malformado.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        if not raw.startswith(_CURSOR_PREFIX):
+            raise ValueError("unknown cursor version")
+        position = int(raw.removeprefix(_CURSOR_PREFIX))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as err:
+        raise InvalidCursorError(cursor) from err
+
+    if position < 0:
+        raise InvalidCursorError(cursor)
+    return position
+
+
+def encode_sort_cursor(sort: str, value: float, position: int) -> str:
+    """Codifica a posição de uma listagem ordenada em um cursor opaco.
+
+    Args:
+        sort: Campo de ordenação da listagem (ex.: "-price").
+        value: Valor do campo de ordenação no último item da página.
+        position: Posição (chave de desempate) do último item da página.
+
+    Returns:
+        str: Cursor opaco, seguro para uso em query string.
+    """
+    raw = f"{_SORT_CURSOR_PREFIX}{sort}:{value!r}:{position}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_sort_cursor(cursor: str, sort: str) -> tuple[float, int]:
+    """Decodifica um cursor gerado por encode_sort_cursor para o mesmo campo de ordenação.
+
+    Args:
+        cursor: Cursor recebido do cliente.
+        sort: Campo de ordenação da listagem atual.
+
+    Returns:
+        tuple[float, int]: Valor do campo de ordenação e posição codificados no cursor.
+
+    Raises:
+        InvalidCursorError: Se o cursor estiver malformado ou for de outra ordenação.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        cursor_sort, value, position = raw.removeprefix(_SORT_CURSOR_PREFIX).split(":")
+        if not raw.startswith(_SORT_CURSOR_PREFIX) or cursor_sort != sort:
+            raise ValueError("cursor belongs to another listing")
+        parsed = float(value), int(position)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as err:
+        raise InvalidCursorError(cursor) from err
+
+    if not math.isfinite(parsed[0]) or parsed[1] < 0:
+        raise InvalidCursorError(cursor)
+    return parsed
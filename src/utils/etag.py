@@ -0,0 +1,82 @@
+from uuid import UUID
+
+from src.models.product import ProductResponse
+
+ETAG_HEADER = "ETag"
+
+
+def product_etag(product: ProductResponse) -> str:
+    """Monta o ETag forte de um produto.
+
+    O validador combina o ID com a versão do registro, que aumenta a cada escrita.
+
+    Args:
+        product: Produto.
+
+    Returns:
+        str: ETag entre aspas, no formato `"<id>-<versão>"`.
+    """
+    return f'"{product.id.hex}-{product.version}"'
+
+
+def catalog_etag(catalog_version: str) -> str:
+    """Monta o ETag forte de uma listagem a partir da versão do catálogo.
+
+    ETags valem por URL, então páginas diferentes (query strings diferentes) podem
+    compartilhar o mesmo validador: cada uma só muda quando o catálogo muda.
+
+    Args:
+        catalog_version: Token retornado por `IProductRepository.get_catalog_version`.
+
+    Returns:
+        str: ETag entre aspas.
+    """
+    return f'"catalog-{catalog_version}"'
+
+
+def if_none_match_matches(if_none_match: str | None, etag: str) -> bool:
+    """Verifica se o header If-None-Match casa com o ETag atual (comparação fraca, RFC 9110).
+
+    Args:
+        if_none_match: Valor do header If-None-Match (lista separada por vírgulas ou "*").
+        etag: ETag atual do recurso.
+
+    Returns:
+        bool: True se o cliente já tem a representação atual (responder 304).
+    """
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for raw in if_none_match.split(","):
+        candidate = raw.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def if_match_version(if_match: str, product_id: UUID) -> int | None:
+    """Extrai do header If-Match a versão esperada de um produto.
+
+    If-Match usa comparação forte: validadores fracos (`W/`) e ETags de outro recurso
+    nunca casam. Com uma lista, vale o primeiro ETag do produto.
+
+    Args:
+        if_match: Valor do header If-Match.
+        product_id: ID do produto alvo.
+
+    Returns:
+        int | None: Versão esperada, ou None para "*" (qualquer versão atual).
+
+    Raises:
+        ValueError: Se nenhum ETag da lista puder casar com o produto.
+    """
+    prefix = f'"{product_id.hex}-'
+    for raw in if_match.split(","):
+        candidate = raw.strip()
+        if candidate == "*":
+            return None
+        if candidate.startswith(prefix) and candidate.endswith('"'):
+            version = candidate[len(prefix) : -1]
+            if version.isdigit():
+                return int(version)
+    raise ValueError(f"If-Match does not reference product {product_id}: {if_match!r}")
@@ -0,0 +1,136 @@
+"""Sink de logs assíncrono: fila limitada + thread escritora dedicada.
+
+O handler enfileira o registro já renderizado (o que é barato) e uma thread em segundo
+plano faz a escrita de fato no stream. Assim, um stdout lento (drivers de log de
+containers, pipes cheios) não bloqueia o event loop que atende as requisições.
+"""
+
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
+from typing import Literal
+
+LogQueueOverflow = Literal["drop", "block"]
+
+
+@dataclass(frozen=True)
+class LogQueueStats:
+    """Contadores do sink de logs em fila.
+
+    Attributes:
+        queued: Registros aceitos na fila desde o início.
+        dropped: Registros descartados por fila cheia (política "drop").
+        pending: Registros aguardando escrita neste momento.
+    """
+
+    queued: int
+    dropped: int
+    pending: int
+
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler com fila limitada, política de overflow e contadores.
+
+    Com a política "drop", um registro que encontra a fila cheia é descartado e contado
+    (quem loga nunca espera). Com "block", quem loga espera até haver espaço, o que
+    preserva todos os registros ao custo de propagar a lentidão do stream.
+    """
+
+    def __init__(self, log_queue: queue.Queue, overflow: LogQueueOverflow = "drop") -> None:
+        """Inicializa o handler.
+
+        Args:
+            log_queue: Fila (limitada) compartilhada com o listener.
+            overflow: Política quando a fila está cheia: "drop" ou "block".
+        """
+        super().__init__(log_queue)
+        self._log_queue = log_queue
+        self.overflow = overflow
+        self._queued = 0
+        self._dropped = 0
+        self._counter_lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enfileira o registro aplicando a política de overflow."""
+        if self.overflow == "block":
+            self._log_queue.put(record)
+        else:
+            try:
+                self._log_queue.put_nowait(record)
+            except queue.Full:
+                with self._counter_lock:
+                    self._dropped += 1
+                return
+        with self._counter_lock:
+            self._queued += 1
+
+    def stats(self) -> LogQueueStats:
+        """Retorna um retrato dos contadores do handler.
+
+        Returns:
+            LogQueueStats: Registros enfileirados, descartados e pendentes.
+        """
+        with self._counter_lock:
+            return LogQueueStats(queued=self._queued, dropped=self._dropped, pending=self._log_queue.qsize())
+
+
+class DrainingQueueListener(QueueListener):
+    """QueueListener que espera espaço na fila para enfileirar o sentinela de parada.
+
+    O `QueueListener` padrão usa `put_nowait`, que falha com a fila cheia; aqui a
+    parada aguarda a thread escritora drenar, então nenhum registro aceito é perdido.
+    """
+
+    def __init__(self, log_queue: queue.Queue, *handlers: logging.Handler, respect_handler_level: bool = False) -> None:
+        """Inicializa o listener.
+
+        Args:
+            log_queue: Fila compartilhada com o handler.
+            *handlers: Handlers que escrevem os registros.
+            respect_handler_level: Se True, respeita o nível de cada handler.
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self._log_queue = log_queue
+
+    def enqueue_sentinel(self) -> None:
+        """Enfileira o sentinela (None) que encerra a thread escritora."""
+        self._log_queue.put(None)
+
+
+class QueueLogSink:
+    """Agrupa fila, handler e listener de um sink de logs assíncrono."""
+
+    def __init__(self, target: logging.Handler, maxsize: int, overflow: LogQueueOverflow = "drop") -> None:
+        """Cria o sink (sem iniciar a thread escritora).
+
+        Args:
+            target: Handler que efetivamente escreve os registros (ex.: StreamHandler).
+            maxsize: Capacidade máxima da fila.
+            overflow: Política quando a fila está cheia: "drop" ou "block".
+        """
+        log_queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.handler = BoundedQueueHandler(log_queue, overflow)
+        self._listener = DrainingQueueListener(log_queue, target, respect_handler_level=True)
+        self._running = False
+
+    def start(self) -> None:
+        """Inicia a thread escritora."""
+        if not self._running:
+            self._listener.start()
+            self._running = True
+
+    def stop(self) -> None:
+        """Escreve os registros pendentes e encerra a thread escritora."""
+        if self._running:
+            self._listener.stop()
+            self._running = False
+
+    def stats(self) -> LogQueueStats:
+        """Retorna os contadores do sink.
+
+        Returns:
+            LogQueueStats: Registros enfileirados, descartados e pendentes.
+        """
+        return self.handler.stats()
@@ -1,3 +1,4 @@
+import atexit
 import inspect
 import logging
 from contextvars import ContextVar
@@ -6,6 +7,7 @@ import structlog
 from structlog.stdlib import LoggerFactory
 
 from src.core.settings import get_settings
+from src.utils.log_queue import LogQueueStats, QueueLogSink
 
 # Context variable para armazenar o correlation ID da requisição atual
 _correlation_id_var: ContextVar[str | None] = ContextVar("correlation_id", default=None)
@@ -50,6 +52,8 @@ class _LoggingConfig:
     """Singleton para controlar configuração do logging."""
 
     _configured = False
+    _queue_sink: QueueLogSink | None = None
+    _level = logging.INFO
 
     @classmethod
     def is_configured(cls) -> bool:
@@ -61,6 +65,26 @@ class _LoggingConfig:
         """Marca como configurado."""
         cls._configured = True
 
+    @classmethod
+    def set_level(cls, level: int) -> None:
+        """Registra o nível mínimo de log configurado."""
+        cls._level = level
+
+    @classmethod
+    def level(cls) -> int:
+        """Retorna o nível mínimo de log configurado."""
+        return cls._level
+
+    @classmethod
+    def set_queue_sink(cls, sink: QueueLogSink) -> None:
+        """Registra o sink em fila ativo."""
+        cls._queue_sink = sink
+
+    @classmethod
+    def queue_sink(cls) -> QueueLogSink | None:
+        """Retorna o sink em fila ativo, se houver."""
+        return cls._queue_sink
+
 
 def _setup() -> None:
     """Configura structlog uma única vez."""
@@ -68,6 +92,8 @@ def _setup() -> None:
         return
 
     settings = get_settings()
+    log_level = logging.DEBUG if settings.debug else getattr(logging, settings.log_level.upper(), logging.INFO)
+    _LoggingConfig.set_level(log_level)
 
     # Processors para formatação (apenas o essencial)
     processors = [
@@ -85,16 +111,28 @@ def _setup() -> None:
     # Configura structlog
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Métodos de níveis abaixo de log_level viram no-ops: nenhum processor roda.
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
         logger_factory=LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
-    log_level = logging.DEBUG if settings.debug else getattr(logging, settings.log_level.upper(), logging.INFO)
+    handlers: list[logging.Handler] | None = None
+    if settings.log_sink == "queue":
+        # A escrita no stderr sai do event loop: quem loga só enfileira o registro.
+        target = logging.StreamHandler()
+        target.setFormatter(logging.Formatter("%(message)s"))
+        sink = QueueLogSink(target, maxsize=settings.log_queue_size, overflow=settings.log_queue_overflow)
+        sink.start()
+        atexit.register(sink.stop)
+        _LoggingConfig.set_queue_sink(sink)
+        handlers = [sink.handler]
+
     logging.basicConfig(
         format="%(message)s",
         level=log_level,
+        handlers=handlers,
     )
 
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
@@ -103,11 +141,29 @@ def _setup() -> None:
     _LoggingConfig.mark_configured()
 
 
+def get_log_queue_stats() -> LogQueueStats | None:
+    """Obtém os contadores do sink de logs em fila.
+
+    Returns:
+        LogQueueStats | None: Registros enfileirados/descartados/pendentes, ou None se
+        o sink configurado for o síncrono (LOG_SINK=sync).
+    """
+    sink = _LoggingConfig.queue_sink()
+    return sink.stats() if sink else None
+
+
 class SimpleLogger:
-    """Wrapper que mantém compatibilidade com a interface anterior."""
+    """Wrapper que mantém compatibilidade com a interface anterior.
+
+    Os níveis desabilitados retornam antes de qualquer repasse ao structlog, então um
+    `logger.debug(...)` com LOG_LEVEL=INFO custa só a chamada e uma comparação.
+    """
 
-    def __init__(self, logger: structlog.BoundLogger) -> None:
+    def __init__(self, logger: structlog.typing.FilteringBoundLogger, level: int = logging.NOTSET) -> None:
         self._logger = logger
+        self._debug_enabled = level <= logging.DEBUG
+        self._info_enabled = level <= logging.INFO
+        self._warning_enabled = level <= logging.WARNING
 
     def debug(self, message: str, **kwargs: object) -> None:
         """Log de debug.
@@ -116,7 +172,8 @@ class SimpleLogger:
             message: Mensagem do log.
             **kwargs: Dados extras para incluir no log.
         """
-        self._logger.debug(message, **kwargs)
+        if self._debug_enabled:
+            self._logger.debug(message, **kwargs)
 
     def info(self, message: str, **kwargs: object) -> None:
         """Log de info.
@@ -125,7 +182,8 @@ class SimpleLogger:
             message: Mensagem do log.
             **kwargs: Dados extras para incluir no log.
         """
-        self._logger.info(message, **kwargs)
+        if self._info_enabled:
+            self._logger.info(message, **kwargs)
 
     def warning(self, message: str, **kwargs: object) -> None:
         """Log de warning.
@@ -134,7 +192,8 @@ class SimpleLogger:
             message: Mensagem do log.
             **kwargs: Dados extras para incluir no log.
         """
-        self._logger.warning(message, **kwargs)
+        if self._warning_enabled:
+            self._logger.warning(message, **kwargs)
 
     def error(self, message: str, **kwargs: object) -> None:
         """Log de error.
@@ -169,4 +228,4 @@ def get_logger(name: str | None = None) -> SimpleLogger:
         name = frame.f_back.f_globals.get("__name__", "unknown") if frame and frame.f_back else "unknown"
 
     logger = structlog.get_logger(name)
-    return SimpleLogger(logger)
+    return SimpleLogger(logger, _LoggingConfig.level())
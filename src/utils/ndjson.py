@@ -0,0 +1,58 @@
+from collections.abc import AsyncIterator
+
+# Tamanho máximo de uma linha NDJSON (protege contra corpos sem quebra de linha)
+DEFAULT_MAX_LINE_BYTES = 64 * 1024
+
+
+class LineTooLongError(ValueError):
+    """Linha NDJSON maior que o limite configurado."""
+
+    def __init__(self, line_number: int, max_line_bytes: int) -> None:
+        """Inicializa a exceção.
+
+        Args:
+            line_number: Número (1-based) da linha que excedeu o limite.
+            max_line_bytes: Limite de bytes por linha.
+        """
+        self.line_number = line_number
+        super().__init__(f"Line {line_number} exceeds {max_line_bytes} bytes")
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes],
+    max_line_bytes: int = DEFAULT_MAX_LINE_BYTES,
+) -> AsyncIterator[tuple[int, bytes]]:
+    """Divide um fluxo de bytes em linhas NDJSON, sem ler o fluxo inteiro.
+
+    Apenas a linha corrente fica em buffer. Linhas em branco são ignoradas, mas
+    contam na numeração.
+
+    Args:
+        chunks: Fluxo de blocos de bytes (ex.: request.stream()).
+        max_line_bytes: Tamanho máximo aceito para uma linha.
+
+    Yields:
+        tuple[int, bytes]: Número da linha (1-based) e seu conteúdo, sem o terminador.
+
+    Raises:
+        LineTooLongError: Se uma linha exceder max_line_bytes.
+    """
+    buffer = bytearray()
+    line_number = 0
+    async for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line_number += 1
+            line = bytes(buffer[start:end]).rstrip(b"\r")
+            start = end + 1
+            if len(line) > max_line_bytes:
+                raise LineTooLongError(line_number, max_line_bytes)
+            if line.strip():
+                yield line_number, line
+        del buffer[:start]
+        if len(buffer) > max_line_bytes:
+            raise LineTooLongError(line_number + 1, max_line_bytes)
+
+    if buffer.strip():
+        yield line_number + 1, bytes(buffer).rstrip(b"\r")
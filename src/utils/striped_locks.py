@@ -0,0 +1,47 @@
+"""Locks assíncronos particionados por chave (lock striping)."""
+
+import asyncio
+from collections.abc import Callable, Hashable
+
+
+class StripedLocks:
+    """Conjunto fixo de `asyncio.Lock`, escolhido pelo hash da chave.
+
+    Operações sobre chaves diferentes quase sempre caem em locks diferentes e não se
+    serializam; operações sobre a mesma chave sempre caem no mesmo lock. A memória é
+    constante (um lock por faixa), independente de quantas chaves existem.
+
+    Cada operação deve segurar no máximo um lock por vez: adquirir duas faixas em
+    ordens diferentes pode causar deadlock.
+    """
+
+    __slots__ = ("_locks",)
+
+    def __init__(self, stripes: int = 64, lock_factory: Callable[[], asyncio.Lock] = asyncio.Lock) -> None:
+        """Cria os locks.
+
+        Args:
+            stripes: Quantidade de faixas (locks).
+            lock_factory: Fábrica de cada lock (injetável para testes).
+
+        Raises:
+            ValueError: Se `stripes` não for positivo.
+        """
+        if stripes <= 0:
+            raise ValueError(f"stripes must be positive, got {stripes}")
+        self._locks = tuple(lock_factory() for _ in range(stripes))
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de faixas."""
+        return len(self._locks)
+
+    def lock_for(self, key: Hashable) -> asyncio.Lock:
+        """Retorna o lock da faixa da chave.
+
+        Args:
+            key: Chave protegida (ex.: ID do registro).
+
+        Returns:
+            asyncio.Lock: Lock compartilhado por todas as chaves da mesma faixa.
+        """
+        return self._locks[hash(key) % len(self._locks)]
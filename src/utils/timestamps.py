@@ -0,0 +1,30 @@
+"""Conversão de instantes para microssegundos desde a época (colunas, snapshot e cursores)."""
+
+from datetime import UTC, datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_micros(value: datetime) -> int:
+    """Calcula os microssegundos desde a época de um datetime com fuso (exato).
+
+    Args:
+        value: Instante com fuso.
+
+    Returns:
+        int: Microssegundos desde 1970-01-01 UTC.
+    """
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_micros(value: int) -> datetime:
+    """Monta o datetime em UTC a partir de microssegundos desde a época.
+
+    Args:
+        value: Microssegundos desde 1970-01-01 UTC.
+
+    Returns:
+        datetime: Instante em UTC.
+    """
+    return _EPOCH + timedelta(0, 0, value)
@@ -0,0 +1,27 @@
+"""Integration tests for metrics API."""
+
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from src.main import app
+
+
+def test_metrics_endpoint_exposes_http_repository_and_error_metrics() -> None:
+    """GET /api/v1/metrics/ returns Prometheus text with request, repository and error metrics."""
+    client = TestClient(app)
+    client.get("/api/v1/products/")
+    client.get(f"/api/v1/products/{uuid4()}")
+
+    response = client.get("/api/v1/metrics/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/api/v1/products/",status="200"}' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/api/v1/products/{product_id}",le="+Inf"}' in body
+    assert (
+        'repository_operation_duration_seconds_count{repository="InMemoryProductRepository",operation="get_by_id"}'
+        in body
+    )
+    assert 'application_errors_total{error_code="PRODUCT_NOT_FOUND"}' in body
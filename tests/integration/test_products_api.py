@@ -1,11 +1,15 @@
 """Integration tests for products API."""
 
+import json
 from uuid import uuid4
 
 import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 
 from src.main import app
+from src.models.product import ProductResponse
 
 
 @pytest.fixture
@@ -158,3 +162,189 @@ def test_product_name_whitespace_only_validation(client: TestClient) -> None:
     # Message should refer to name/validation in English
     body = response.json()
     assert "message" in body
+
+
+def test_get_all_products_cursor_pagination(client: TestClient) -> None:
+    """GET /api/v1/products/?after= follows the X-Next-Cursor header without repeating items."""
+    for i in range(3):
+        client.post("/api/v1/products/", json={"name": f"Cursor {i}", "price": 1.0})
+    seen: list[str] = []
+    response = client.get("/api/v1/products/?limit=2")
+    while True:
+        assert response.status_code == 200
+        seen.extend(p["id"] for p in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        response = client.get(f"/api/v1/products/?limit=2&after={cursor}")
+    assert len(seen) == len(set(seen))
+    assert len(seen) >= 3
+
+
+def test_get_all_products_invalid_cursor_returns_400(client: TestClient) -> None:
+    """GET /api/v1/products/?after=<garbage> returns 400."""
+    response = client.get("/api/v1/products/?after=garbage")
+    assert response.status_code == 400
+    assert response.json()["error_code"] == "INVALID_CURSOR"
+
+
+def test_get_all_products_filters_and_sorts(client: TestClient) -> None:
+    """GET /api/v1/products/ with filters and sort walks the matching products in order."""
+    for index, price in enumerate([30.0, 10.0, 20.0]):
+        client.post("/api/v1/products/", json={"name": f"Sorted Filter {index}", "price": price, "stock": 1})
+    client.post("/api/v1/products/", json={"name": "Sorted Filter empty", "price": 15.0, "stock": 0})
+
+    params = {"name_prefix": "sorted filter", "in_stock": "true", "price_min": 10, "sort": "-price", "limit": 2}
+    first = client.get("/api/v1/products/", params=params)
+    assert first.status_code == 200
+    assert [p["price"] for p in first.json()] == [30.0, 20.0]
+    second = client.get("/api/v1/products/", params={**params, "after": first.headers["X-Next-Cursor"]})
+    assert [p["price"] for p in second.json()] == [10.0]
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_get_all_products_rejects_invalid_filters(client: TestClient) -> None:
+    """Unknown sort fields are 422; offset pagination with filters is 400 INVALID_PAGINATION."""
+    assert client.get("/api/v1/products/?sort=name").status_code == 422
+    assert client.get("/api/v1/products/?price_min=-1").status_code == 422
+    response = client.get("/api/v1/products/?skip=1&in_stock=true")
+    assert response.status_code == 400
+    assert response.json()["error_code"] == "INVALID_PAGINATION"
+
+
+def test_count_products_with_filters(client: TestClient) -> None:
+    """GET /api/v1/products/count counts the products matching the listing filters."""
+    for index, price in enumerate([30.0, 10.0, 20.0]):
+        client.post("/api/v1/products/", json={"name": f"Counted Filter {index}", "price": price, "stock": index})
+    created = client.get("/api/v1/products/", params={"name_prefix": "counted filter", "sort": "created_at"}).json()
+
+    response = client.get("/api/v1/products/count", params={"name_prefix": "counted filter", "price_min": 15})
+    assert response.status_code == 200
+    assert response.json() == {"count": 2}
+    since = {"name_prefix": "counted filter", "created_since": created[1]["created_at"]}
+    assert client.get("/api/v1/products/count", params=since).json() == {"count": 2}
+    naive = {"created_since": created[1]["created_at"].removesuffix("Z").split("+")[0]}
+    assert client.get("/api/v1/products/count", params=naive).status_code == 422
+
+
+def test_batch_create_update_delete(client: TestClient) -> None:
+    """Batch endpoints return one result per item with its own status code."""
+    created = client.post(
+        "/api/v1/products/batch",
+        json=[{"name": "Batch A", "price": 1.0}, {"name": "Batch B", "price": 2.0}, {"name": "batch a", "price": 3.0}],
+    )
+    assert created.status_code == 200
+    assert [item["status_code"] for item in created.json()] == [201, 201, 409]
+    ids = [item["id"] for item in created.json()[:2]]
+
+    updated = client.put("/api/v1/products/batch", json=[{"id": ids[0], "stock": 7}, {"id": str(uuid4()), "stock": 1}])
+    assert updated.status_code == 200
+    assert [item["status_code"] for item in updated.json()] == [200, 404]
+    assert updated.json()[0]["product"]["stock"] == 7
+
+    deleted = client.request("DELETE", "/api/v1/products/batch", json=ids)
+    assert deleted.status_code == 200
+    assert [item["status_code"] for item in deleted.json()] == [204, 204]
+
+
+def test_batch_create_invalid_item_returns_422(client: TestClient) -> None:
+    """An invalid item fails validation of the whole batch."""
+    response = client.post("/api/v1/products/batch", json=[{"name": "Ok", "price": 1.0}, {"name": "Bad"}])
+    assert response.status_code == 422
+
+
+def test_export_products_streams_ndjson(client: TestClient) -> None:
+    """GET /api/v1/products/export streams the catalog as NDJSON."""
+    client.post("/api/v1/products/", json={"name": "Exported", "price": 1.0})
+    with client.stream("GET", "/api/v1/products/export") as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        names = [json.loads(line)["name"] for line in response.iter_lines() if line]
+    assert "Exported" in names
+
+
+def test_get_all_products_skip_and_after_returns_400(client: TestClient) -> None:
+    """GET /api/v1/products/ with both skip and after returns 400 INVALID_PAGINATION."""
+    response = client.get("/api/v1/products/?skip=1&after=abc")
+    assert response.status_code == 400
+    assert response.json()["error_code"] == "INVALID_PAGINATION"
+
+
+def test_import_products_ndjson(client: TestClient) -> None:
+    """POST /api/v1/products/import streams back a summary for an NDJSON body."""
+    body = b'{"name": "Imported 1", "price": 1.0}\n{"name": "Imported 2", "price": 2.0}\n'
+    response = client.post(
+        "/api/v1/products/import",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events[-1] == {"event": "summary", "processed": 2, "created": 2, "failed": 0}
+
+
+def test_get_product_returns_etag_and_304_when_unchanged(client: TestClient) -> None:
+    """GET /api/v1/products/{id} returns an ETag; If-None-Match with it returns 304 until the product changes."""
+    payload = {"name": "Etag Product", "description": None, "price": 1.0, "stock": 1}
+    product_id = client.post("/api/v1/products/", json=payload).json()["id"]
+
+    first = client.get(f"/api/v1/products/{product_id}")
+    etag = first.headers["ETag"]
+
+    not_modified = client.get(f"/api/v1/products/{product_id}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == etag
+
+    client.patch(f"/api/v1/products/{product_id}", json={"stock": 2})
+    changed = client.get(f"/api/v1/products/{product_id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_list_etag_changes_only_when_catalog_changes(client: TestClient) -> None:
+    """The list ETag is stable across reads and changes after a write."""
+    etag = client.get("/api/v1/products/").headers["ETag"]
+
+    assert client.get("/api/v1/products/", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/api/v1/products/", json={"name": "Catalog Change", "description": None, "price": 1.0, "stock": 1})
+    response = client.get("/api/v1/products/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_update_with_if_match_rejects_lost_update(client: TestClient) -> None:
+    """PUT/PATCH with a stale If-Match return 412; the current ETag succeeds."""
+    created = client.post(
+        "/api/v1/products/", json={"name": "If Match", "description": None, "price": 1.0, "stock": 1}
+    ).json()
+    etag = client.get(f"/api/v1/products/{created['id']}").headers["ETag"]
+
+    first = client.patch(f"/api/v1/products/{created['id']}", json={"stock": 2}, headers={"If-Match": etag})
+    assert first.status_code == 200
+    assert first.json()["version"] == created["version"] + 1
+    assert first.headers["ETag"] != etag
+
+    stale = client.put(f"/api/v1/products/{created['id']}", json={"stock": 3}, headers={"If-Match": etag})
+    assert stale.status_code == 412
+    assert stale.json()["error_code"] == "PRODUCT_VERSION_MISMATCH"
+
+    retry = client.put(
+        f"/api/v1/products/{created['id']}", json={"stock": 3}, headers={"If-Match": first.headers["ETag"]}
+    )
+    assert retry.status_code == 200
+    assert retry.json()["stock"] == 3
+
+
+def test_product_bodies_match_default_fastapi_encoding(client: TestClient) -> None:
+    """The pre-serialized list and item bodies are byte-identical to FastAPI's default JSON encoding."""
+    created = client.post("/api/v1/products/", json={"name": "Fast path ✓", "price": 2.5, "stock": 1}).json()
+
+    item = client.get(f"/api/v1/products/{created['id']}")
+    listing = client.get("/api/v1/products/", params={"limit": 1000})
+
+    assert item.headers["content-type"] == "application/json"
+    assert item.content == JSONResponse(jsonable_encoder(ProductResponse.model_validate(created))).body
+    products = [ProductResponse.model_validate(product) for product in listing.json()]
+    assert listing.content == JSONResponse(jsonable_encoder(products)).body
@@ -0,0 +1,82 @@
+"""Unit tests for the metrics registry (src.core.metrics.registry)."""
+
+import pytest
+
+from src.core.metrics import MetricsRegistry
+
+
+def test_counter_renders_one_line_per_label_set() -> None:
+    """Counters are rendered with HELP/TYPE headers and one sample per label set."""
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs processed.", ("queue",))
+    counter.labels("fast").inc()
+    counter.labels("fast").inc(2)
+    counter.labels("slow").inc()
+
+    text = registry.render()
+
+    assert "# HELP jobs_total Jobs processed.\n# TYPE jobs_total counter\n" in text
+    assert 'jobs_total{queue="fast"} 3\n' in text
+    assert 'jobs_total{queue="slow"} 1\n' in text
+
+
+def test_gauge_can_go_up_and_down() -> None:
+    """Gauges render their current value, which can be set or moved in both directions."""
+    registry = MetricsRegistry()
+    gauge = registry.gauge("cache_bytes", "Cache size.")
+    child = gauge.labels()
+    child.set(100)
+    child.inc(50)
+    child.inc(-120)
+
+    text = registry.render()
+
+    assert "# HELP cache_bytes Cache size.\n# TYPE cache_bytes gauge\n" in text
+    assert "cache_bytes 30\n" in text
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    """Bucket samples are cumulative and end with +Inf, _sum and _count."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", ("op",), buckets=(0.1, 1.0))
+    child = histogram.labels("read")
+    for value in (0.05, 0.1, 0.5, 3.0):
+        child.observe(value)
+
+    lines = registry.render().splitlines()
+
+    assert 'latency_seconds_bucket{op="read",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{op="read",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{op="read",le="+Inf"} 4' in lines
+    assert 'latency_seconds_sum{op="read"} 3.65' in lines
+    assert 'latency_seconds_count{op="read"} 4' in lines
+
+
+def test_labels_returns_the_same_child() -> None:
+    """The child for a label set is created once and reused."""
+    registry = MetricsRegistry()
+    counter = registry.counter("hits_total", "Hits.", ("route",))
+    assert counter.labels("/a") is counter.labels("/a")
+
+
+def test_wrong_label_count_raises() -> None:
+    """Passing the wrong number of label values is rejected."""
+    counter = MetricsRegistry().counter("hits_total", "Hits.", ("route", "method"))
+    with pytest.raises(ValueError):
+        counter.labels("/a")
+
+
+def test_registering_same_name_returns_existing_metric() -> None:
+    """Re-registering a name returns the same family; a different type is rejected."""
+    registry = MetricsRegistry()
+    counter = registry.counter("hits_total", "Hits.")
+    assert registry.counter("hits_total", "Hits.") is counter
+    with pytest.raises(ValueError):
+        registry.histogram("hits_total", "Hits.")
+
+
+def test_label_values_are_escaped() -> None:
+    """Quotes, backslashes and newlines in label values are escaped."""
+    registry = MetricsRegistry()
+    registry.counter("odd_total", "Odd.", ("value",)).labels('a"b\\c\nd').inc()
+    assert 'odd_total{value="a\\"b\\\\c\\nd"} 1' in registry.render()
@@ -0,0 +1,91 @@
+"""Unit tests for HttpLoggingMiddleware (src.core.middleware.http_logging)."""
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from src.core.middleware import HttpLoggingMiddleware
+from src.core.middleware.http_sampling import HttpLogSampler, HttpLogSamplingConfig
+from src.core.middleware.route_template import UNMATCHED_ROUTE
+from src.utils.logger import get_correlation_id
+
+
+async def _echo_correlation_id(request: Request) -> PlainTextResponse:
+    return PlainTextResponse(get_correlation_id() or "", status_code=201)
+
+
+async def _stream(request: Request) -> StreamingResponse:
+    async def body():  # noqa: ANN202
+        yield b"a"
+        yield b"b"
+
+    return StreamingResponse(body())
+
+
+async def _boom(request: Request) -> PlainTextResponse:
+    raise RuntimeError("boom")
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Minimal app wrapped by the middleware."""
+    app = Starlette(
+        routes=[Route("/echo", _echo_correlation_id), Route("/stream", _stream), Route("/boom", _boom)],
+    )
+    app.add_middleware(HttpLoggingMiddleware)
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_propagates_incoming_correlation_id(client: TestClient) -> None:
+    """The X-Correlation-ID header is stored in context and echoed in the response."""
+    response = client.get("/echo", headers={"X-Correlation-ID": "abc-123"})
+    assert response.status_code == 201
+    assert response.text == "abc-123"
+    assert response.headers["X-Correlation-ID"] == "abc-123"
+
+
+def test_generates_correlation_id_when_missing(client: TestClient) -> None:
+    """A correlation id is generated when the request does not send one."""
+    response = client.get("/echo")
+    assert response.headers["X-Correlation-ID"] == response.text
+    assert len(response.text) == 36
+
+
+def test_streaming_response_passes_through(client: TestClient) -> None:
+    """Streaming bodies are forwarded untouched, with the header added."""
+    response = client.get("/stream")
+    assert response.text == "ab"
+    assert "X-Correlation-ID" in response.headers
+
+
+def test_exception_is_logged_and_reraised(client: TestClient) -> None:
+    """Unhandled exceptions propagate (and become 500 at the server edge)."""
+    response = client.get("/boom")
+    assert response.status_code == 500
+
+
+def test_sampler_receives_route_template() -> None:
+    """The sampler is keyed by the route template, not by the concrete path."""
+    observed: list[str] = []
+
+    class _RecordingSampler(HttpLogSampler):
+        def observe(self, route: str, status_code: int, duration_ms: float) -> str | None:
+            observed.append(route)
+            return None
+
+    async def _item(request: Request) -> PlainTextResponse:
+        return PlainTextResponse(request.path_params["item_id"])
+
+    app = Starlette(routes=[Route("/items/{item_id}", _item)])
+    app.add_middleware(
+        HttpLoggingMiddleware, sampler=_RecordingSampler(HttpLogSamplingConfig(summary_interval_seconds=0))
+    )
+    client = TestClient(app)
+
+    client.get("/items/1")
+    client.get("/missing")
+
+    assert observed == ["/items/{item_id}", UNMATCHED_ROUTE]
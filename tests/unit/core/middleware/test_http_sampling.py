@@ -0,0 +1,88 @@
+"""Unit tests for HttpLogSampler (src.core.middleware.http_sampling)."""
+
+import random
+
+from src.core.middleware.http_sampling import HttpLogSampler, HttpLogSamplingConfig, TokenBucket
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_errors_and_slow_requests_are_always_logged() -> None:
+    """Status >= 500 and slow requests bypass sampling and rate limiting."""
+    sampler = HttpLogSampler(
+        HttpLogSamplingConfig(default_sample_rate=0.0, slow_request_ms=500, summary_interval_seconds=0)
+    )
+
+    assert sampler.observe("/items", 200, 10) is None
+    assert sampler.observe("/items", 503, 10) == "error"
+    assert sampler.observe("/items", 200, 750) == "slow"
+
+
+def test_per_route_sample_rate_overrides_default() -> None:
+    """Routes with their own rate use it; the others use the default."""
+    config = HttpLogSamplingConfig(
+        route_sample_rates={"/health": 0.0, "/items/{item_id}": 0.25},
+        summary_interval_seconds=0,
+    )
+    sampler = HttpLogSampler(config, rng=random.Random(42))
+
+    assert sampler.observe("/items", 200, 1) == "sampled"
+    assert sampler.observe("/health", 200, 1) is None
+    logged = sum(sampler.observe("/items/{item_id}", 200, 1) is not None for _ in range(4000))
+    assert 800 < logged < 1200
+
+
+def test_token_bucket_limits_lines_per_route() -> None:
+    """After the burst, a route only logs as tokens are refilled."""
+    clock = _FakeClock()
+    sampler = HttpLogSampler(
+        HttpLogSamplingConfig(rate_limit_per_second=2, rate_limit_burst=3, summary_interval_seconds=0), clock=clock
+    )
+
+    assert [sampler.observe("/items", 200, 1) for _ in range(4)] == ["sampled"] * 3 + [None]
+    # Cada rota tem seu próprio bucket
+    assert sampler.observe("/other", 200, 1) == "sampled"
+
+    clock.now = 0.5  # 1 token reposto
+    assert sampler.observe("/items", 200, 1) == "sampled"
+    assert sampler.observe("/items", 200, 1) is None
+
+
+def test_token_bucket_never_exceeds_capacity() -> None:
+    """Idle time refills the bucket only up to its capacity."""
+    bucket = TokenBucket(rate=10, capacity=2, now=0)
+    assert bucket.try_acquire(100)
+    assert bucket.try_acquire(100)
+    assert not bucket.try_acquire(100)
+
+
+def test_summary_aggregates_every_request_per_interval() -> None:
+    """The summary counts logged and dropped requests alike and resets each interval."""
+    clock = _FakeClock()
+    sampler = HttpLogSampler(HttpLogSamplingConfig(default_sample_rate=0.0, summary_interval_seconds=60), clock=clock)
+
+    for duration in range(1, 101):
+        sampler.observe("/items", 200, float(duration))
+    sampler.observe("/items", 500, 5.0)
+
+    assert sampler.collect_summary() is None  # intervalo ainda não venceu
+
+    clock.now = 60
+    summary = sampler.collect_summary()
+    assert summary is not None
+    items = summary["/items"]
+    assert items["count"] == 101
+    assert items["errors"] == 1
+    assert items["logged"] == 1
+    assert items["p50_ms"] == 50.0
+    assert items["p99_ms"] == 99.0
+    assert items["max_ms"] == 100.0
+
+    clock.now = 120
+    assert sampler.collect_summary() == {}
@@ -0,0 +1,29 @@
+"""Unit tests for route_template (src.core.middleware.route_template)."""
+
+from types import SimpleNamespace
+
+from src.core.middleware.route_template import UNMATCHED_ROUTE, route_template
+
+
+def _scope(path: str, route_path: str | None, **path_params: str) -> dict:
+    scope: dict = {"path": path, "path_params": path_params}
+    if route_path is not None:
+        scope["route"] = SimpleNamespace(path_format=route_path)
+    return scope
+
+
+def test_full_route_path_is_returned_as_is() -> None:
+    """A route that already carries the full template is used directly."""
+    scope = _scope("/api/v1/items/42", "/api/v1/items/{item_id}", item_id="42")
+    assert route_template(scope) == "/api/v1/items/{item_id}"
+
+
+def test_prefix_of_included_router_is_recovered() -> None:
+    """A route template relative to an included router gets the prefix back from the path."""
+    assert route_template(_scope("/api/v1/items/42", "/{item_id}", item_id="42")) == "/api/v1/items/{item_id}"
+    assert route_template(_scope("/api/v1/items/", "/")) == "/api/v1/items/"
+
+
+def test_unmatched_request() -> None:
+    """Requests without a matched route share a single key."""
+    assert route_template(_scope("/nope", None)) == UNMATCHED_ROUTE
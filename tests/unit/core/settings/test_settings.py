@@ -0,0 +1,23 @@
+"""Unit tests for Settings validation (src.core.settings.settings)."""
+
+import pytest
+from pydantic import ValidationError
+
+from src.core.settings.settings import Settings
+
+
+def test_multiple_workers_require_shared_store() -> None:
+    """Reject WORKERS > 1 with the per-process in-memory store or the per-process cache."""
+    with pytest.raises(ValidationError, match="shared store"):
+        Settings(workers=2, product_repository_backend="memory")
+    with pytest.raises(ValidationError, match="PRODUCT_CACHE_ENABLED"):
+        Settings(workers=2, product_repository_backend="sqlite", product_cache_enabled=True)
+
+    settings = Settings(workers=4, product_repository_backend="sqlite", product_cache_enabled=False)
+    assert settings.workers == 4
+
+
+def test_wal_requires_snapshot_path() -> None:
+    """Reject a write-ahead log without the snapshot that compacts it."""
+    with pytest.raises(ValidationError, match="PRODUCT_SNAPSHOT_PATH"):
+        Settings(product_wal_path="/tmp/wal", product_snapshot_path=None)
@@ -0,0 +1,95 @@
+"""Unit tests for ColumnarProductStore (src.repositories.in_memory.columnar_store)."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from src.models.product import ProductCreate, ProductResponse, ProductUpdate
+from src.repositories.in_memory import ColumnarProductStore, InMemoryProductRepository, read_snapshot, write_snapshot
+
+
+def _product(name: str, description: str | None = "Mesma descrição") -> ProductResponse:
+    return ProductResponse(
+        id=uuid4(),
+        name=name,
+        description=description,
+        price=12.34,
+        stock=7,
+        version=3,
+        created_at=datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=UTC),
+        updated_at=None if description is None else datetime(2024, 6, 1, tzinfo=UTC),
+    )
+
+
+def test_round_trips_every_field() -> None:
+    """Read back an equal product, with UTC timestamps and the same id object."""
+    store = ColumnarProductStore()
+    with_description, without_description = _product("A"), _product("B", description=None)
+    store[with_description.id] = with_description
+    store[without_description.id] = without_description
+
+    assert store[with_description.id] == with_description
+    assert store[with_description.id].id is with_description.id
+    assert store.get(without_description.id) == without_description
+    assert store.get(uuid4()) is None
+    assert store[with_description.id].model_dump_json() == with_description.model_dump_json()
+
+
+def test_delete_keeps_insertion_order_and_replace_keeps_position() -> None:
+    """Removing a row moves the last one into its place without changing the iteration order."""
+    store = ColumnarProductStore()
+    products = [_product(f"P{index}") for index in range(5)]
+    for product in products:
+        store[product.id] = product
+
+    del store[products[1].id]
+    store[products[3].id] = products[3].model_copy(update={"stock": 1})
+
+    assert list(store) == [products[0].id, products[2].id, products[3].id, products[4].id]
+    assert [product.name for product in store.values()] == ["P0", "P2", "P3", "P4"]
+    assert store[products[3].id].stock == 1
+    assert store[products[4].id] == products[4]
+    with pytest.raises(KeyError):
+        del store[products[1].id]
+    with pytest.raises(ValueError, match="does not match"):
+        store[uuid4()] = products[0]
+
+
+def test_equal_descriptions_share_one_string_and_copy_is_independent() -> None:
+    """Pool equal descriptions and keep a copy unaffected by later writes."""
+    store = ColumnarProductStore()
+    first, second = _product("A", description="".join(["Texto ", "repetido"])), _product("B", "Texto repetido")
+    store[first.id] = first
+    store[second.id] = second
+    clone = store.copy()
+    del store[first.id]
+
+    assert clone[first.id].description is clone[second.id].description
+    assert first.id in clone
+    assert first.id not in store
+
+
+async def test_snapshot_moves_between_layouts(tmp_path: Path) -> None:
+    """A snapshot captured from the columnar layout restores into the object layout and back."""
+    columnar = InMemoryProductRepository(columnar=True)
+    for index in range(20):
+        await columnar.create(
+            ProductCreate(name=f"Produto {index}", description=f"D{index % 3}", price=1.5, stock=index)
+        )
+    products = await columnar.get_all(limit=100)
+    await columnar.update(products[4].id, ProductUpdate(price=9.0))
+    await columnar.delete(products[7].id)
+    path = tmp_path / "products.snap"
+
+    write_snapshot(path, columnar.capture_snapshot())
+    snapshot = read_snapshot(path)
+    assert snapshot is not None
+    objects = InMemoryProductRepository()
+    objects.restore_snapshot(snapshot)
+    restored = InMemoryProductRepository(columnar=True)
+    restored.restore_snapshot(snapshot)
+
+    assert await objects.get_all(limit=100) == await columnar.get_all(limit=100)
+    assert await restored.get_all(limit=100) == await columnar.get_all(limit=100)
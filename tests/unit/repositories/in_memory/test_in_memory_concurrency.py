@@ -0,0 +1,85 @@
+"""Concurrency stress tests for InMemoryProductRepository (src.repositories.in_memory)."""
+
+import asyncio
+import random
+
+from src.core.exceptions import DuplicateValueError
+from src.models.product import ProductCreate, ProductResponse, ProductUpdate
+from src.repositories.in_memory import InMemoryProductRepository
+from src.repositories.interfaces.product_repository import normalize_product_name
+from src.utils.striped_locks import StripedLocks
+
+
+class _YieldingLock(asyncio.Lock):
+    """Lock that suspends right after acquiring, forcing interleaving inside critical sections."""
+
+    async def acquire(self) -> bool:
+        acquired = await super().acquire()
+        await asyncio.sleep(0)
+        return acquired
+
+
+def _repo() -> InMemoryProductRepository:
+    return InMemoryProductRepository(locks=StripedLocks(4, lock_factory=_YieldingLock))
+
+
+def _assert_indexes_consistent(repo: InMemoryProductRepository, products: list[ProductResponse]) -> None:
+    names = [normalize_product_name(product.name) for product in products]
+    assert len(names) == len(set(names))
+    assert {name: product.id for name, product in zip(names, products, strict=True)} == repo._ids_by_name
+    assert repo._name_reservations == {}
+
+
+async def test_concurrent_creates_with_colliding_names_keep_names_unique() -> None:
+    """Thousands of concurrent creates over a few names produce exactly one product per name."""
+    repo = _repo()
+    names = [f"Product {index % 50}" for index in range(3000)]
+    random.Random(16).shuffle(names)
+    # Variações de caixa/espaços também colidem com o nome normalizado.
+    payloads = [
+        ProductCreate(name=name.upper() if i % 3 == 0 else f" {name} ", price=1.0) for i, name in enumerate(names)
+    ]
+
+    results = await asyncio.gather(*(repo.create(payload) for payload in payloads), return_exceptions=True)
+
+    created = [result for result in results if isinstance(result, ProductResponse)]
+    duplicates = [result for result in results if isinstance(result, DuplicateValueError)]
+    assert len(created) == 50
+    assert len(duplicates) == len(payloads) - 50
+    _assert_indexes_consistent(repo, await repo.get_all(limit=10_000))
+
+
+async def test_concurrent_creates_and_renames_never_share_a_name() -> None:
+    """Renames racing creates for the same names never leave two products with one name."""
+    repo = _repo()
+    existing = [await repo.create(ProductCreate(name=f"Seed {index}", price=1.0)) for index in range(100)]
+    targets = [f"Target {index}" for index in range(20)]
+
+    operations = [repo.create(ProductCreate(name=targets[index % 20], price=1.0)) for index in range(500)]
+    operations += [
+        repo.update(existing[index % 100].id, ProductUpdate(name=targets[index % 20])) for index in range(500)
+    ]
+    random.Random(17).shuffle(operations)
+    results = await asyncio.gather(*operations, return_exceptions=True)
+
+    assert all(isinstance(result, ProductResponse | DuplicateValueError) for result in results)
+    products = await repo.get_all(limit=10_000)
+    owners = [product for product in products if product.name in targets]
+    assert len(owners) == len(targets)
+    _assert_indexes_consistent(repo, products)
+
+
+async def test_concurrent_compare_and_swap_updates_apply_once_per_version() -> None:
+    """Concurrent updates expecting the same version: exactly one wins."""
+    repo = _repo()
+    product = await repo.create(ProductCreate(name="Contended", price=1.0, stock=0))
+
+    results = await asyncio.gather(
+        *(repo.update(product.id, ProductUpdate(stock=stock), expected_version=1) for stock in range(200)),
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(result, ProductResponse) for result in results) == 1
+    stored = await repo.get_by_id(product.id)
+    assert stored is not None
+    assert stored.version == 2
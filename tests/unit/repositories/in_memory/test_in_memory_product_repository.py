@@ -4,14 +4,15 @@ from uuid import uuid4
 
 import pytest
 
-from src.models.product import ProductCreate, ProductResponse, ProductUpdate
+from src.core.exceptions import DuplicateValueError, EntityNotFoundError, InvalidCursorError, VersionConflictError
+from src.models.product import ProductBulkUpdate, ProductCreate, ProductQuery, ProductResponse, ProductUpdate
 from src.repositories.in_memory import InMemoryProductRepository
 
 
-@pytest.fixture
-def repo() -> InMemoryProductRepository:
-    """Fresh in-memory repository."""
-    return InMemoryProductRepository()
+@pytest.fixture(params=[False, True], ids=["objects", "columnar"])
+def repo(request: pytest.FixtureRequest) -> InMemoryProductRepository:
+    """Fresh in-memory repository, in each storage layout."""
+    return InMemoryProductRepository(columnar=request.param)
 
 
 @pytest.mark.asyncio
@@ -107,3 +108,326 @@ async def test_delete_not_found(repo: InMemoryProductRepository) -> None:
     """Delete returns False when product does not exist."""
     deleted = await repo.delete(uuid4())
     assert deleted is False
+
+
+@pytest.mark.asyncio
+async def test_get_all_keeps_insertion_order_after_update_and_delete(repo: InMemoryProductRepository) -> None:
+    """Updates keep the product's position and deletes close the gap in get_all."""
+    created = [await repo.create(ProductCreate(name=f"P{i}", description=None, price=1.0, stock=0)) for i in range(4)]
+    await repo.update(created[1].id, ProductUpdate(name="P1-renamed"))
+    await repo.delete(created[2].id)
+    page = await repo.get_all(skip=0, limit=10)
+    assert [p.name for p in page] == ["P0", "P1-renamed", "P3"]
+
+
+@pytest.mark.asyncio
+async def test_create_duplicate_name_raises(repo: InMemoryProductRepository) -> None:
+    """Create rejects names that collide after casefold/strip normalization."""
+    await repo.create(ProductCreate(name="Straße", description=None, price=1.0, stock=0))
+    with pytest.raises(DuplicateValueError):
+        await repo.create(ProductCreate(name="  STRASSE ", description=None, price=1.0, stock=0))
+
+
+@pytest.mark.asyncio
+async def test_update_rename_moves_name_index(repo: InMemoryProductRepository) -> None:
+    """Renaming frees the old name and claims the new one; collisions are rejected."""
+    first = await repo.create(ProductCreate(name="First", description=None, price=1.0, stock=0))
+    second = await repo.create(ProductCreate(name="Second", description=None, price=1.0, stock=0))
+    with pytest.raises(DuplicateValueError):
+        await repo.update(second.id, ProductUpdate(name="first"))
+
+    await repo.update(first.id, ProductUpdate(name="Renamed"))
+    assert await repo.get_by_name("first") is None
+    assert (await repo.get_by_name("renamed")).id == first.id  # type: ignore[union-attr]
+    await repo.create(ProductCreate(name="First", description=None, price=1.0, stock=0))
+
+
+@pytest.mark.asyncio
+async def test_delete_frees_name(repo: InMemoryProductRepository) -> None:
+    """Deleting a product makes its name available again."""
+    created = await repo.create(ProductCreate(name="Reusable", description=None, price=1.0, stock=0))
+    await repo.delete(created.id)
+    assert await repo.get_by_name("Reusable") is None
+    await repo.create(ProductCreate(name="Reusable", description=None, price=1.0, stock=0))
+
+
+@pytest.mark.asyncio
+async def test_get_page_walks_catalog_with_cursor(repo: InMemoryProductRepository) -> None:
+    """Get_page returns consecutive pages and no cursor on the last one."""
+    for i in range(5):
+        await repo.create(ProductCreate(name=f"P{i}", description=None, price=1.0, stock=0))
+    first = await repo.get_page(limit=2)
+    second = await repo.get_page(after=first.next_cursor, limit=2)
+    third = await repo.get_page(after=second.next_cursor, limit=2)
+    assert [p.name for p in first.items + second.items + third.items] == ["P0", "P1", "P2", "P3", "P4"]
+    assert third.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_page_does_not_drift_on_concurrent_changes(repo: InMemoryProductRepository) -> None:
+    """Deleting earlier items or the cursor item itself does not shift the next page."""
+    created = [await repo.create(ProductCreate(name=f"P{i}", description=None, price=1.0, stock=0)) for i in range(4)]
+    first = await repo.get_page(limit=2)
+    await repo.delete(created[0].id)
+    await repo.delete(created[1].id)
+    second = await repo.get_page(after=first.next_cursor, limit=2)
+    assert [p.name for p in second.items] == ["P2", "P3"]
+
+
+@pytest.mark.asyncio
+async def test_get_page_cursor_survives_compaction(repo: InMemoryProductRepository) -> None:
+    """Cursors issued before the order log is compacted still resume at the right place."""
+    created = [
+        await repo.create(ProductCreate(name=f"P{i}", description=None, price=1.0, stock=0)) for i in range(2100)
+    ]
+    page = await repo.get_page(limit=1100)
+    for product in created[:1100]:
+        await repo.delete(product.id)
+    following = await repo.get_page(after=page.next_cursor, limit=1)
+    assert following.items[0].name == "P1100"
+
+
+@pytest.mark.asyncio
+async def test_get_page_invalid_cursor_raises(repo: InMemoryProductRepository) -> None:
+    """Get_page rejects malformed cursors."""
+    with pytest.raises(InvalidCursorError):
+        await repo.get_page(after="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_create_many_reports_conflicts_in_batch_and_store(repo: InMemoryProductRepository) -> None:
+    """Create_many creates valid items and returns DuplicateValueError for store and in-batch conflicts."""
+    await repo.create(ProductCreate(name="Existing", description=None, price=1.0, stock=0))
+    results = await repo.create_many(
+        [
+            ProductCreate(name="A", description=None, price=1.0, stock=0),
+            ProductCreate(name="existing", description=None, price=1.0, stock=0),
+            ProductCreate(name="a ", description=None, price=1.0, stock=0),
+        ]
+    )
+    assert isinstance(results[0], ProductResponse)
+    assert isinstance(results[1], DuplicateValueError)
+    assert isinstance(results[2], DuplicateValueError)
+    assert len(await repo.get_all()) == 2
+
+
+@pytest.mark.asyncio
+async def test_update_many_per_item_results(repo: InMemoryProductRepository) -> None:
+    """Update_many applies valid items and reports not-found, duplicate id and name conflicts."""
+    first = await repo.create(ProductCreate(name="First", description=None, price=1.0, stock=0))
+    second = await repo.create(ProductCreate(name="Second", description=None, price=1.0, stock=0))
+    results = await repo.update_many(
+        [
+            ProductBulkUpdate(id=first.id, price=5.0),
+            ProductBulkUpdate(id=first.id, price=6.0),
+            ProductBulkUpdate(id=second.id, name="FIRST"),
+            ProductBulkUpdate(id=uuid4(), price=1.0),
+        ]
+    )
+    assert isinstance(results[0], ProductResponse)
+    assert results[0].price == 5.0
+    assert isinstance(results[1], DuplicateValueError)
+    assert isinstance(results[2], DuplicateValueError)
+    assert isinstance(results[3], EntityNotFoundError)
+
+
+@pytest.mark.asyncio
+async def test_delete_many(repo: InMemoryProductRepository) -> None:
+    """Delete_many returns one flag per id."""
+    created = await repo.create(ProductCreate(name="Gone", description=None, price=1.0, stock=0))
+    assert await repo.delete_many([created.id, uuid4()]) == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_iter_all_survives_mutation_between_batches(repo: InMemoryProductRepository) -> None:
+    """Iter_all yields every live product once even if the catalog changes mid-iteration."""
+    created = [await repo.create(ProductCreate(name=f"P{i}", description=None, price=1.0, stock=0)) for i in range(5)]
+    names = []
+    async for product in repo.iter_all(batch_size=2):
+        names.append(product.name)
+        if product.name == "P1":
+            await repo.delete(created[3].id)
+            await repo.create(ProductCreate(name="Late", description=None, price=1.0, stock=0))
+    assert names == ["P0", "P1", "P2", "P4", "Late"]
+
+
+@pytest.mark.asyncio
+async def test_get_page_skips_deleted_entries_in_bounded_work(repo: InMemoryProductRepository) -> None:
+    """A page after a long run of deletions (below the compaction threshold) reads O(limit) order entries."""
+    created = [
+        await repo.create(ProductCreate(name=f"P{i}", description=None, price=1.0, stock=0)) for i in range(5000)
+    ]
+    for product in created[:2000]:
+        await repo.delete(product.id)
+    await repo.get_page(limit=10)  # primeira travessia comprime os ponteiros
+
+    class CountingList(list):
+        reads = 0
+
+        def __getitem__(self, index):  # noqa: ANN001, ANN204
+            CountingList.reads += 1
+            return super().__getitem__(index)
+
+    repo._order_ids = CountingList(repo._order_ids)
+    for _ in range(3):
+        page = await repo.get_page(limit=10)
+        assert page.items[0].name == "P2000"
+    assert CountingList.reads <= 3 * 10
+
+
+async def test_catalog_version_changes_only_on_writes(repo: InMemoryProductRepository) -> None:
+    """Bump the catalog version on every write and keep it stable across reads."""
+    version = await repo.get_catalog_version()
+    product = await repo.create(ProductCreate(name="Version", price=1.0, stock=1))
+    await repo.get_all()
+    after_create = await repo.get_catalog_version()
+    assert after_create != version
+    assert await repo.get_catalog_version() == after_create
+
+    await repo.update(product.id, ProductUpdate(stock=2))
+    after_update = await repo.get_catalog_version()
+    assert after_update != after_create
+
+    await repo.delete(product.id)
+    assert await repo.get_catalog_version() != after_update
+
+
+async def test_update_increments_version_and_checks_expected_version(repo: InMemoryProductRepository) -> None:
+    """Bump the version on each update and reject a stale expected version."""
+    product = await repo.create(ProductCreate(name="Versioned", price=1.0, stock=1))
+    assert product.version == 1
+
+    updated = await repo.update(product.id, ProductUpdate(stock=2), expected_version=1)
+    assert updated is not None
+    assert updated.version == 2
+
+    with pytest.raises(VersionConflictError) as exc_info:
+        await repo.update(product.id, ProductUpdate(stock=3), expected_version=1)
+    assert exc_info.value.current_version == 2
+    stored = await repo.get_by_id(product.id)
+    assert stored is not None
+    assert stored.stock == 2
+
+
+async def test_update_many_reports_version_conflicts_per_item(repo: InMemoryProductRepository) -> None:
+    """Return VersionConflictError for batch items whose expected version is stale."""
+    first = await repo.create(ProductCreate(name="First CAS", price=1.0, stock=1))
+    second = await repo.create(ProductCreate(name="Second CAS", price=1.0, stock=1))
+
+    results = await repo.update_many(
+        [
+            ProductBulkUpdate(id=first.id, stock=5, expected_version=1),
+            ProductBulkUpdate(id=second.id, stock=5, expected_version=9),
+        ]
+    )
+
+    assert isinstance(results[0], ProductResponse)
+    assert results[0].version == 2
+    assert isinstance(results[1], VersionConflictError)
+
+
+async def _walk(repo: InMemoryProductRepository, query: ProductQuery, limit: int) -> list[ProductResponse]:
+    items: list[ProductResponse] = []
+    after = None
+    while True:
+        page = await repo.find_page(query, after=after, limit=limit)
+        items.extend(page.items)
+        if page.next_cursor is None:
+            return items
+        after = page.next_cursor
+
+
+def _expected(catalog: list[ProductResponse], query: ProductQuery) -> list[ProductResponse]:
+    prefix = (query.name_prefix or "").casefold()
+    matches = [
+        (index, product)
+        for index, product in enumerate(catalog)
+        if (query.price_min is None or product.price >= query.price_min)
+        and (query.price_max is None or product.price <= query.price_max)
+        and (query.in_stock is None or (product.stock > 0) == query.in_stock)
+        and (query.created_since is None or product.created_at >= query.created_since)
+        and (query.created_until is None or product.created_at <= query.created_until)
+        and product.name.casefold().startswith(prefix)
+    ]
+    if query.sort is not None:
+        field = query.sort.removeprefix("-")
+        # Decrescente é exatamente o crescente ao contrário, inclusive no desempate.
+        matches.sort(key=lambda entry: (getattr(entry[1], field), entry[0]), reverse=query.sort.startswith("-"))
+    return [product for _, product in matches]
+
+
+QUERIES = [
+    ProductQuery(price_min=3.0, price_max=7.0),
+    ProductQuery(in_stock=True, name_prefix="item 1"),
+    ProductQuery(in_stock=False, sort="-price"),
+    ProductQuery(sort="price"),
+    ProductQuery(sort="-stock", price_max=5.0),
+    ProductQuery(sort="created_at", name_prefix="ITEM"),
+    ProductQuery(sort="-created_at"),
+    ProductQuery(name_prefix="nothing"),
+    ProductQuery(price_min=10.0),
+    ProductQuery(price_max=1.0, sort="-created_at"),
+    ProductQuery(price_min=2.0, price_max=2.0, in_stock=True, sort="stock"),
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+async def test_find_page_matches_filtered_sorted_catalog(repo: InMemoryProductRepository, query: ProductQuery) -> None:
+    """Walk filtered and sorted pages and get the same items as filtering the whole catalog."""
+    await repo.create_many(
+        [ProductCreate(name=f"Item {i}", price=float(i % 10 + 1), stock=i % 4) for i in range(40)]
+        + [ProductCreate(name=f"Other {i}", price=float(i % 3 + 1), stock=i % 2) for i in range(10)]
+    )
+    catalog = await repo.get_all(limit=100)
+
+    assert await _walk(repo, query, limit=3) == _expected(catalog, query)
+    assert await repo.count(query) == len(_expected(catalog, query))
+
+
+async def test_find_page_filters_by_creation_range(repo: InMemoryProductRepository) -> None:
+    """Filter and count by an inclusive created_at range, with and without sorting."""
+    for i in range(30):
+        await repo.create(ProductCreate(name=f"Timed {i}", price=float(30 - i), stock=i % 3))
+    catalog = await repo.get_all(limit=100)
+    queries = [
+        ProductQuery(created_since=catalog[10].created_at),
+        ProductQuery(created_until=catalog[5].created_at, sort="-price"),
+        ProductQuery(created_since=catalog[8].created_at, created_until=catalog[20].created_at, sort="created_at"),
+        ProductQuery(created_since=catalog[25].created_at, in_stock=False, sort="-stock"),
+    ]
+
+    for query in queries:
+        assert await _walk(repo, query, limit=4) == _expected(catalog, query)
+        assert await repo.count(query) == len(_expected(catalog, query))
+
+
+async def test_find_page_follows_updates_deletes_and_compaction(repo: InMemoryProductRepository) -> None:
+    """Reflect updates and deletes in filters and sorting, also after the order log is compacted."""
+    created = await repo.create_many([ProductCreate(name=f"Bulk {i}", price=1.0 + i % 50) for i in range(1500)])
+    ids = [product.id for product in created if isinstance(product, ProductResponse)]
+    await repo.delete_many(ids[:1200])
+    await repo.update(ids[-1], ProductUpdate(price=0.5, name="Cheapest"))
+
+    cheapest = await repo.find_page(ProductQuery(sort="price"), limit=1)
+    assert [product.name for product in cheapest.items] == ["Cheapest"]
+    assert await _walk(repo, ProductQuery(price_min=1.0), limit=50) == [
+        product for product in await repo.get_all(limit=1000) if product.price >= 1.0
+    ]
+    assert (await repo.find_page(ProductQuery(name_prefix="bulk 1 "))).items == []
+
+    catalog = await repo.get_all(limit=1000)
+    for query in (ProductQuery(price_max=3.0, sort="-price"), ProductQuery(price_min=49.0), ProductQuery(sort="stock")):
+        assert await _walk(repo, query, limit=7) == _expected(catalog, query)
+        assert await repo.count(query) == len(_expected(catalog, query))
+
+
+async def test_find_page_rejects_cursor_of_other_listing(repo: InMemoryProductRepository) -> None:
+    """Reject a sorted cursor used with another sort or without sorting."""
+    await repo.create_many([ProductCreate(name=f"C{i}", price=float(i + 1)) for i in range(3)])
+    page = await repo.find_page(ProductQuery(sort="price"), limit=1)
+    assert page.next_cursor is not None
+
+    with pytest.raises(InvalidCursorError):
+        await repo.find_page(ProductQuery(sort="-price"), after=page.next_cursor)
+    with pytest.raises(InvalidCursorError):
+        await repo.find_page(ProductQuery(in_stock=False), after=page.next_cursor)
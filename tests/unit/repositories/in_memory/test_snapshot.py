@@ -0,0 +1,105 @@
+"""Unit tests for in-memory snapshots (src.repositories.in_memory.snapshot / snapshotter)."""
+
+from pathlib import Path
+
+import pytest
+
+from src.models.product import ProductCreate, ProductQuery, ProductUpdate
+from src.repositories.in_memory import (
+    InMemoryProductRepository,
+    ProductSnapshotter,
+    SnapshotError,
+    read_snapshot,
+    write_snapshot,
+)
+
+
+async def _populated_repo() -> InMemoryProductRepository:
+    repo = InMemoryProductRepository()
+    for index in range(10):
+        description = None if index % 2 else f"Descrição {index} ✓"
+        await repo.create(
+            ProductCreate(name=f"Produto {index}", description=description, price=index + 0.5, stock=index)
+        )
+    products = await repo.get_all()
+    await repo.update(products[3].id, ProductUpdate(stock=99))
+    await repo.delete(products[5].id)
+    return repo
+
+
+async def test_snapshot_round_trip_restores_products_and_order(tmp_path: Path) -> None:
+    """Write and read back a snapshot: products, versions, timestamps and order are preserved."""
+    repo = await _populated_repo()
+    first_page = await repo.get_page(limit=4)
+    path = tmp_path / "products.snap"
+
+    size = write_snapshot(path, repo.capture_snapshot())
+    snapshot = read_snapshot(path)
+
+    assert snapshot is not None
+    assert size == path.stat().st_size
+    restored = InMemoryProductRepository()
+    restored.restore_snapshot(snapshot)
+    assert await restored.get_all() == await repo.get_all()
+    # Cursores emitidos antes do reinício continuam válidos.
+    assert first_page.next_cursor is not None
+    assert await restored.get_page(after=first_page.next_cursor) == await repo.get_page(after=first_page.next_cursor)
+    assert await restored.get_by_name("produto 3") == await repo.get_by_name("Produto 3")
+    # Os índices ordenados são remontados junto com as colunas.
+    query = ProductQuery(price_max=5.0, sort="-price")
+    assert await restored.find_page(query, limit=3) == await repo.find_page(query, limit=3)
+    assert await restored.count(query) == await repo.count(query)
+
+
+async def test_restored_repository_accepts_writes(tmp_path: Path) -> None:
+    """A restored repository keeps name uniqueness and appends new products after the restored ones."""
+    repo = await _populated_repo()
+    path = tmp_path / "products.snap"
+    write_snapshot(path, repo.capture_snapshot())
+    snapshot = read_snapshot(path)
+    assert snapshot is not None
+    restored = InMemoryProductRepository()
+    restored.restore_snapshot(snapshot)
+
+    created = await restored.create(ProductCreate(name="Novo", price=1.0))
+
+    assert (await restored.get_all(limit=100))[-1] == created
+    assert await restored.get_catalog_version() != await repo.get_catalog_version()
+
+
+def test_read_snapshot_missing_file_returns_none(tmp_path: Path) -> None:
+    """A missing snapshot means an empty start, not an error."""
+    assert read_snapshot(tmp_path / "missing.snap") is None
+
+
+async def test_read_snapshot_rejects_corrupted_file(tmp_path: Path) -> None:
+    """A flipped byte or a truncated file raises SnapshotError."""
+    path = tmp_path / "products.snap"
+    write_snapshot(path, (await _populated_repo()).capture_snapshot())
+    data = bytearray(path.read_bytes())
+
+    data[40] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(SnapshotError, match="checksum"):
+        read_snapshot(path)
+
+    path.write_bytes(bytes(data[:10]))
+    with pytest.raises(SnapshotError, match="truncated"):
+        read_snapshot(path)
+
+
+async def test_snapshotter_loads_on_start_and_writes_only_on_change(tmp_path: Path) -> None:
+    """The snapshotter skips unchanged catalogs and writes a final snapshot on stop."""
+    path = tmp_path / "data" / "products.snap"
+    repo = InMemoryProductRepository()
+    snapshotter = ProductSnapshotter(repo, path, interval_seconds=3600)
+
+    await snapshotter.start()
+    assert await snapshotter.snapshot() is False
+    await repo.create(ProductCreate(name="Persistido", price=1.0))
+    await snapshotter.stop()
+
+    assert path.exists()
+    reloaded = InMemoryProductRepository()
+    assert await ProductSnapshotter(reloaded, path).load() == 1
+    assert await reloaded.get_by_name("Persistido") is not None
@@ -0,0 +1,73 @@
+"""Unit tests for SortedIndex (src.repositories.in_memory.sorted_index)."""
+
+import random
+import sys
+from itertools import chain
+
+import pytest
+
+from src.repositories.in_memory.sorted_index import SortedIndex
+
+
+def _range(index: SortedIndex, low: tuple[float, int] | None, high: tuple[float, int] | None) -> list[int]:
+    return list(chain.from_iterable(index.chunks(low, high)))
+
+
+def _reference(
+    pairs: set[tuple[float, int]], low: tuple[float, int] | None, high: tuple[float, int] | None
+) -> list[int]:
+    return [
+        position
+        for value, position in sorted(pairs)
+        if (low is None or (value, position) >= low) and (high is None or (value, position) < high)
+    ]
+
+
+def test_sorted_index_matches_sorted_pairs_across_block_splits_and_removals() -> None:
+    """Keep ranges, reverse walks and counts equal to a sorted list through many inserts and removals."""
+    rng = random.Random(7)
+    index = SortedIndex("q")
+    pairs: set[tuple[float, int]] = set()
+    for position in range(6000):
+        value = rng.randrange(50)
+        index.add(value, position)
+        pairs.add((value, position))
+    for value, position in rng.sample(sorted(pairs), 4500):
+        index.remove(value, position)
+        pairs.discard((value, position))
+
+    assert len(index) == len(pairs)
+    bounds = [None, (0, 0), (10, 0), (10, sys.maxsize), (25, 3000), (49, sys.maxsize), (60, 0)]
+    for low in bounds:
+        for high in bounds:
+            expected = _reference(pairs, low, high)
+            assert _range(index, low, high) == expected
+            assert list(chain.from_iterable(index.chunks(low, high, reverse=True))) == expected[::-1]
+            assert index.count(low, high) == len(expected)
+
+
+def test_from_column_orders_ties_by_position_and_remap_keeps_order() -> None:
+    """Build from a column with ties in position order, then renumber positions after a compaction."""
+    column = [3.5, 1.0, 3.5, 2.0, 1.0]
+    index = SortedIndex.from_column("d", column, range(len(column)))
+    assert _range(index, None, None) == [1, 4, 3, 0, 2]
+
+    index.remove(2.0, 3)
+    index.remap([0, 1, 2, 0, 3])
+    index.add(0.5, 4)
+    assert _range(index, None, None) == [4, 1, 3, 0, 2]
+    assert _range(index, (1.0, 0), (3.5, 0)) == [1, 3]
+
+
+def test_remove_missing_pair_raises_key_error() -> None:
+    """Removing a pair that is not indexed is an error, also when the value exists at another position."""
+    index = SortedIndex("d")
+    index.add(1.0, 0)
+
+    with pytest.raises(KeyError):
+        index.remove(1.0, 1)
+    with pytest.raises(KeyError):
+        index.remove(2.0, 0)
+    index.remove(1.0, 0)
+    assert len(index) == 0
+    assert _range(index, None, None) == []
@@ -0,0 +1,116 @@
+"""Unit tests for the in-memory write-ahead log (src.repositories.in_memory.wal)."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.models.product import ProductCreate, ProductUpdate
+from src.repositories.in_memory import InMemoryProductRepository, ProductSnapshotter, WalError, WriteAheadLog
+
+
+async def _started(tmp_path: Path, window: float = 0.0) -> tuple[InMemoryProductRepository, ProductSnapshotter]:
+    wal = WriteAheadLog(tmp_path / "wal", group_commit_window_seconds=window)
+    repo = InMemoryProductRepository(wal=wal)
+    snapshotter = ProductSnapshotter(repo, tmp_path / "products.snap", interval_seconds=3600, wal=wal)
+    await snapshotter.start()
+    return repo, snapshotter
+
+
+async def test_replay_restores_writes_without_snapshot(tmp_path: Path) -> None:
+    """Creates, updates and deletes acknowledged before a crash are replayed on the next boot."""
+    repo, _ = await _started(tmp_path)
+    first = await repo.create(ProductCreate(name="Primeiro", price=1.0))
+    second = await repo.create(ProductCreate(name="Segundo", price=2.0))
+    await repo.update(first.id, ProductUpdate(name="Renomeado", stock=7))
+    await repo.delete(second.id)
+    await repo.create(ProductCreate(name="Terceiro", price=3.0))
+    # Queda: nenhum snapshot foi gravado e o WAL não foi fechado.
+
+    reloaded, _ = await _started(tmp_path)
+
+    assert await reloaded.get_all() == await repo.get_all()
+    assert await reloaded.get_by_name("primeiro") is None
+    assert (await reloaded.get_by_id(first.id)) == (await repo.get_by_id(first.id))
+    assert await reloaded.get_catalog_version() != ""
+    created = await reloaded.create(ProductCreate(name="Quarto", price=4.0))
+    assert [product.id for product in await reloaded.get_all()][-1] == created.id
+
+
+async def test_replay_applies_only_entries_after_snapshot(tmp_path: Path) -> None:
+    """Entries already covered by the snapshot are skipped and later ones are applied on top."""
+    repo, snapshotter = await _started(tmp_path)
+    product = await repo.create(ProductCreate(name="Produto", price=1.0, stock=1))
+    assert await snapshotter.snapshot() is True
+    await repo.update(product.id, ProductUpdate(stock=2))
+
+    reloaded, _ = await _started(tmp_path)
+
+    restored = await reloaded.get_by_id(product.id)
+    assert restored is not None
+    assert restored.stock == 2
+    assert restored.version == 2
+
+
+async def test_torn_tail_is_truncated(tmp_path: Path) -> None:
+    """A partially written last batch is discarded instead of failing the boot."""
+    repo, _ = await _started(tmp_path)
+    kept = await repo.create(ProductCreate(name="Mantido", price=1.0))
+    await repo.create(ProductCreate(name="Cortado", price=1.0))
+    segment = sorted((tmp_path / "wal").iterdir())[-1]
+    segment.write_bytes(segment.read_bytes()[:-5])
+
+    reloaded, _ = await _started(tmp_path)
+
+    assert [product.id for product in await reloaded.get_all()] == [kept.id]
+
+
+async def test_corruption_before_later_data_is_an_error(tmp_path: Path) -> None:
+    """Corruption followed by valid segments is reported instead of silently dropping writes."""
+    repo, _ = await _started(tmp_path)
+    await repo.create(ProductCreate(name="Produto", price=1.0))
+    await _started(tmp_path)
+    first_segment = sorted((tmp_path / "wal").iterdir())[0]
+    data = bytearray(first_segment.read_bytes())
+    data[10] ^= 0xFF
+    first_segment.write_bytes(bytes(data))
+    (tmp_path / "wal" / "wal-00000099.log").write_bytes(b"x")
+
+    with pytest.raises(WalError, match="corrupted"):
+        await _started(tmp_path)
+
+
+async def test_group_commit_batches_concurrent_writers(tmp_path: Path) -> None:
+    """Concurrent writers inside the group commit window share one fsync."""
+    repo, _ = await _started(tmp_path, window=0.01)
+    wal = repo._wal  # noqa: SLF001 - inspeção dos contadores do WAL
+    assert wal is not None
+
+    await asyncio.gather(*(repo.create(ProductCreate(name=f"Produto {i}", price=1.0)) for i in range(50)))
+
+    assert wal.entries == 50
+    assert wal.batches < 5
+
+
+async def test_snapshot_compacts_log(tmp_path: Path) -> None:
+    """A snapshot drops the segments it covers and the state survives a restart."""
+    repo, snapshotter = await _started(tmp_path)
+    for index in range(5):
+        await repo.create(ProductCreate(name=f"Produto {index}", price=1.0))
+    await snapshotter.snapshot()
+    await repo.create(ProductCreate(name="Depois", price=1.0))
+
+    segments = sorted((tmp_path / "wal").iterdir())
+    assert len(segments) == 1
+    await snapshotter.stop()
+
+    reloaded, _ = await _started(tmp_path)
+    assert len(await reloaded.get_all()) == 6
+
+
+async def test_append_requires_open_log(tmp_path: Path) -> None:
+    """Writes fail loudly if the log was never opened."""
+    repo = InMemoryProductRepository(wal=WriteAheadLog(tmp_path))
+
+    with pytest.raises(RuntimeError, match="not open"):
+        await repo.create(ProductCreate(name="Produto", price=1.0))
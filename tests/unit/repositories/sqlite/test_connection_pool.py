@@ -0,0 +1,50 @@
+"""Unit tests for SqliteConnectionPool (src.repositories.sqlite.connection_pool)."""
+
+import asyncio
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.repositories.sqlite import SqliteConnectionPool
+
+
+@pytest.fixture
+def pool(tmp_path: Path) -> Iterator[SqliteConnectionPool]:
+    """Pool on a temporary file with a single-column table."""
+    connection_pool = SqliteConnectionPool(tmp_path / "pool.db", size=1)
+    connection_pool.write_sync(lambda connection: connection.execute("CREATE TABLE items (name TEXT)"))
+    yield connection_pool
+    connection_pool.close()
+
+
+async def test_cancelled_write_keeps_lock_until_transaction_ends(pool: SqliteConnectionPool) -> None:
+    """Cancel a write mid-transaction: the next write waits for it and both commit cleanly."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_insert(connection: sqlite3.Connection) -> None:
+        started.set()
+        release.wait(timeout=5)
+        connection.execute("INSERT INTO items VALUES ('first')")
+
+    first = asyncio.create_task(pool.write(slow_insert))
+    await asyncio.to_thread(started.wait, 5)
+    first.cancel()
+    second = asyncio.create_task(
+        pool.write(lambda connection: connection.execute("INSERT INTO items VALUES ('second')"))
+    )
+    await asyncio.sleep(0.05)
+
+    # A thread ainda está dentro da transação: a segunda escrita não pode ter começado.
+    assert not first.done()
+    assert not second.done()
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    await second
+
+    rows = await pool.read(lambda connection: connection.execute("SELECT name FROM items ORDER BY rowid").fetchall())
+    assert rows == [("first",), ("second",)]
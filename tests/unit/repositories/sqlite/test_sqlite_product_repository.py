@@ -0,0 +1,239 @@
+"""Unit tests for SqliteProductRepository (src.repositories.sqlite.sqlite_product_repository)."""
+
+import asyncio
+from collections.abc import Iterator
+from datetime import timedelta, timezone
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from src.core.exceptions import (
+    DuplicateValueError,
+    EntityNotFoundError,
+    InvalidCursorError,
+    InvalidEntityError,
+    VersionConflictError,
+)
+from src.models.product import ProductBulkUpdate, ProductCreate, ProductQuery, ProductResponse, ProductUpdate
+from src.repositories.in_memory import InMemoryProductRepository
+from src.repositories.interfaces.product_repository import IProductRepository
+from src.repositories.sqlite import SqliteConnectionPool, SqliteProductRepository
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Iterator[SqliteProductRepository]:
+    """Fresh SQLite repository on a temporary file."""
+    repository = SqliteProductRepository(SqliteConnectionPool(tmp_path / "products.db", size=2))
+    yield repository
+    repository.close()
+
+
+async def test_create_and_read_back(repo: SqliteProductRepository) -> None:
+    """Create a product and read it back by id and case-insensitive name."""
+    created = await repo.create(ProductCreate(name="Café", description="Torrado", price=12.5, stock=3))
+
+    assert await repo.get_by_id(created.id) == created
+    assert await repo.get_by_name("  CAFÉ ") == created
+    assert await repo.get_by_id(uuid4()) is None
+    assert await repo.get_by_name("Chá") is None
+
+
+async def test_create_duplicate_name_raises(repo: SqliteProductRepository) -> None:
+    """Reject a second product whose normalized name already exists."""
+    await repo.create(ProductCreate(name="Unique", price=1.0))
+
+    with pytest.raises(DuplicateValueError):
+        await repo.create(ProductCreate(name="unique ", price=1.0))
+
+
+async def test_pages_keep_order_and_do_not_drift(repo: SqliteProductRepository) -> None:
+    """Walk the catalog with cursors; deleting earlier items does not shift the next page."""
+    created = [await repo.create(ProductCreate(name=f"P{i}", price=1.0)) for i in range(5)]
+    first = await repo.get_page(limit=2)
+    await repo.delete(created[0].id)
+    await repo.delete(created[1].id)
+    second = await repo.get_page(after=first.next_cursor, limit=2)
+    third = await repo.get_page(after=second.next_cursor, limit=2)
+
+    assert [p.name for p in first.items + second.items + third.items] == ["P0", "P1", "P2", "P3", "P4"]
+    assert third.next_cursor is None
+    assert [p.name for p in await repo.get_all(skip=1, limit=2)] == ["P3", "P4"]
+    assert [p.name async for p in repo.iter_all(batch_size=2)] == ["P2", "P3", "P4"]
+    with pytest.raises(InvalidCursorError):
+        await repo.get_page(after="not-a-cursor")
+
+
+async def test_update_checks_version_and_name(repo: SqliteProductRepository) -> None:
+    """Bump the version on update, reject stale versions and names owned by another product."""
+    product = await repo.create(ProductCreate(name="Versioned", price=1.0, stock=1))
+    await repo.create(ProductCreate(name="Taken", price=1.0))
+
+    updated = await repo.update(product.id, ProductUpdate(stock=2), expected_version=1)
+    assert updated is not None
+    assert updated.version == 2
+    assert await repo.get_by_id(product.id) == updated
+    with pytest.raises(VersionConflictError):
+        await repo.update(product.id, ProductUpdate(stock=3), expected_version=1)
+    with pytest.raises(DuplicateValueError):
+        await repo.update(product.id, ProductUpdate(name="TAKEN"))
+    assert await repo.update(uuid4(), ProductUpdate(stock=1)) is None
+
+    renamed = await repo.update(product.id, ProductUpdate(name="Renamed"))
+    assert renamed is not None
+    assert await repo.get_by_name("renamed") == renamed
+    assert await repo.get_by_name("versioned") is None
+
+
+async def test_batches_report_per_item_results(repo: SqliteProductRepository) -> None:
+    """Batch methods apply valid items and report per-item errors."""
+    created = await repo.create_many(
+        [
+            ProductCreate(name="A", price=1.0),
+            ProductCreate(name="a ", price=1.0),
+            ProductCreate(name="B", price=1.0),
+        ]
+    )
+    assert isinstance(created[0], ProductResponse)
+    assert isinstance(created[1], DuplicateValueError)
+    assert isinstance(created[2], ProductResponse)
+
+    first, second = created[0], created[2]
+    updated = await repo.update_many(
+        [
+            ProductBulkUpdate(id=first.id, price=5.0),
+            ProductBulkUpdate(id=first.id, price=6.0),
+            ProductBulkUpdate(id=second.id, name="a"),
+            ProductBulkUpdate(id=second.id, stock=1, expected_version=9),
+            ProductBulkUpdate(id=uuid4(), price=1.0),
+        ]
+    )
+    assert isinstance(updated[0], ProductResponse)
+    assert updated[0].price == 5.0
+    assert isinstance(updated[1], DuplicateValueError)
+    assert isinstance(updated[2], DuplicateValueError)
+    assert isinstance(updated[3], DuplicateValueError)
+    assert isinstance(updated[4], EntityNotFoundError)
+
+    assert await repo.delete_many([first.id, uuid4()]) == [True, False]
+    assert [p.name for p in await repo.get_all()] == ["B"]
+
+
+async def test_update_many_reports_invalid_and_version_conflicts(repo: SqliteProductRepository) -> None:
+    """Return VersionConflictError and InvalidEntityError per item without aborting the batch."""
+    product = await repo.create(ProductCreate(name="CAS", price=1.0, stock=1))
+    other = await repo.create(ProductCreate(name="Other", price=1.0, stock=1))
+
+    results = await repo.update_many(
+        [
+            ProductBulkUpdate(id=product.id, stock=5, expected_version=9),
+            ProductBulkUpdate.model_construct(id=other.id, name="   "),
+            ProductBulkUpdate(id=other.id, stock=7, expected_version=1),
+        ]
+    )
+
+    assert isinstance(results[0], VersionConflictError)
+    assert isinstance(results[1], InvalidEntityError)
+    assert isinstance(results[2], DuplicateValueError)
+
+
+async def test_catalog_version_is_shared_and_changes_on_writes(tmp_path: Path) -> None:
+    """Two repositories on the same file see the same catalog and catalog version."""
+    path = tmp_path / "shared.db"
+    first = SqliteProductRepository(SqliteConnectionPool(path, size=1))
+    second = SqliteProductRepository(SqliteConnectionPool(path, size=1))
+    try:
+        version = await first.get_catalog_version()
+        product = await first.create(ProductCreate(name="Shared", price=1.0))
+        assert await second.get_catalog_version() == await first.get_catalog_version() != version
+        assert await second.get_by_id(product.id) == product
+        await second.delete(product.id)
+        assert await first.get_by_id(product.id) is None
+        unchanged = await first.get_catalog_version()
+        assert await first.delete_many([product.id]) == [False]
+        assert await first.get_catalog_version() == unchanged
+    finally:
+        first.close()
+        second.close()
+
+
+async def test_concurrent_creates_keep_names_unique(repo: SqliteProductRepository) -> None:
+    """Concurrent creates with the same name let exactly one through."""
+    results = await asyncio.gather(
+        *(repo.create(ProductCreate(name="Race", price=1.0)) for _ in range(10)), return_exceptions=True
+    )
+
+    assert sum(isinstance(result, ProductResponse) for result in results) == 1
+    assert sum(isinstance(result, DuplicateValueError) for result in results) == 9
+
+
+async def _walk_names(repo: IProductRepository, query: ProductQuery, limit: int) -> list[str]:
+    names: list[str] = []
+    after = None
+    while True:
+        page = await repo.find_page(query, after=after, limit=limit)
+        names.extend(product.name for product in page.items)
+        if page.next_cursor is None:
+            return names
+        after = page.next_cursor
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        ProductQuery(price_min=2.5, price_max=6.0, in_stock=True),
+        ProductQuery(name_prefix="ÁGUA", sort="-price"),
+        ProductQuery(in_stock=False, sort="stock"),
+        ProductQuery(sort="price"),
+        ProductQuery(sort="-stock", name_prefix="p"),
+        ProductQuery(price_max=2.0, sort="-price"),
+    ],
+)
+async def test_find_page_matches_in_memory_repository(repo: SqliteProductRepository, query: ProductQuery) -> None:
+    """Return the same filtered and sorted listing as the in-memory repository, page by page."""
+    entities = [ProductCreate(name=f"P{i}", price=float(i % 7 + 1), stock=i % 3) for i in range(30)] + [
+        ProductCreate(name=f"Água {i}", price=float(i % 4 + 1), stock=i % 2) for i in range(8)
+    ]
+    reference = InMemoryProductRepository()
+    for entity in entities:
+        await repo.create(entity)
+        await reference.create(entity)
+    await repo.delete((await repo.get_all(limit=1))[0].id)
+    await reference.delete((await reference.get_all(limit=1))[0].id)
+
+    assert await _walk_names(repo, query, limit=4) == await _walk_names(reference, query, limit=4)
+    assert await repo.count(query) == await reference.count(query)
+
+
+async def test_find_page_filters_by_creation_range(repo: SqliteProductRepository) -> None:
+    """Filter and count by an inclusive created_at range given in any time zone."""
+    for i in range(5):
+        await repo.create(ProductCreate(name=f"Timed {i}", price=1.0))
+    catalog = await repo.get_all()
+    since = catalog[1].created_at.astimezone(timezone(timedelta(hours=-3)))
+    query = ProductQuery(created_since=since, created_until=catalog[3].created_at, sort="-created_at")
+
+    assert await _walk_names(repo, query, limit=2) == ["Timed 3", "Timed 2", "Timed 1"]
+    assert await repo.count(query) == 3
+    assert await repo.count(ProductQuery()) == 5
+
+
+async def test_find_page_sorts_by_created_at_with_cursor(repo: SqliteProductRepository) -> None:
+    """Walk a created_at listing in both directions across a batch that shares one timestamp."""
+    await repo.create(ProductCreate(name="First", price=1.0))
+    await repo.create_many([ProductCreate(name=f"Batch {i}", price=1.0) for i in range(3)])
+
+    assert await _walk_names(repo, ProductQuery(sort="created_at"), limit=1) == [
+        "First",
+        "Batch 0",
+        "Batch 1",
+        "Batch 2",
+    ]
+    assert await _walk_names(repo, ProductQuery(sort="-created_at"), limit=1) == [
+        "Batch 2",
+        "Batch 1",
+        "Batch 0",
+        "First",
+    ]
+    with pytest.raises(InvalidCursorError):
+        await repo.find_page(ProductQuery(sort="price"), after="not-a-cursor")
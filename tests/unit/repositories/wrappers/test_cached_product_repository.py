@@ -0,0 +1,194 @@
+"""Unit tests for CachedProductRepository."""
+
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.models.product import ProductBulkUpdate, ProductCreate, ProductResponse, ProductUpdate
+from src.repositories.in_memory import InMemoryProductRepository
+from src.repositories.wrappers import CachedProductRepository, ForwardingProductRepository
+
+
+class _CountingRepository(ForwardingProductRepository):
+    """Counts the reads that reach the backing repository."""
+
+    def __init__(self) -> None:
+        super().__init__(InMemoryProductRepository())
+        self.reads = 0
+
+    async def get_by_id(self, entity_id: UUID) -> ProductResponse | None:
+        self.reads += 1
+        return await super().get_by_id(entity_id)
+
+    async def get_by_name(self, name: str) -> ProductResponse | None:
+        self.reads += 1
+        return await super().get_by_name(name)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def backend() -> _CountingRepository:
+    """Backing repository that counts reads."""
+    return _CountingRepository()
+
+
+@pytest.fixture
+def clock() -> _FakeClock:
+    """Provide a controllable monotonic clock."""
+    return _FakeClock()
+
+
+@pytest.fixture
+def cache(backend: _CountingRepository, clock: _FakeClock) -> CachedProductRepository:
+    """Small cache in front of the counting repository."""
+    return CachedProductRepository(backend, max_entries=3, ttl_seconds=10, negative_ttl_seconds=2, clock=clock)
+
+
+def _create(name: str) -> ProductCreate:
+    return ProductCreate(name=name, price=1.0, stock=1)
+
+
+async def test_repeated_reads_hit_the_cache(cache: CachedProductRepository, backend: _CountingRepository) -> None:
+    """Only the first read by ID and by name reaches the repository."""
+    product = await cache.create(_create("Hot"))
+
+    for _ in range(3):
+        assert await cache.get_by_id(product.id) == product
+        assert await cache.get_by_name(" hot ") == product
+
+    assert backend.reads == 2
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (4, 2)
+
+
+async def test_entries_expire_after_ttl(
+    cache: CachedProductRepository, backend: _CountingRepository, clock: _FakeClock
+) -> None:
+    """An expired entry is fetched again."""
+    product = await cache.create(_create("Ttl"))
+    await cache.get_by_id(product.id)
+
+    clock.now = 9.9
+    await cache.get_by_id(product.id)
+    assert backend.reads == 1
+
+    clock.now = 10.0
+    await cache.get_by_id(product.id)
+    assert backend.reads == 2
+
+
+async def test_least_recently_used_entry_is_evicted(
+    cache: CachedProductRepository, backend: _CountingRepository
+) -> None:
+    """Beyond max_entries, the least recently used entry is dropped."""
+    products = [await cache.create(_create(f"P{i}")) for i in range(4)]
+    for product in products[:3]:
+        await cache.get_by_id(product.id)
+    await cache.get_by_id(products[0].id)  # P0 volta a ser o mais recente
+    await cache.get_by_id(products[3].id)  # despeja P1
+
+    reads = backend.reads
+    await cache.get_by_id(products[0].id)
+    assert backend.reads == reads
+    await cache.get_by_id(products[1].id)
+    assert backend.reads == reads + 1
+    assert cache.stats().evictions >= 1
+    assert cache.stats().size <= 3
+
+
+async def test_not_found_is_cached_with_negative_ttl(
+    cache: CachedProductRepository, backend: _CountingRepository, clock: _FakeClock
+) -> None:
+    """Misses are cached for the (shorter) negative TTL."""
+    missing = uuid4()
+    assert await cache.get_by_id(missing) is None
+    assert await cache.get_by_id(missing) is None
+    assert backend.reads == 1
+
+    clock.now = 2.0
+    assert await cache.get_by_id(missing) is None
+    assert backend.reads == 2
+
+
+async def test_create_invalidates_negative_name_entry(cache: CachedProductRepository) -> None:
+    """A cached "not found" for a name is dropped when a product with that name is created."""
+    assert await cache.get_by_name("Fresh") is None
+    product = await cache.create(_create("Fresh"))
+    assert await cache.get_by_name("fresh") == product
+
+
+async def test_update_invalidates_id_and_names(cache: CachedProductRepository) -> None:
+    """After an update, reads by ID, old name and new name reflect the change."""
+    product = await cache.create(_create("Old"))
+    await cache.get_by_id(product.id)
+    await cache.get_by_name("Old")
+    assert await cache.get_by_name("New") is None
+
+    updated = await cache.update(product.id, ProductUpdate(name="New"))
+
+    assert await cache.get_by_id(product.id) == updated
+    assert await cache.get_by_name("Old") is None
+    assert await cache.get_by_name("New") == updated
+
+
+async def test_delete_invalidates_entries(cache: CachedProductRepository) -> None:
+    """A deleted product is no longer served from the cache."""
+    product = await cache.create(_create("Gone"))
+    await cache.get_by_id(product.id)
+    await cache.get_by_name("Gone")
+
+    assert await cache.delete(product.id)
+
+    assert await cache.get_by_id(product.id) is None
+    assert await cache.get_by_name("Gone") is None
+
+
+async def test_batch_writes_invalidate_entries(cache: CachedProductRepository) -> None:
+    """Batch update and delete invalidate every affected entry."""
+    first, second = await cache.create_many([_create("A"), _create("B")])
+    assert isinstance(first, ProductResponse)
+    assert isinstance(second, ProductResponse)
+    await cache.get_by_id(first.id)
+    await cache.get_by_id(second.id)
+
+    await cache.update_many([ProductBulkUpdate(id=first.id, stock=9)])
+    await cache.delete_many([second.id])
+
+    refreshed = await cache.get_by_id(first.id)
+    assert refreshed is not None
+    assert refreshed.stock == 9
+    assert await cache.get_by_id(second.id) is None
+
+
+class _WriteDuringRead(ForwardingProductRepository):
+    """Runs a write through the cache while a read is in flight."""
+
+    cache: CachedProductRepository
+
+    async def get_by_id(self, entity_id: UUID) -> ProductResponse | None:
+        result = await super().get_by_id(entity_id)
+        await self.cache.update(entity_id, ProductUpdate(stock=42))
+        return result
+
+
+async def test_read_overlapping_a_write_is_not_cached(backend: _CountingRepository) -> None:
+    """A read that overlaps a write does not store its (stale) result."""
+    product = await backend.create(_create("Race"))
+    racing = _WriteDuringRead(backend)
+    cache = racing.cache = CachedProductRepository(racing)
+
+    stale = await cache.get_by_id(product.id)
+    assert stale is not None
+    assert stale.stock == 1
+
+    fresh = await backend.get_by_id(product.id)
+    assert fresh is not None
+    assert fresh.stock == 42
+    assert cache.stats().size == 0
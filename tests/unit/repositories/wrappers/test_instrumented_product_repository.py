@@ -0,0 +1,56 @@
+"""Unit tests for InstrumentedProductRepository."""
+
+from uuid import uuid4
+
+import pytest
+
+from src.core.metrics import REPOSITORY_OPERATION_DURATION_SECONDS, REPOSITORY_OPERATION_ERRORS_TOTAL
+from src.models.product import ProductCreate
+from src.repositories.in_memory import InMemoryProductRepository
+from src.repositories.wrappers import InstrumentedProductRepository
+
+
+def _duration_count(operation: str) -> int:
+    return REPOSITORY_OPERATION_DURATION_SECONDS.labels("InMemoryProductRepository", operation).count
+
+
+def _error_count(operation: str) -> float:
+    return REPOSITORY_OPERATION_ERRORS_TOTAL.labels("InMemoryProductRepository", operation).value
+
+
+@pytest.fixture
+def repository() -> InstrumentedProductRepository:
+    """Instrumented in-memory repository."""
+    return InstrumentedProductRepository(InMemoryProductRepository())
+
+
+async def test_operations_are_forwarded_and_timed(repository: InstrumentedProductRepository) -> None:
+    """Each operation returns the inner result and records one observation."""
+    creates, reads = _duration_count("create"), _duration_count("get_by_id")
+
+    product = await repository.create(ProductCreate(name="Timed", price=1.0, stock=1))
+    assert await repository.get_by_id(product.id) == product
+    assert await repository.get_by_id(uuid4()) is None
+
+    assert _duration_count("create") == creates + 1
+    assert _duration_count("get_by_id") == reads + 2
+
+
+async def test_iter_all_is_timed_once_per_iteration(repository: InstrumentedProductRepository) -> None:
+    """A full iteration is recorded as a single observation."""
+    for i in range(3):
+        await repository.create(ProductCreate(name=f"P{i}", price=1.0, stock=1))
+    before = _duration_count("iter_all")
+
+    names = [product.name async for product in repository.iter_all(batch_size=2)]
+
+    assert names == ["P0", "P1", "P2"]
+    assert _duration_count("iter_all") == before + 1
+
+
+async def test_failures_are_counted_and_reraised(repository: InstrumentedProductRepository) -> None:
+    """Exceptions from the inner repository are counted and propagated."""
+    before = _error_count("get_page")
+    with pytest.raises(Exception):  # noqa: B017
+        await repository.get_page(after="not-a-cursor")
+    assert _error_count("get_page") == before + 1
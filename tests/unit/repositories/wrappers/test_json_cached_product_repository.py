@@ -0,0 +1,83 @@
+"""Unit tests for ProductJsonCache and JsonCachedProductRepository."""
+
+import sys
+
+from pydantic import TypeAdapter
+
+from src.models.product import ProductBulkUpdate, ProductCreate, ProductResponse, ProductUpdate
+from src.repositories.in_memory import InMemoryProductRepository
+from src.repositories.wrappers import JsonCachedProductRepository, ProductJsonCache
+
+
+async def _products(count: int) -> tuple[InMemoryProductRepository, list[ProductResponse]]:
+    store = InMemoryProductRepository()
+    created = await store.create_many([ProductCreate(name=f"P{i}", price=1.5, stock=i) for i in range(count)])
+    return store, [product for product in created if isinstance(product, ProductResponse)]
+
+
+async def test_dump_matches_pydantic_and_reuses_bytes() -> None:
+    """Serialize like pydantic, and return the same bytes object on the next read."""
+    _, products = await _products(3)
+    cache = ProductJsonCache()
+
+    first = cache.dump(products[0])
+
+    assert first == products[0].model_dump_json().encode()
+    assert cache.dump(products[0]) is first
+    assert cache.dump_list(products) == TypeAdapter(list[ProductResponse]).dump_json(products)
+    assert cache.dump_list([]) == b"[]"
+    assert len(cache) == 3
+    assert cache.nbytes == sum(sys.getsizeof(cache.dump(product)) for product in products)
+
+
+async def test_new_version_is_reserialized() -> None:
+    """A product in another version never gets the bytes of the old one."""
+    store, [product] = await _products(1)
+    cache = ProductJsonCache()
+    old = cache.dump(product)
+
+    updated = await store.update(product.id, ProductUpdate(stock=99))
+    assert updated is not None
+
+    assert b'"stock":99' in cache.dump(updated)
+    assert cache.dump(product) == old
+    assert len(cache) == 1
+
+
+async def test_memory_bound_evicts_least_recently_used() -> None:
+    """Stay under max_bytes by dropping the least recently used entries."""
+    _, products = await _products(3)
+    entry_size = sys.getsizeof(products[0].model_dump_json().encode())
+    cache = ProductJsonCache(max_bytes=entry_size * 2 + 1)
+
+    cache.dump(products[0])
+    cache.dump(products[1])
+    cache.dump(products[0])
+    cache.dump(products[2])
+
+    assert len(cache) == 2
+    assert cache.nbytes <= cache.max_bytes
+    first = cache.dump(products[0])
+    assert cache.dump(products[0]) is first
+
+    disabled = ProductJsonCache(max_bytes=0)
+    assert disabled.dump(products[0]) == first
+    assert len(disabled) == 0
+    assert disabled.nbytes == 0
+
+
+async def test_writes_through_the_wrapper_invalidate_entries() -> None:
+    """Update, delete and the batch variants drop the cached JSON of the affected ids."""
+    store, products = await _products(4)
+    cache = ProductJsonCache()
+    repository = JsonCachedProductRepository(store, cache)
+    cache.dump_list(products)
+
+    await repository.update(products[0].id, ProductUpdate(price=2.0))
+    await repository.delete(products[1].id)
+    await repository.update_many([ProductBulkUpdate(id=products[2].id, stock=5)])
+    assert len(cache) == 1
+
+    await repository.delete_many([products[3].id])
+    assert len(cache) == 0
+    assert cache.nbytes == 0
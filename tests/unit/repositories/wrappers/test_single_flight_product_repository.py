@@ -0,0 +1,154 @@
+"""Unit tests for SingleFlightProductRepository."""
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.models.product import ProductCreate, ProductResponse, ProductUpdate
+from src.repositories.in_memory import InMemoryProductRepository
+from src.repositories.wrappers import ForwardingProductRepository, SingleFlightProductRepository
+
+
+class _GatedRepository(ForwardingProductRepository):
+    """Counts get_by_id calls and holds them until the gate opens."""
+
+    def __init__(self) -> None:
+        super().__init__(InMemoryProductRepository())
+        self.calls = 0
+        self.gate = asyncio.Event()
+        self.error: Exception | None = None
+
+    async def get_by_id(self, entity_id: UUID) -> ProductResponse | None:
+        self.calls += 1
+        await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return await super().get_by_id(entity_id)
+
+
+@pytest.fixture
+def backend() -> _GatedRepository:
+    """Backing repository with a gate on get_by_id."""
+    return _GatedRepository()
+
+
+@pytest.fixture
+def repository(backend: _GatedRepository) -> SingleFlightProductRepository:
+    """Single-flight wrapper around the gated repository."""
+    return SingleFlightProductRepository(backend)
+
+
+async def _settle() -> None:
+    """Let the scheduled tasks reach their first await."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+async def test_concurrent_identical_reads_make_one_repository_call(
+    repository: SingleFlightProductRepository, backend: _GatedRepository
+) -> None:
+    """N concurrent callers for the same ID share a single repository call."""
+    product = await backend.create(ProductCreate(name="Flash", price=1.0, stock=1))
+
+    callers = [asyncio.create_task(repository.get_by_id(product.id)) for _ in range(100)]
+    await _settle()
+    backend.gate.set()
+    results = await asyncio.gather(*callers)
+
+    assert backend.calls == 1
+    assert all(result == product for result in results)
+
+
+async def test_different_arguments_are_not_coalesced(
+    repository: SingleFlightProductRepository, backend: _GatedRepository
+) -> None:
+    """Reads for different IDs each go to the repository."""
+    callers = [asyncio.create_task(repository.get_by_id(uuid4())) for _ in range(3)]
+    await _settle()
+    backend.gate.set()
+    await asyncio.gather(*callers)
+
+    assert backend.calls == 3
+
+
+async def test_sequential_reads_are_not_coalesced(
+    repository: SingleFlightProductRepository, backend: _GatedRepository
+) -> None:
+    """Once a flight lands, the next read starts a new one."""
+    backend.gate.set()
+    product_id = uuid4()
+    await repository.get_by_id(product_id)
+    await repository.get_by_id(product_id)
+
+    assert backend.calls == 2
+
+
+async def test_error_is_shared_by_all_callers(
+    repository: SingleFlightProductRepository, backend: _GatedRepository
+) -> None:
+    """Every coalesced caller receives the same exception."""
+    backend.error = RuntimeError("store down")
+    callers = [asyncio.create_task(repository.get_by_id(UUID(int=1))) for _ in range(5)]
+    await _settle()
+    backend.gate.set()
+    results = await asyncio.gather(*callers, return_exceptions=True)
+
+    assert backend.calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_cancelling_a_waiting_caller_does_not_cancel_the_flight(
+    repository: SingleFlightProductRepository, backend: _GatedRepository
+) -> None:
+    """A waiting caller can be cancelled without affecting the shared call."""
+    product = await backend.create(ProductCreate(name="Shielded", price=1.0, stock=1))
+    leader = asyncio.create_task(repository.get_by_id(product.id))
+    waiter = asyncio.create_task(repository.get_by_id(product.id))
+    await _settle()
+
+    waiter.cancel()
+    await _settle()
+    backend.gate.set()
+
+    assert await leader == product
+    assert waiter.cancelled()
+    assert backend.calls == 1
+
+
+async def test_cancelling_the_leader_hands_the_call_over(
+    repository: SingleFlightProductRepository, backend: _GatedRepository
+) -> None:
+    """If the caller running the shared call is cancelled, the waiters still get a result."""
+    product = await backend.create(ProductCreate(name="Handover", price=1.0, stock=1))
+    leader = asyncio.create_task(repository.get_by_id(product.id))
+    waiters = [asyncio.create_task(repository.get_by_id(product.id)) for _ in range(3)]
+    await _settle()
+
+    leader.cancel()
+    await _settle()
+    backend.gate.set()
+
+    assert await asyncio.gather(*waiters) == [product] * 3
+    assert leader.cancelled()
+    assert backend.calls == 2
+
+
+async def test_reads_after_a_write_start_a_new_flight(
+    repository: SingleFlightProductRepository, backend: _GatedRepository
+) -> None:
+    """A read issued after a write does not join a flight that started before it."""
+    product = await backend.create(ProductCreate(name="Before", price=1.0, stock=1))
+    stale_reader = asyncio.create_task(repository.get_by_id(product.id))
+    await _settle()
+
+    await repository.update(product.id, ProductUpdate(stock=7))
+    fresh_reader = asyncio.create_task(repository.get_by_id(product.id))
+    await _settle()
+    backend.gate.set()
+    await stale_reader
+    fresh = await fresh_reader
+
+    assert backend.calls == 2
+    assert fresh is not None
+    assert fresh.stock == 7
@@ -1,13 +1,16 @@
 """Unit tests for ProductService (src.services.product_service)."""
 
+import json
+from collections.abc import AsyncIterator
 from uuid import uuid4
 
 import pytest
 
 from src.core.exceptions import ApplicationServiceError
-from src.models.product import ProductCreate, ProductUpdate
+from src.models.product import ProductBulkUpdate, ProductCreate, ProductQuery, ProductUpdate
 from src.repositories.in_memory import InMemoryProductRepository
 from src.services.product_service import ProductService
+from src.utils.etag import product_etag
 
 
 @pytest.fixture
@@ -118,6 +121,30 @@ async def test_update_product_duplicate_name_raises(service: ProductService) ->
     assert exc_info.value.error_code == "PRODUCT_NAME_ALREADY_EXISTS"
 
 
+@pytest.mark.asyncio
+async def test_update_product_if_match_is_compare_and_swap(service: ProductService) -> None:
+    """Update_product applies an If-Match update once and rejects the stale retry with 412."""
+    created = await service.create_product(ProductCreate(name="Cas", description=None, price=1.0, stock=0))
+    etag = product_etag(created)
+
+    updated = await service.update_product(created.id, ProductUpdate(stock=1), if_match=etag)
+    assert updated.version == created.version + 1
+
+    with pytest.raises(ApplicationServiceError) as exc_info:
+        await service.update_product(created.id, ProductUpdate(stock=2), if_match=etag)
+    assert exc_info.value.status_code == 412
+    assert exc_info.value.error_code == "PRODUCT_VERSION_MISMATCH"
+
+
+@pytest.mark.asyncio
+async def test_update_product_if_match_for_other_resource_raises(service: ProductService) -> None:
+    """Update_product returns 412 when If-Match does not reference the product."""
+    created = await service.create_product(ProductCreate(name="Other", description=None, price=1.0, stock=0))
+    with pytest.raises(ApplicationServiceError) as exc_info:
+        await service.update_product(created.id, ProductUpdate(stock=1), if_match='"something-else"')
+    assert exc_info.value.status_code == 412
+
+
 @pytest.mark.asyncio
 async def test_delete_product_success(service: ProductService) -> None:
     """Delete_product removes the product."""
@@ -134,3 +161,113 @@ async def test_delete_product_not_found_raises(service: ProductService) -> None:
         await service.delete_product(uuid4())
     assert exc_info.value.status_code == 404
     assert exc_info.value.error_code == "PRODUCT_NOT_FOUND"
+
+
+@pytest.mark.asyncio
+async def test_get_products_page_invalid_cursor_raises(service: ProductService) -> None:
+    """Get_products_page raises 400 INVALID_CURSOR for malformed cursors."""
+    with pytest.raises(ApplicationServiceError) as exc_info:
+        await service.get_products_page(after="@@@", limit=10)
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.error_code == "INVALID_CURSOR"
+
+
+@pytest.mark.asyncio
+async def test_get_products_page_applies_filters_and_rejects_skip(service: ProductService) -> None:
+    """Get_products_page filters and sorts with cursors and rejects offset pagination with filters."""
+    for index, price in enumerate([5.0, 1.0, 9.0, 3.0]):
+        await service.create_product(ProductCreate(name=f"Filtered {index}", price=price, stock=index))
+
+    page = await service.get_products_page(limit=2, query=ProductQuery(in_stock=True, sort="-price"))
+    assert [product.price for product in page.items] == [9.0, 3.0]
+    following = await service.get_products_page(
+        after=page.next_cursor, limit=2, query=ProductQuery(in_stock=True, sort="-price")
+    )
+    assert [product.price for product in following.items] == [1.0]
+    assert following.next_cursor is None
+
+    with pytest.raises(ApplicationServiceError) as exc_info:
+        await service.get_products_page(skip=1, query=ProductQuery(price_min=2.0))
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.error_code == "INVALID_PAGINATION"
+
+    with pytest.raises(ApplicationServiceError) as exc_info:
+        await service.get_products_page(after=page.next_cursor, query=ProductQuery(sort="price"))
+    assert exc_info.value.error_code == "INVALID_CURSOR"
+
+
+@pytest.mark.asyncio
+async def test_count_products_counts_matching_products(service: ProductService) -> None:
+    """Count_products applies the same filters as the filtered listing."""
+    for index, price in enumerate([5.0, 1.0, 9.0, 3.0]):
+        await service.create_product(ProductCreate(name=f"Counted {index}", price=price, stock=index))
+
+    assert await service.count_products(ProductQuery()) == 4
+    assert await service.count_products(ProductQuery(price_min=3.0, price_max=9.0)) == 3
+    assert await service.count_products(ProductQuery(in_stock=True, price_max=4.0, sort="-price")) == 2
+
+
+@pytest.mark.asyncio
+async def test_create_products_returns_per_item_results(service: ProductService) -> None:
+    """Create_products maps repository outcomes to per-item status codes."""
+    results = await service.create_products(
+        [
+            ProductCreate(name="Bulk", description=None, price=1.0, stock=0),
+            ProductCreate(name="bulk", description=None, price=1.0, stock=0),
+        ]
+    )
+    assert [r.status_code for r in results] == [201, 409]
+    assert results[0].product is not None
+    assert results[1].error_code == "PRODUCT_NAME_ALREADY_EXISTS"
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_products_not_found(service: ProductService) -> None:
+    """Update_products and delete_products report 404 per missing item."""
+    missing = uuid4()
+    updated = await service.update_products([ProductBulkUpdate(id=missing, price=2.0)])
+    deleted = await service.delete_products([missing])
+    assert updated[0].status_code == 404
+    assert deleted[0].status_code == 404
+    assert deleted[0].error_code == "PRODUCT_NOT_FOUND"
+
+
+@pytest.mark.asyncio
+async def test_export_products_yields_ndjson(service: ProductService) -> None:
+    """Export_products yields one JSON document per line, in batches."""
+    for name in ("E1", "E2", "E3"):
+        await service.create_product(ProductCreate(name=name, description=None, price=1.0, stock=0))
+    chunks = [chunk async for chunk in service.export_products(batch_size=2)]
+    assert len(chunks) == 2
+    lines = b"".join(chunks).splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["E1", "E2", "E3"]
+
+
+@pytest.mark.asyncio
+async def test_import_products_reports_progress_and_errors(service: ProductService) -> None:
+    """Import_products creates valid rows in chunks and reports per-line errors."""
+
+    async def body() -> AsyncIterator[bytes]:
+        yield b'{"name": "I1", "price": 1.0}\n{"name": "I2", "price": 1.0}\n'
+        yield b'{"name": "i1", "price": 1.0}\n{"name": "Bad"}\n{"name": "I3", "price": 1.0}\n'
+
+    output = b"".join([chunk async for chunk in service.import_products(body(), chunk_size=2)])
+    events = [json.loads(line) for line in output.splitlines()]
+    errors = {event["line"]: event["error_code"] for event in events if event["event"] == "error"}
+    assert errors == {3: "PRODUCT_NAME_ALREADY_EXISTS", 4: "VALIDATION_ERROR"}
+    assert any(event["event"] == "progress" for event in events)
+    assert events[-1] == {"event": "summary", "processed": 5, "created": 3, "failed": 2}
+
+
+@pytest.mark.asyncio
+async def test_import_products_flushes_errors_without_valid_rows(service: ProductService) -> None:
+    """A feed of invalid rows still yields error events every chunk_size lines."""
+
+    async def body() -> AsyncIterator[bytes]:
+        for _ in range(6):
+            yield b'{"name": "NoPrice"}\n'
+
+    chunks = [chunk async for chunk in service.import_products(body(), chunk_size=2)]
+    assert len(chunks) == 4  # 3 blocos de progresso + resumo
+    first_block = [json.loads(line) for line in chunks[0].splitlines()]
+    assert [event["event"] for event in first_block] == ["error", "error", "progress"]
@@ -0,0 +1,15 @@
+"""Unit tests for the server entrypoint (src.server)."""
+
+import socket
+
+from src.server import _SharedSocketConfig
+
+
+def test_shared_socket_enables_tcp_nodelay() -> None:
+    """The socket shared by the workers has TCP_NODELAY, inherited by accepted connections."""
+    config = _SharedSocketConfig("src.main:app", host="127.0.0.1", port=0, workers=2)
+    sock = config.bind_socket()
+    try:
+        assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) != 0
+    finally:
+        sock.close()
@@ -0,0 +1,38 @@
+"""Unit tests for pagination cursors (src.utils.cursor)."""
+
+import pytest
+
+from src.core.exceptions import InvalidCursorError
+from src.utils.cursor import decode_cursor, decode_sort_cursor, encode_cursor, encode_sort_cursor
+
+
+def test_sort_cursor_round_trips_value_and_position() -> None:
+    """Decode the exact value and position encoded for the same sort field."""
+    cursor = encode_sort_cursor("-price", 0.1 + 0.2, 42)
+    assert decode_sort_cursor(cursor, "-price") == (0.1 + 0.2, 42)
+    assert decode_sort_cursor(encode_sort_cursor("created_at", 1_700_000_000_123_456, 7), "created_at") == (
+        1_700_000_000_123_456,
+        7,
+    )
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        encode_sort_cursor("price", 1.0, 1),
+        encode_cursor(3),
+        encode_sort_cursor("-stock", float("nan"), 1),
+        encode_sort_cursor("-stock", 1.0, -1),
+        "garbage",
+    ],
+)
+def test_sort_cursor_rejects_other_listings_and_malformed_values(cursor: str) -> None:
+    """Reject cursors of another sort field, unsorted cursors and malformed values."""
+    with pytest.raises(InvalidCursorError):
+        decode_sort_cursor(cursor, "-stock")
+
+
+def test_plain_cursor_rejects_sort_cursor() -> None:
+    """Reject a sorted-listing cursor where an insertion-order cursor is expected."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_sort_cursor("price", 1.0, 1))
@@ -0,0 +1,61 @@
+"""Unit tests for ETag helpers (src.utils.etag)."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from src.models.product import ProductResponse
+from src.utils.etag import catalog_etag, if_match_version, if_none_match_matches, product_etag
+
+
+def _product(**overrides: object) -> ProductResponse:
+    data: dict = {
+        "id": uuid4(),
+        "name": "Etag",
+        "price": 1.0,
+        "stock": 1,
+        "created_at": datetime(2024, 1, 1, tzinfo=UTC),
+        "updated_at": None,
+    }
+    data.update(overrides)
+    return ProductResponse(**data)
+
+
+def test_product_etag_changes_when_product_changes() -> None:
+    """The product ETag is stable and changes with the record version."""
+    product = _product()
+    assert product_etag(product) == product_etag(product)
+    assert product_etag(product).startswith('"') and product_etag(product).endswith('"')
+
+    updated = product.model_copy(update={"version": product.version + 1})
+    assert product_etag(updated) != product_etag(product)
+
+
+def test_catalog_etag_depends_only_on_version() -> None:
+    """The collection ETag is derived from the catalog version."""
+    assert catalog_etag("abc-1") == catalog_etag("abc-1")
+    assert catalog_etag("abc-1") != catalog_etag("abc-2")
+
+
+def test_if_none_match_matching_rules() -> None:
+    """If-None-Match supports lists, "*" and weak validators."""
+    etag = '"v1"'
+    assert not if_none_match_matches(None, etag)
+    assert not if_none_match_matches('"v0"', etag)
+    assert if_none_match_matches('"v1"', etag)
+    assert if_none_match_matches('"v0", W/"v1"', etag)
+    assert if_none_match_matches("*", etag)
+
+
+def test_if_match_version_parses_product_etag() -> None:
+    """If-Match yields the version of the product ETag, None for "*" and rejects others."""
+    product = _product(version=7)
+    assert if_match_version(product_etag(product), product.id) == 7
+    assert if_match_version(f'"other", {product_etag(product)}', product.id) == 7
+    assert if_match_version("*", product.id) is None
+
+    with pytest.raises(ValueError, match="If-Match"):
+        if_match_version(f"W/{product_etag(product)}", product.id)
+    with pytest.raises(ValueError, match="If-Match"):
+        if_match_version(product_etag(_product()), product.id)
@@ -0,0 +1,84 @@
+"""Unit tests for the queue-backed log sink (src.utils.log_queue)."""
+
+import logging
+import threading
+
+from src.utils.log_queue import QueueLogSink
+
+
+class _GatedHandler(logging.Handler):
+    """Handler that only writes after the gate is opened (simulates a slow stream)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = threading.Event()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.gate.wait(timeout=5)
+        self.messages.append(record.getMessage())
+
+
+def _make_logger(sink: QueueLogSink, name: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.handlers = [sink.handler]
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+def test_records_are_written_by_the_background_thread() -> None:
+    """Records are written by the writer thread and flushed on stop."""
+    target = _GatedHandler()
+    target.gate.set()
+    sink = QueueLogSink(target, maxsize=100)
+    sink.start()
+    logger = _make_logger(sink, "test.log_queue.write")
+
+    for i in range(10):
+        logger.info("event %d", i)
+    sink.stop()
+
+    assert target.messages == [f"event {i}" for i in range(10)]
+    stats = sink.stats()
+    assert stats.queued == 10
+    assert stats.dropped == 0
+    assert stats.pending == 0
+
+
+def test_drop_policy_never_blocks_and_counts_dropped_records() -> None:
+    """With a full queue and the "drop" policy, the caller returns immediately."""
+    target = _GatedHandler()
+    sink = QueueLogSink(target, maxsize=2, overflow="drop")
+    logger = _make_logger(sink, "test.log_queue.drop")
+
+    # Sem thread escritora ativa, a fila enche após 2 registros.
+    for i in range(5):
+        logger.info("event %d", i)
+
+    stats = sink.stats()
+    assert stats.queued == 2
+    assert stats.dropped == 3
+    assert stats.pending == 2
+
+    target.gate.set()
+    sink.start()
+    sink.stop()
+    assert target.messages == ["event 0", "event 1"]
+
+
+def test_block_policy_keeps_every_record() -> None:
+    """With the "block" policy the caller waits for room and nothing is lost."""
+    target = _GatedHandler()
+    sink = QueueLogSink(target, maxsize=1, overflow="block")
+    sink.start()
+    logger = _make_logger(sink, "test.log_queue.block")
+
+    producer = threading.Thread(target=lambda: [logger.info("event %d", i) for i in range(5)])
+    producer.start()
+    target.gate.set()
+    producer.join(timeout=5)
+    sink.stop()
+
+    assert target.messages == [f"event {i}" for i in range(5)]
+    assert sink.stats().dropped == 0
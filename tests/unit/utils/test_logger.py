@@ -0,0 +1,32 @@
+"""Unit tests for SimpleLogger level gating (src.utils.logger)."""
+
+import logging
+from unittest.mock import MagicMock
+
+from src.utils.logger import SimpleLogger
+
+
+def test_disabled_levels_do_not_reach_structlog() -> None:
+    """Below the configured level, nothing is forwarded to the bound logger."""
+    bound = MagicMock()
+    logger = SimpleLogger(bound, logging.WARNING)
+
+    logger.debug("Fetching product", product_id="1")
+    logger.info("Product created", product_id="1")
+
+    bound.debug.assert_not_called()
+    bound.info.assert_not_called()
+
+
+def test_enabled_levels_are_forwarded() -> None:
+    """At or above the configured level, calls are forwarded with their kwargs."""
+    bound = MagicMock()
+    logger = SimpleLogger(bound, logging.INFO)
+
+    logger.info("Product created", product_id="1")
+    logger.warning("Slow request", duration_ms=900)
+    logger.error("Failed", error_code="E001")
+
+    bound.info.assert_called_once_with("Product created", product_id="1")
+    bound.warning.assert_called_once_with("Slow request", duration_ms=900)
+    bound.error.assert_called_once_with("Failed", error_code="E001", exc_info=True)
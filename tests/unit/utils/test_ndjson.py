@@ -0,0 +1,28 @@
+"""Unit tests for NDJSON line splitting (src.utils.ndjson)."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from src.utils.ndjson import LineTooLongError, iter_ndjson_lines
+
+
+async def _stream(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_iter_ndjson_lines_joins_split_chunks() -> None:
+    """Lines split across chunks are reassembled; blank lines are skipped but counted."""
+    lines = [item async for item in iter_ndjson_lines(_stream(b'{"a":', b"1}\r\n\n", b'{"b":2}'))]
+    assert lines == [(1, b'{"a":1}'), (3, b'{"b":2}')]
+
+
+@pytest.mark.asyncio
+async def test_iter_ndjson_lines_rejects_oversized_line() -> None:
+    """A line longer than the limit raises LineTooLongError without buffering the rest."""
+    with pytest.raises(LineTooLongError) as exc_info:
+        async for _ in iter_ndjson_lines(_stream(b"ok\n", b"x" * 20), max_line_bytes=10):
+            pass
+    assert exc_info.value.line_number == 2
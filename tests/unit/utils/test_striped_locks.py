@@ -0,0 +1,41 @@
+"""Unit tests for striped async locks (src.utils.striped_locks)."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.utils.striped_locks import StripedLocks
+
+
+def test_same_key_maps_to_same_lock() -> None:
+    """A key always maps to the same lock and keys spread over the stripes."""
+    locks = StripedLocks(8)
+    key = uuid4()
+    assert locks.lock_for(key) is locks.lock_for(key)
+    assert len({id(locks.lock_for(uuid4())) for _ in range(200)}) == len(locks)
+
+
+def test_stripes_must_be_positive() -> None:
+    """Zero stripes is rejected."""
+    with pytest.raises(ValueError, match="stripes"):
+        StripedLocks(0)
+
+
+async def test_same_key_serializes_critical_sections() -> None:
+    """Critical sections on the same key never overlap, even when they suspend."""
+    locks = StripedLocks(4)
+    key = uuid4()
+    inside = 0
+    max_inside = 0
+
+    async def critical() -> None:
+        nonlocal inside, max_inside
+        async with locks.lock_for(key):
+            inside += 1
+            max_inside = max(max_inside, inside)
+            await asyncio.sleep(0)
+            inside -= 1
+
+    await asyncio.gather(*(critical() for _ in range(50)))
+    assert max_inside == 1
@@ -0,0 +1,17 @@
+"""Unit tests for timestamp helpers (src.utils.timestamps)."""
+
+from datetime import UTC, datetime, timedelta, timezone
+
+from src.utils.timestamps import from_micros, to_micros
+
+
+def test_micros_round_trip_is_exact_and_returns_utc() -> None:
+    """Convert an aware datetime to microseconds and back without losing precision."""
+    value = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=timezone(timedelta(hours=-3)))
+
+    micros = to_micros(value)
+
+    assert from_micros(micros) == value
+    assert from_micros(micros).tzinfo is UTC
+    assert to_micros(datetime(1970, 1, 1, tzinfo=UTC)) == 0
+    assert from_micros(-1) == datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=UTC)